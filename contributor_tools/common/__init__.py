@@ -36,6 +36,7 @@ from .stride_segmentation import (
 )
 
 from .config_manager import ValidationConfigManager
+from .stride_mask import StrideMask
 
 from .derivatives import (
     find_discontinuity_index,
@@ -53,6 +54,12 @@ from .force_plate import (
     resample_to_phase,
 )
 
+from .parquet_io import (
+    LABEL_COLUMNS,
+    encode_label_columns,
+    write_dataset_parquet,
+)
+
 # Submodules available as contributor_tools.common.validation and contributor_tools.common.plotting
 from . import validation
 from . import plotting
@@ -80,6 +87,8 @@ __all__ = [
     "remove_transition_segments",
     # config_manager
     "ValidationConfigManager",
+    # stride_mask
+    "StrideMask",
     # derivatives
     "find_discontinuity_index",
     "interpolate_discontinuity",
@@ -92,6 +101,10 @@ __all__ = [
     "assign_force_plates_to_legs",
     "process_force_plate_data",
     "resample_to_phase",
+    # parquet_io
+    "LABEL_COLUMNS",
+    "encode_label_columns",
+    "write_dataset_parquet",
     # submodules
     "validation",
     "plotting",
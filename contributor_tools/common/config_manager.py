@@ -7,6 +7,8 @@ Stores ipsilateral and contralateral ranges exactly as defined in YAML.
 """
 
 import copy
+import hashlib
+import json
 import yaml
 from pathlib import Path
 from typing import Dict, Optional, Any, Tuple, List
@@ -32,6 +34,9 @@ class ValidationConfigManager:
         }
         # Track legacy GRF variable names seen during load for user warnings
         self._legacy_grf_seen: set[str] = set()
+        # Bumped on every range change; keys the cached ranges fingerprint
+        self._revision = 0
+        self._fingerprint: Optional[Tuple[int, str]] = None
         
         # Default config directory
         project_root = Path(__file__).parent.parent.parent
@@ -72,6 +77,7 @@ class ValidationConfigManager:
         self._data.clear()
         self._metadata.clear()
         self._legacy_grf_seen.clear()
+        self._mark_changed()
         
         # Extract metadata (everything except 'tasks')
         for key, value in config.items():
@@ -264,6 +270,7 @@ class ValidationConfigManager:
         range_entry = phase_entry.setdefault(variable, {})
         range_entry['min'] = min_val
         range_entry['max'] = max_val
+        self._mark_changed()
     
     def get_tasks(self) -> List[str]:
         """
@@ -325,6 +332,7 @@ class ValidationConfigManager:
     def clear(self) -> None:
         """Clear all validation data (but keep metadata)."""
         self._data.clear()
+        self._mark_changed()
     
     def set_metadata(self, key: str, value: Any) -> None:
         """
@@ -406,6 +414,28 @@ class ValidationConfigManager:
                 'metadata': metadata,
                 'phases': explicit
             }
+        self._mark_changed()
+    
+    def _mark_changed(self) -> None:
+        """Record that the stored ranges changed."""
+        self._revision += 1
+    
+    def ranges_fingerprint(self) -> str:
+        """
+        Return a content hash of the stored validation ranges.
+        
+        The hash is recomputed only after the ranges change, so it is a cheap
+        key for caches derived from the configuration (e.g. validation plans).
+        Managers holding identical ranges share the same fingerprint.
+        
+        Returns:
+            Hex digest of the per-task phase ranges
+        """
+        if self._fingerprint is None or self._fingerprint[0] != self._revision:
+            ranges = {task: info.get('phases', {}) for task, info in self._data.items()}
+            payload = json.dumps(ranges, sort_keys=True, default=str)
+            self._fingerprint = (self._revision, hashlib.sha1(payload.encode()).hexdigest())
+        return self._fingerprint[1]
     
     def get_data(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -17,6 +17,8 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
+from contributor_tools.common.validation import Validator
+
 
 @dataclass
 class PhaseStats:
@@ -216,7 +218,8 @@ def identify_marginal_failures(
     clean_stats: Dict[str, Dict[int, PhaseStats]],
     max_phases_failed: int = 2,
     max_zscore: float = 2.5,
-    n_phases: int = 150
+    n_phases: int = 150,
+    phase_table: Optional[List[Any]] = None
 ) -> Tuple[List[MarginalFailure], Dict[str, Dict[int, BoundSuggestion]]]:
     """
     Identify strides that barely fail validation.
@@ -234,6 +237,8 @@ def identify_marginal_failures(
         max_phases_failed: Maximum phases a stride can fail to be marginal
         max_zscore: Maximum z-score for a violation to be marginal
         n_phases: Phases per stride
+        phase_table: Validator per-(phase, variable) violation table of the
+            task (PhaseViolationStats rows); computed from df if not given
 
     Returns:
         Tuple of (list of MarginalFailure, dict of BoundSuggestion by feature/phase)
@@ -249,8 +254,10 @@ def identify_marginal_failures(
     if not task_ranges:
         return [], {}
 
-    data_3d = task_df[features].values.reshape(n_strides, n_phases, len(features))
-    feature_to_idx = {f: i for i, f in enumerate(features)}
+    if phase_table is None:
+        data_3d = task_df[features].values.reshape(n_strides, n_phases, len(features))
+        validator = Validator(config_manager=config_manager)
+        phase_table = validator.phase_violation_stats_for_cycles(task, data_3d, list(features))
 
     # Track violations per stride
     stride_violations: Dict[int, List[MarginalViolation]] = {i: [] for i in range(n_strides)}
@@ -258,87 +265,51 @@ def identify_marginal_failures(
     # Track suggestions by feature/phase
     suggestions: Dict[str, Dict[int, Dict[str, List]]] = {}  # feature -> phase -> direction -> [values, zscores, indices]
 
-    for phase_pct, phase_ranges in task_ranges.items():
-        phase_pct = int(phase_pct)
-        # Convert percentage (0-100) to data index (0 to n_phases-1)
-        phase_idx = round(phase_pct / 100 * (n_phases - 1))
+    for row in phase_table:
+        var_name = row.variable
+        phase_pct = row.phase
+        if var_name not in clean_stats or phase_pct not in clean_stats[var_name]:
+            continue
 
-        for var_name, var_range in phase_ranges.items():
-            if var_name not in feature_to_idx:
-                continue
-            if var_name not in clean_stats or phase_pct not in clean_stats[var_name]:
-                continue
+        phase_stat = clean_stats[var_name][phase_pct]
+        range_size = abs(phase_stat.bound_max - phase_stat.bound_min)
 
-            var_idx = feature_to_idx[var_name]
-            min_val = var_range.get('min')
-            max_val = var_range.get('max')
-            if min_val is None or max_val is None:
+        for direction, bound, indices, values in (
+            ('min', row.min, row.below_strides, row.below_values),
+            ('max', row.max, row.above_strides, row.above_values),
+        ):
+            if len(indices) == 0:
                 continue
 
-            phase_stat = clean_stats[var_name][phase_pct]
-            values = data_3d[:, phase_idx, var_idx]
-
-            for stride_idx in range(n_strides):
-                val = values[stride_idx]
-                if not np.isfinite(val):
-                    continue
-
-                # Check for violation
-                if val < min_val:
-                    deficit = min_val - val
-                    # Use minimum std based on the deficit to avoid huge z-scores for tight bounds
-                    # If bounds are very tight (e.g., "must be zero"), use deficit as basis
-                    range_size = abs(phase_stat.bound_max - phase_stat.bound_min)
-                    min_std = max(abs(deficit) * 0.5, range_size * 0.1, 1e-4)
-                    effective_std = max(phase_stat.std, min_std)
-                    zscore = abs(val - phase_stat.mean) / effective_std
-
-                    violation = MarginalViolation(
-                        phase=phase_pct,
-                        direction='under',
-                        actual_value=val,
-                        bound=min_val,
-                        zscore=zscore,
-                        deficit_or_excess=deficit
-                    )
-                    stride_violations[stride_idx].append(violation)
-
-                    # Track for suggestion
-                    if var_name not in suggestions:
-                        suggestions[var_name] = {}
-                    if phase_pct not in suggestions[var_name]:
-                        suggestions[var_name][phase_pct] = {'min': {'values': [], 'zscores': [], 'indices': []},
-                                                            'max': {'values': [], 'zscores': [], 'indices': []}}
-                    suggestions[var_name][phase_pct]['min']['values'].append(val)
-                    suggestions[var_name][phase_pct]['min']['zscores'].append(zscore)
-                    suggestions[var_name][phase_pct]['min']['indices'].append(stride_idx)
-
-                elif val > max_val:
-                    excess = val - max_val
-                    # Use minimum std based on the excess to avoid huge z-scores for tight bounds
-                    range_size = abs(phase_stat.bound_max - phase_stat.bound_min)
-                    min_std = max(abs(excess) * 0.5, range_size * 0.1, 1e-4)
-                    effective_std = max(phase_stat.std, min_std)
-                    zscore = abs(val - phase_stat.mean) / effective_std
-
-                    violation = MarginalViolation(
-                        phase=phase_pct,
-                        direction='over',
-                        actual_value=val,
-                        bound=max_val,
-                        zscore=zscore,
-                        deficit_or_excess=excess
-                    )
-                    stride_violations[stride_idx].append(violation)
-
-                    if var_name not in suggestions:
-                        suggestions[var_name] = {}
-                    if phase_pct not in suggestions[var_name]:
-                        suggestions[var_name][phase_pct] = {'min': {'values': [], 'zscores': [], 'indices': []},
-                                                            'max': {'values': [], 'zscores': [], 'indices': []}}
-                    suggestions[var_name][phase_pct]['max']['values'].append(val)
-                    suggestions[var_name][phase_pct]['max']['zscores'].append(zscore)
-                    suggestions[var_name][phase_pct]['max']['indices'].append(stride_idx)
+            deficit_or_excess = bound - values if direction == 'min' else values - bound
+            # Use minimum std based on the deficit/excess to avoid huge z-scores for
+            # tight bounds; if bounds are very tight (e.g., "must be zero"), use it as basis
+            min_std = np.maximum(np.abs(deficit_or_excess) * 0.5, max(range_size * 0.1, 1e-4))
+            effective_std = np.maximum(phase_stat.std, min_std)
+            zscores = np.abs(values - phase_stat.mean) / effective_std
+
+            for stride_idx, val, zscore, amount in zip(
+                indices.tolist(), values.tolist(), zscores.tolist(), deficit_or_excess.tolist()
+            ):
+                stride_violations[stride_idx].append(MarginalViolation(
+                    phase=phase_pct,
+                    direction='under' if direction == 'min' else 'over',
+                    actual_value=val,
+                    bound=bound,
+                    zscore=zscore,
+                    deficit_or_excess=amount
+                ))
+
+            # Track for suggestion
+            if var_name not in suggestions:
+                suggestions[var_name] = {}
+            if phase_pct not in suggestions[var_name]:
+                suggestions[var_name][phase_pct] = {'min': {'values': [], 'zscores': [], 'indices': []},
+                                                    'max': {'values': [], 'zscores': [], 'indices': []}}
+            entry = suggestions[var_name][phase_pct][direction]
+            entry['values'].extend(values.tolist())
+            entry['zscores'].extend(zscores.tolist())
+            entry['indices'].extend(indices.tolist())
 
     # Filter to marginal failures
     marginal_failures = []
@@ -0,0 +1,43 @@
+"""Parquet output helpers shared by the dataset converters.
+
+Converters repeat the subject/task labels on every one of the 150 rows of a
+stride.  Writing those columns as pandas categoricals stores them as Arrow
+dictionary arrays, so the files shrink and ``LocomotionData`` reads them back
+as categoricals without re-encoding the strings.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Union
+
+import pandas as pd
+
+LABEL_COLUMNS = ("subject", "task", "task_id", "task_info")
+
+
+def encode_label_columns(df: pd.DataFrame,
+                         columns: Iterable[str] = LABEL_COLUMNS) -> pd.DataFrame:
+    """Return *df* with the label columns present converted to categoricals.
+
+    Args:
+        df: Converted dataset (time- or phase-indexed)
+        columns: Label columns to encode; missing ones are skipped
+
+    Returns:
+        DataFrame with the same rows and columns
+    """
+    dtypes = {
+        col: "category"
+        for col in columns
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
+    if not dtypes:
+        return df
+    return df.astype(dtypes)
+
+
+def write_dataset_parquet(df: pd.DataFrame, output_path: Union[str, Path],
+                          index: bool = False) -> None:
+    """Write a converted dataset with dictionary-encoded label columns."""
+    encode_label_columns(df).to_parquet(output_path, index=index)
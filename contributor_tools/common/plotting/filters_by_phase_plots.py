@@ -27,6 +27,7 @@ sys.path.insert(0, str(repo_root))
 
 # Import feature definitions from user library
 from locohub.feature_constants import get_sagittal_features, get_task_classification
+from contributor_tools.common.stride_mask import StrideMask
 
 # Removed: validate_task_completeness (no longer needed in unified system)
 
@@ -353,13 +354,39 @@ def create_single_feature_plot(
     return str(output_path)
 
 
+def _failure_masks(failing_features, n_strides: int) -> Tuple[StrideMask, StrideMask, bool]:
+    """
+    Normalize the accepted failure formats to (biomechanical, velocity) masks.
+
+    Returns:
+        (biomechanical mask, velocity mask, whether velocity failures were
+        given separately), both masks resized to ``n_strides``
+    """
+    if isinstance(failing_features, StrideMask):
+        return failing_features.resize(n_strides), StrideMask([], n_strides), False
+    if not failing_features:
+        return StrideMask([], n_strides), StrideMask([], n_strides), False
+    if isinstance(failing_features.get('biomechanical'), StrideMask):
+        return (failing_features['biomechanical'].resize(n_strides),
+                failing_features['velocity'].resize(n_strides), True)
+
+    sample_value = next(iter(failing_features.values()))
+    if isinstance(sample_value, dict) and 'biomechanical' in sample_value and 'velocity' in sample_value:
+        biomech = {idx: types.get('biomechanical', []) for idx, types in failing_features.items()}
+        velocity = {idx: types.get('velocity', []) for idx, types in failing_features.items()}
+        return (StrideMask.from_failing_features(biomech, n_strides),
+                StrideMask.from_failing_features(velocity, n_strides), True)
+    # Legacy format - all failures are biomechanical (red)
+    return StrideMask.from_failing_features(failing_features, n_strides), StrideMask([], n_strides), False
+
+
 def create_task_combined_plot(
     validation_data: Dict,
     task_name: str,
     output_dir: str,
     data_3d: Optional[np.ndarray] = None,
     feature_names: Optional[List[str]] = None,
-    failing_features: Optional[Dict] = None,  # Can be legacy or merged format
+    failing_features=None,  # StrideMask, merged masks, or legacy/merged dicts
     dataset_name: Optional[str] = None,
     timestamp: Optional[str] = None,
     comparison_mode: bool = False,
@@ -376,7 +403,9 @@ def create_task_combined_plot(
         output_dir: Directory to save the plot
         data_3d: Optional numpy array with shape (num_strides, 150, num_features)
         feature_names: List of feature names corresponding to data_3d columns
-        failing_features: Dict mapping stride indices to lists of failed variable names
+        failing_features: Failing strides as a StrideMask, a
+            ``{'biomechanical': mask, 'velocity': mask}`` dict (three-color
+            mode), or the legacy ``{stride: [names]}`` / merged dict formats
         dataset_name: Optional dataset name to display
         timestamp: Optional timestamp to display
         comparison_mode: If True, generate single-column comparison plot (passing strides only)
@@ -437,12 +466,15 @@ def create_task_combined_plot(
     n_features_validated = len(available_feature_names)
     n_features_total = len(sagittal_features)
     
-    # Count passing strides
-    passing_strides = 0
-    if total_strides > 0:
-        for stride_idx in range(total_strides):
-            if stride_idx not in failing_features:
-                passing_strides += 1
+    # Stride classification for the three-color system
+    biomech_mask, velocity_mask, is_merged_format = _failure_masks(failing_features, total_strides)
+    biomechanical_failed = biomech_mask.failed()
+    velocity_only_failed = velocity_mask.failed() & ~biomechanical_failed
+    global_failed = biomechanical_failed | velocity_only_failed
+    n_biomechanical_failed = int(biomechanical_failed.sum())
+    n_velocity_only_failed = int(velocity_only_failed.sum())
+    
+    passing_strides = total_strides - int(global_failed.sum())
     
     pass_rate = (passing_strides / total_strides * 100) if total_strides > 0 else 0
     
@@ -460,56 +492,17 @@ def create_task_combined_plot(
     if timestamp:
         title += f' | Generated: {timestamp}'
     
-    # Handle failing features and detect format first
-    if failing_features is None:
-        failing_features = {}
-    
-    # Detect format: merged or legacy
-    is_merged_format = False
-    if failing_features:
-        sample_value = next(iter(failing_features.values()))
-        if isinstance(sample_value, dict) and 'biomechanical' in sample_value and 'velocity' in sample_value:
-            is_merged_format = True
-    
-    # Build stride classification sets for three-color system
-    if is_merged_format:
-        # New three-color system
-        biomechanical_failed_strides = set()
-        velocity_only_failed_strides = set()
-        global_failed_strides = set()
-        
-        for stride_idx, failure_types in failing_features.items():
-            biomech_failures = failure_types.get('biomechanical', [])
-            velocity_failures = failure_types.get('velocity', [])
-            
-            if biomech_failures:
-                biomechanical_failed_strides.add(stride_idx)
-                global_failed_strides.add(stride_idx)
-            elif velocity_failures:
-                velocity_only_failed_strides.add(stride_idx)
-                global_failed_strides.add(stride_idx)
-    else:
-        # Legacy format - all failures are red
-        global_failed_strides = set()
-        biomechanical_failed_strides = set()
-        velocity_only_failed_strides = set()
-        
-        for stride_idx, failed_vars in failing_features.items():
-            if failed_vars:  # If any variable failed
-                global_failed_strides.add(stride_idx)
-                biomechanical_failed_strides.add(stride_idx)  # Treat all as biomechanical in legacy mode
-    
     # Add statistics line
     if not comparison_mode:
         title += f'\n{total_strides} strides | {n_features_validated}/{n_features_total} features validated | {passing_strides} passing ({pass_rate:.1f}%)'
         
         # Add three-color legend in merged format
-        if is_merged_format and (len(biomechanical_failed_strides) > 0 or len(velocity_only_failed_strides) > 0):
+        if is_merged_format and (n_biomechanical_failed > 0 or n_velocity_only_failed > 0):
             legend_parts = ['Green: Pass']
-            if len(biomechanical_failed_strides) > 0:
-                legend_parts.append(f'Red: Biomech Fail ({len(biomechanical_failed_strides)})')
-            if len(velocity_only_failed_strides) > 0:
-                legend_parts.append(f'Blue: Velocity Fail ({len(velocity_only_failed_strides)})')
+            if n_biomechanical_failed > 0:
+                legend_parts.append(f'Red: Biomech Fail ({n_biomechanical_failed})')
+            if n_velocity_only_failed > 0:
+                legend_parts.append(f'Blue: Velocity Fail ({n_velocity_only_failed})')
             title += f'\nLegend: {" | ".join(legend_parts)}'
     
     fig.suptitle(title, fontsize=12, fontweight='bold')
@@ -545,32 +538,10 @@ def create_task_combined_plot(
         else:
             var_idx = None
         
-        # Build variable-specific failed strides for three-color system
-        if is_merged_format:
-            variable_biomech_failed_strides = set()
-            variable_velocity_failed_strides = set()
-            
-            for stride_idx, failure_types in failing_features.items():
-                biomech_failures = failure_types.get('biomechanical', [])
-                velocity_failures = failure_types.get('velocity', [])
-                
-                if var_name in biomech_failures:
-                    variable_biomech_failed_strides.add(stride_idx)
-                elif var_name in velocity_failures:
-                    variable_velocity_failed_strides.add(stride_idx)
-            
-            # For backward compatibility, also create combined set
-            variable_failed_strides = variable_biomech_failed_strides | variable_velocity_failed_strides
-        else:
-            # Legacy format
-            variable_failed_strides = set()
-            variable_biomech_failed_strides = set()
-            variable_velocity_failed_strides = set()
-            
-            for stride_idx, failed_vars in failing_features.items():
-                if var_name in failed_vars:
-                    variable_failed_strides.add(stride_idx)
-                    variable_biomech_failed_strides.add(stride_idx)  # Treat all as biomechanical
+        # Variable-specific failed strides; biomechanical failures take precedence
+        variable_biomech_failed = biomech_mask.column(var_name)
+        variable_velocity_failed = velocity_mask.column(var_name) & ~variable_biomech_failed
+        variable_failed = variable_biomech_failed | variable_velocity_failed
         
         # Get validation ranges for this variable
         var_ranges = {}
@@ -634,34 +605,19 @@ def create_task_combined_plot(
             phase_ipsi = np.linspace(0, 100, 150)
             
             if show_local_passing:
-                # Build variable-specific failed strides
-                variable_failed_strides = set()
-                if is_merged_format:
-                    for stride_idx, failure_types in failing_features.items():
-                        biomech_failures = failure_types.get('biomechanical', [])
-                        velocity_failures = failure_types.get('velocity', [])
-                        if var_name in biomech_failures or var_name in velocity_failures:
-                            variable_failed_strides.add(stride_idx)
-                else:
-                    for stride_idx, failed_vars in failing_features.items():
-                        if var_name in failed_vars:
-                            variable_failed_strides.add(stride_idx)
-                
                 # Separate globally passing from locally passing
-                global_passing_indices = [stride_idx for stride_idx in range(data_3d.shape[0]) 
-                                        if stride_idx not in global_failed_strides]
-                local_passing_indices = [stride_idx for stride_idx in range(data_3d.shape[0])
-                                       if stride_idx not in variable_failed_strides and stride_idx in global_failed_strides]
+                global_passing_indices = np.flatnonzero(~global_failed)
+                local_passing_indices = np.flatnonzero(global_failed & ~variable_failed)
                 
                 # Plot globally passing strides in green
-                if global_passing_indices:
+                if global_passing_indices.size:
                     global_passing_data = data_3d[global_passing_indices, :, var_idx]
                     passed_count = len(global_passing_indices)
                     lc = _create_line_collection(phase_ipsi, global_passing_data, 'green', 0.3, linewidth, rasterized=True)
                     ax_pass.add_collection(lc)
                 
                 # Plot locally passing strides in gold/yellow
-                if local_passing_indices:
+                if local_passing_indices.size:
                     local_passing_data = data_3d[local_passing_indices, :, var_idx]
                     local_passed_count = len(local_passing_indices)
                     lc = _create_line_collection(phase_ipsi, local_passing_data, 'gold', 0.3, linewidth, rasterized=True)
@@ -669,10 +625,9 @@ def create_task_combined_plot(
                     ax_pass.add_collection(lc)
             else:
                 # Original logic - all non-globally-failed strides in green
-                passing_indices = [stride_idx for stride_idx in range(data_3d.shape[0]) 
-                                 if stride_idx not in global_failed_strides]
+                passing_indices = np.flatnonzero(~global_failed)
                 
-                if passing_indices:
+                if passing_indices.size:
                     # Extract all passing stride data at once - shape: (n_passing, 150)
                     passing_data = data_3d[passing_indices, :, var_idx]
                     passed_count = len(passing_indices)
@@ -716,18 +671,18 @@ def create_task_combined_plot(
                 # OPTIMIZED BATCH PLOTTING for failed strides
                 
                 # Collect indices for each failure type
-                biomech_indices = [idx for idx in variable_biomech_failed_strides]
-                velocity_indices = [idx for idx in variable_velocity_failed_strides]
+                biomech_indices = np.flatnonzero(variable_biomech_failed)
+                velocity_indices = np.flatnonzero(variable_velocity_failed)
                 
                 # Plot biomechanical failures in red (batch)
-                if biomech_indices:
+                if biomech_indices.size:
                     biomech_data = data_3d[biomech_indices, :, var_idx]
                     biomech_failed_count = len(biomech_indices)
                     lc = _create_line_collection(phase_ipsi, biomech_data, 'red', 0.4, linewidth, rasterized=True)
                     ax_fail.add_collection(lc)
                 
                 # Plot velocity failures in blue (batch)
-                if velocity_indices:
+                if velocity_indices.size:
                     velocity_data = data_3d[velocity_indices, :, var_idx]
                     velocity_failed_count = len(velocity_indices)
                     lc = _create_line_collection(phase_ipsi, velocity_data, 'blue', 0.4, linewidth, rasterized=True)
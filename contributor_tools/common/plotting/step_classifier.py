@@ -33,7 +33,7 @@ class StepClassifier:
         
         Args:
             violations: Boolean array of shape (num_steps, num_features) 
-                       indicating violations
+                       indicating violations, or a StrideMask
             feature_idx: Index of the feature being displayed
             
         Returns:
@@ -42,21 +42,10 @@ class StepClassifier:
             - 'red': Violation in the current feature
             - 'yellow': Violations in other features but not current
         """
-        num_steps = violations.shape[0]
-        colors = np.empty(num_steps, dtype=object)
-        
-        for step_idx in range(num_steps):
-            step_violations = violations[step_idx, :]
-            
-            if step_violations[feature_idx]:
-                # Violation in current feature
-                colors[step_idx] = 'red'
-            elif np.any(step_violations):
-                # Violations in other features
-                colors[step_idx] = 'yellow'
-            else:
-                # No violations
-                colors[step_idx] = 'green'
+        violations = np.asarray(violations, dtype=bool)
+        colors = np.full(violations.shape[0], 'green', dtype=object)
+        colors[violations.any(axis=1)] = 'yellow'
+        colors[violations[:, feature_idx]] = 'red'
         
         return colors
     
@@ -68,18 +57,16 @@ class StepClassifier:
         Classify all steps for all features.
         
         Args:
-            violations: Boolean array of shape (num_steps, num_features)
+            violations: Boolean array of shape (num_steps, num_features),
+                       or a StrideMask
             
         Returns:
             2D array of shape (num_steps, num_features) with color classifications
         """
-        num_steps, num_features = violations.shape
-        colors = np.empty((num_steps, num_features), dtype=object)
-        
-        for feature_idx in range(num_features):
-            colors[:, feature_idx] = self.classify_steps_for_feature(
-                violations, feature_idx
-            )
+        violations = np.asarray(violations, dtype=bool)
+        colors = np.full(violations.shape, 'green', dtype=object)
+        colors[violations.any(axis=1)] = 'yellow'
+        colors[violations] = 'red'
         
         return colors
     
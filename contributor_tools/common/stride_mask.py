@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Compact stride pass/fail matrix shared by the validator, reports and plots.
+
+Validation results have historically been handed around as
+``{stride_idx: [failed variable names]}`` dicts and sets of passing stride
+indices, and every consumer rebuilt its own sets from them.  A ``StrideMask``
+holds the same information as a strides x variables bit matrix (one
+``np.packbits`` row per variable), so unions, intersections and counts are
+bitwise operations on a few bytes per variable.  ``to_failing_features`` and
+``passing_set`` produce the legacy structures for code that still needs them.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+import numpy as np
+
+# Number of set bits of every byte value
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.int64)
+
+
+def _packed_width(n_strides: int) -> int:
+    return (n_strides + 7) // 8
+
+
+class StrideMask:
+    """
+    Failure bits of ``n_strides`` strides for a fixed list of variables.
+
+    Args:
+        variables: Variable names, one bit row each
+        n_strides: Number of strides
+        packed: Optional ``(len(variables), ceil(n_strides / 8))`` uint8 array
+            as produced by ``np.packbits(..., axis=1)``; all bits clear if None
+    """
+
+    __slots__ = ('_variables', '_index', '_n_strides', '_packed')
+
+    def __init__(self, variables: Sequence[str], n_strides: int, packed: Optional[np.ndarray] = None):
+        self._variables = tuple(variables)
+        self._index = {name: idx for idx, name in enumerate(self._variables)}
+        if len(self._index) != len(self._variables):
+            raise ValueError("StrideMask variables must be unique")
+        self._n_strides = int(n_strides)
+        shape = (len(self._variables), _packed_width(self._n_strides))
+        if packed is None:
+            packed = np.zeros(shape, dtype=np.uint8)
+        elif packed.shape != shape or packed.dtype != np.uint8:
+            raise ValueError(f"Packed bits must be uint8 with shape {shape}, got {packed.dtype} {packed.shape}")
+        self._packed = packed
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_bool(cls, matrix: np.ndarray, variables: Sequence[str]) -> 'StrideMask':
+        """Build from a ``(n_strides, n_variables)`` boolean matrix."""
+        matrix = np.asarray(matrix, dtype=bool)
+        if matrix.ndim != 2 or matrix.shape[1] != len(variables):
+            raise ValueError(f"Expected a (n_strides, {len(variables)}) matrix, got {matrix.shape}")
+        return cls(variables, matrix.shape[0], np.packbits(matrix.T, axis=1))
+
+    @classmethod
+    def from_failing_features(
+        cls,
+        failing_features: Dict[int, Iterable[str]],
+        n_strides: int,
+        variables: Optional[Sequence[str]] = None,
+    ) -> 'StrideMask':
+        """
+        Build from a legacy ``{stride_idx: [failed variable names]}`` dict.
+
+        Variables default to the names in order of first appearance; strides
+        outside ``range(n_strides)`` and names not in ``variables`` are dropped.
+        """
+        if variables is None:
+            variables = list(dict.fromkeys(name for names in failing_features.values() for name in names))
+        index = {name: idx for idx, name in enumerate(variables)}
+        matrix = np.zeros((n_strides, len(variables)), dtype=bool)
+        for stride_idx, names in failing_features.items():
+            if 0 <= stride_idx < n_strides:
+                columns = [index[name] for name in names if name in index]
+                matrix[stride_idx, columns] = True
+        return cls.from_bool(matrix, variables)
+
+    @classmethod
+    def from_stride_indices(
+        cls,
+        strides_by_variable: Dict[str, Iterable[int]],
+        n_strides: int,
+        variables: Optional[Sequence[str]] = None,
+    ) -> 'StrideMask':
+        """Build from ``{variable: failing stride indices}``, e.g. ``per_variable_failures``."""
+        if variables is None:
+            variables = list(strides_by_variable)
+        matrix = np.zeros((n_strides, len(variables)), dtype=bool)
+        for column, name in enumerate(variables):
+            indices = np.fromiter(strides_by_variable.get(name, ()), dtype=np.int64)
+            matrix[indices[(indices >= 0) & (indices < n_strides)], column] = True
+        return cls.from_bool(matrix, variables)
+
+    @classmethod
+    def concatenate(cls, masks: Sequence['StrideMask']) -> 'StrideMask':
+        """Stack masks with identical variables along the stride axis."""
+        if not masks:
+            return cls([], 0)
+        variables = masks[0].variables
+        if any(mask.variables != variables for mask in masks[1:]):
+            raise ValueError("Only masks with identical variables can be concatenated")
+        return cls.from_bool(np.concatenate([mask.to_bool() for mask in masks]), variables)
+
+    # ------------------------------------------------------------------
+    # Shape
+    # ------------------------------------------------------------------
+
+    @property
+    def variables(self) -> tuple:
+        return self._variables
+
+    @property
+    def n_strides(self) -> int:
+        return self._n_strides
+
+    @property
+    def shape(self) -> tuple:
+        return self._n_strides, len(self._variables)
+
+    @property
+    def packed(self) -> np.ndarray:
+        """Read-only view of the ``(n_variables, n_bytes)`` packed bits."""
+        view = self._packed.view()
+        view.flags.writeable = False
+        return view
+
+    def to_bool(self) -> np.ndarray:
+        """Unpacked ``(n_strides, n_variables)`` boolean matrix."""
+        return np.unpackbits(self._packed, axis=1, count=self._n_strides).T.astype(bool)
+
+    def __array__(self, dtype=None, copy=None):
+        matrix = self.to_bool()
+        return matrix if dtype is None else matrix.astype(dtype)
+
+    def resize(self, n_strides: int) -> 'StrideMask':
+        """Truncate to, or pad with passing strides up to, ``n_strides``."""
+        if n_strides == self._n_strides:
+            return self
+        keep = min(n_strides, self._n_strides)
+        packed = np.zeros((len(self._variables), _packed_width(n_strides)), dtype=np.uint8)
+        packed[:, :_packed_width(keep)] = self._packed[:, :_packed_width(keep)]
+        if keep % 8:
+            # Clear the bits past the kept strides in the last shared byte
+            packed[:, keep // 8] &= np.uint8((0xFF << (8 - keep % 8)) & 0xFF)
+        return StrideMask(self._variables, n_strides, packed)
+
+    def select(self, variables: Sequence[str]) -> 'StrideMask':
+        """Mask over ``variables`` in that order; unknown variables have no failures."""
+        packed = np.zeros((len(variables), self._packed.shape[1]), dtype=np.uint8)
+        for row, name in enumerate(variables):
+            source = self._index.get(name)
+            if source is not None:
+                packed[row] = self._packed[source]
+        return StrideMask(variables, self._n_strides, packed)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def column(self, variable: str) -> np.ndarray:
+        """Boolean failure vector of one variable (all False if unknown)."""
+        row = self._index.get(variable)
+        if row is None:
+            return np.zeros(self._n_strides, dtype=bool)
+        return np.unpackbits(self._packed[row], count=self._n_strides).astype(bool)
+
+    def _failed_bits(self) -> np.ndarray:
+        if not self._variables:
+            return np.zeros(self._packed.shape[1], dtype=np.uint8)
+        return np.bitwise_or.reduce(self._packed, axis=0)
+
+    def failed(self) -> np.ndarray:
+        """Boolean vector of strides failing at least one variable."""
+        return np.unpackbits(self._failed_bits(), count=self._n_strides).astype(bool)
+
+    def failing_strides(self) -> np.ndarray:
+        """Indices of strides failing at least one variable."""
+        return np.flatnonzero(self.failed())
+
+    def passing_strides(self) -> np.ndarray:
+        """Indices of strides passing every variable."""
+        return np.flatnonzero(~self.failed())
+
+    def passing_set(self) -> Set[int]:
+        """Passing strides as a set (legacy ``global_passing_strides``)."""
+        return set(self.passing_strides().tolist())
+
+    def count(self) -> int:
+        """Number of strides failing at least one variable."""
+        return int(_POPCOUNT[self._failed_bits()].sum())
+
+    def count_per_variable(self) -> Dict[str, int]:
+        """Number of failing strides per variable."""
+        counts = _POPCOUNT[self._packed].sum(axis=1)
+        return {name: int(count) for name, count in zip(self._variables, counts)}
+
+    def to_failing_features(self) -> Dict[int, List[str]]:
+        """Legacy ``{stride_idx: [failed variable names]}`` dict, names in mask order."""
+        strides, columns = np.nonzero(self.to_bool())
+        failing: Dict[int, List[str]] = {}
+        for stride_idx, column in zip(strides.tolist(), columns.tolist()):
+            failing.setdefault(stride_idx, []).append(self._variables[column])
+        return failing
+
+    # ------------------------------------------------------------------
+    # Set operations
+    # ------------------------------------------------------------------
+
+    def _aligned(self, other: 'StrideMask'):
+        if not isinstance(other, StrideMask):
+            raise TypeError(f"Expected a StrideMask, got {type(other).__name__}")
+        if other.n_strides != self._n_strides:
+            raise ValueError(f"Stride counts differ: {self._n_strides} vs {other.n_strides}")
+        variables = self._variables + tuple(name for name in other.variables if name not in self._index)
+        return variables, self.select(variables)._packed, other.select(variables)._packed
+
+    def union(self, other: 'StrideMask') -> 'StrideMask':
+        """Failures in either mask, over the union of both variable lists."""
+        variables, left, right = self._aligned(other)
+        return StrideMask(variables, self._n_strides, left | right)
+
+    def intersection(self, other: 'StrideMask') -> 'StrideMask':
+        """Failures present in both masks, over the union of both variable lists."""
+        variables, left, right = self._aligned(other)
+        return StrideMask(variables, self._n_strides, left & right)
+
+    __or__ = union
+    __and__ = intersection
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StrideMask):
+            return NotImplemented
+        return (self._variables == other._variables and self._n_strides == other._n_strides
+                and np.array_equal(self._packed, other._packed))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"StrideMask({self._n_strides} strides x {len(self._variables)} variables, {self.count()} failing)"
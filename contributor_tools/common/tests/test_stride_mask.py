@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from contributor_tools.common.plotting.filters_by_phase_plots import _failure_masks
+from contributor_tools.common.plotting.step_classifier import StepClassifier
+from contributor_tools.common.stride_mask import StrideMask
+
+
+def _random_mask(n_strides, variables, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.random((n_strides, len(variables))) < 0.2
+
+
+def test_round_trips_and_counts():
+    variables = ["hip", "knee", "ankle"]
+    matrix = _random_mask(37, variables)
+    mask = StrideMask.from_bool(matrix, variables)
+
+    np.testing.assert_array_equal(mask.to_bool(), matrix)
+    np.testing.assert_array_equal(np.asarray(mask), matrix)
+    assert mask.count() == int(matrix.any(axis=1).sum())
+    assert mask.count_per_variable() == dict(zip(variables, matrix.sum(axis=0).tolist()))
+    assert mask.passing_set() == set(np.flatnonzero(~matrix.any(axis=1)).tolist())
+    np.testing.assert_array_equal(mask.column("knee"), matrix[:, 1])
+    assert not mask.column("missing").any()
+
+    legacy = mask.to_failing_features()
+    assert StrideMask.from_failing_features(legacy, 37, variables) == mask
+    per_variable = {var: np.flatnonzero(matrix[:, i]).tolist() for i, var in enumerate(variables)}
+    assert StrideMask.from_stride_indices(per_variable, 37) == mask
+
+
+def test_set_operations_align_variables():
+    left = StrideMask.from_bool(_random_mask(20, ["a", "b"], seed=1), ["a", "b"])
+    right = StrideMask.from_bool(_random_mask(20, ["b", "c"], seed=2), ["b", "c"])
+
+    union = left | right
+    assert union.variables == ("a", "b", "c")
+    np.testing.assert_array_equal(union.column("b"), left.column("b") | right.column("b"))
+    np.testing.assert_array_equal(union.column("c"), right.column("c"))
+    intersection = left & right
+    np.testing.assert_array_equal(intersection.column("b"), left.column("b") & right.column("b"))
+    assert not intersection.column("a").any()
+
+    with pytest.raises(ValueError):
+        left | StrideMask(["a"], 21)
+
+
+def test_resize_and_concatenate():
+    variables = ["a", "b"]
+    matrix = _random_mask(21, variables, seed=3)
+    matrix[:, 0] = True
+    mask = StrideMask.from_bool(matrix, variables)
+
+    shorter = mask.resize(13)
+    np.testing.assert_array_equal(shorter.to_bool(), matrix[:13])
+    longer = shorter.resize(30)
+    assert longer.count() == 13
+    np.testing.assert_array_equal(longer.to_bool()[:13], matrix[:13])
+
+    parts = [StrideMask.from_bool(matrix[:5], variables), StrideMask.from_bool(matrix[5:], variables)]
+    assert StrideMask.concatenate(parts) == mask
+
+
+def test_plot_and_classifier_accept_masks():
+    variables = ["hip", "knee"]
+    biomech = StrideMask.from_bool(_random_mask(12, variables, seed=4), variables)
+    velocity = StrideMask.from_bool(_random_mask(12, variables, seed=5), variables)
+
+    merged_dict = {
+        idx: {"biomechanical": biomech.to_failing_features().get(idx, []),
+              "velocity": velocity.to_failing_features().get(idx, [])}
+        for idx in set(biomech.failing_strides().tolist()) | set(velocity.failing_strides().tolist())
+    }
+    from_masks = _failure_masks({"biomechanical": biomech, "velocity": velocity}, 12)
+    from_dicts = _failure_masks(merged_dict, 12)
+    assert from_masks[2] and from_dicts[2]
+    for mask_a, mask_b in zip(from_masks[:2], from_dicts[:2]):
+        for var in variables:
+            np.testing.assert_array_equal(mask_a.column(var), mask_b.column(var))
+
+    matrix = biomech.to_bool()
+    colors = StepClassifier().classify_all_steps(biomech)
+    expected = np.where(matrix, "red", np.where(matrix.any(axis=1, keepdims=True), "yellow", "green"))
+    assert (colors == expected).all()
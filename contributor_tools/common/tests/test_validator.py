@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from contributor_tools.common.validation.validator import Validator
+from locohub import LocomotionData
+
+POINTS = 150
+FEATURES = [
+    "hip_flexion_angle_ipsi_rad",
+    "knee_flexion_angle_ipsi_rad",
+    "ankle_dorsiflexion_angle_ipsi_rad",
+]
+
+
+def _write_dataset(path, n_strides=40, seed=0):
+    rng = np.random.default_rng(seed)
+    phase = np.linspace(0, 100, POINTS, endpoint=False)
+    frames = []
+    for stride in range(n_strides):
+        block = {
+            "subject": f"SUB{stride % 3:02d}",
+            "task": "level_walking",
+            "step": stride,
+            "phase_ipsi": phase,
+        }
+        for i, feature in enumerate(FEATURES):
+            block[feature] = 0.5 * np.sin(2 * np.pi * phase / 100 + i) + rng.normal(scale=0.15, size=POINTS)
+        frames.append(pd.DataFrame(block))
+    df = pd.concat(frames, ignore_index=True)
+    # Non-finite values are skipped by the range check
+    df.loc[5 * POINTS, FEATURES[0]] = np.nan
+    df.loc[7 * POINTS + 74, FEATURES[1]] = np.inf
+    df.to_parquet(path, index=False)
+
+
+def _reference_details(validator, locomotion_data, task):
+    """Scalar stride x phase x variable loop the vectorized kernel replaces."""
+    task_ranges = validator.config_manager.get_task_data(task)
+    phase_indices = validator._get_phase_indices(task_ranges)
+    variables = sorted({var for ranges in task_ranges.values() for var in ranges}
+                       & set(locomotion_data.features))
+    data_3d, names = locomotion_data.get_cycles(None, task, variables)
+    feature_index = {name: idx for idx, name in enumerate(names)}
+
+    failing_features = {}
+    per_variable = {var: [] for var in variables}
+    for stride in range(data_3d.shape[0]):
+        failures = []
+        for phase_pct, phase_idx in phase_indices.items():
+            for var, var_range in task_ranges.get(phase_pct, {}).items():
+                if var not in feature_index:
+                    continue
+                value = data_3d[stride, phase_idx, feature_index[var]]
+                lo, hi = var_range.get("min"), var_range.get("max")
+                if lo is None or hi is None:
+                    continue
+                lo, hi = min(lo, hi), max(lo, hi)
+                if not np.isfinite(value):
+                    continue
+                if value < lo or value > hi:
+                    if var not in failures:
+                        failures.append(var)
+                    per_variable[var].append(stride)
+        if failures:
+            failing_features[stride] = failures
+    passing = set(range(data_3d.shape[0])) - set(failing_features)
+    return failing_features, per_variable, passing
+
+
+@pytest.fixture
+def validator():
+    validator = Validator()
+    manager = validator.config_manager
+    # Variable order differs between phases so failure ordering is exercised
+    manager.set_range("level_walking", 0, FEATURES[2], -0.2, 0.6)
+    manager.set_range("level_walking", 0, FEATURES[0], -0.1, 0.3)
+    manager.set_range("level_walking", 50, FEATURES[1], 0.2, -0.6)  # swapped bounds
+    manager.set_range("level_walking", 50, FEATURES[0], -0.4, 0.1)
+    manager.set_range("level_walking", 75, FEATURES[0], -0.5, 0.5)
+    manager.set_range("level_walking", 75, "not_in_dataset_angle_ipsi_rad", 0.0, 1.0)
+    return validator
+
+
+def test_vectorized_task_details_match_scalar_loop(tmp_path, validator):
+    path = tmp_path / "validator_phase.parquet"
+    _write_dataset(path)
+    data = LocomotionData(path)
+
+    details = validator._validate_task_details(data, "level_walking")
+    failing, per_variable, passing = _reference_details(validator, data, "level_walking")
+
+    assert details.failing_features == failing
+    assert details.per_variable_failures == per_variable
+    assert list(details.per_variable_failures) == list(per_variable)
+    assert details.global_passing_strides == passing
+    assert details.total_strides == 40
+    assert failing and passing
+
+
+def test_check_variable_3d_flags_out_of_range_cycles(validator):
+    data_3d = np.zeros((4, POINTS, 1))
+    data_3d[1, 10, 0] = 2.0
+    data_3d[3, 10, 0] = -2.0
+    data_3d[2, 10, 0] = np.nan
+
+    assert validator._check_variable_3d(data_3d, 10, 0, {"min": -1.0, "max": 1.0}) == [1, 3]
+
+
+def test_validation_plan_is_cached_until_ranges_change(validator):
+    plan = validator.get_validation_plan("level_walking", FEATURES)
+
+    assert plan.validated_variables == sorted(FEATURES)
+    assert plan.phase_variable_checks == 5
+    assert validator.get_validation_plan("level_walking", FEATURES) is plan
+    # Another validator with identical ranges reuses the compiled plan
+    other = Validator()
+    other.config_manager.set_data(validator.config_manager.get_data())
+    assert other.get_validation_plan("level_walking", FEATURES) is plan
+
+    validator.config_manager.set_range("level_walking", 25, FEATURES[1], -1.0, 1.0)
+    updated = validator.get_validation_plan("level_walking", FEATURES)
+    assert updated is not plan
+    assert updated.phase_variable_checks == 6
+    assert validator.get_validation_plan("missing_task", FEATURES) is None
+
+
+def test_incremental_validator_matches_full_validation(tmp_path, validator):
+    from contributor_tools.common.validation import IncrementalValidator
+
+    path = tmp_path / "validator_phase.parquet"
+    _write_dataset(path)
+    data = LocomotionData(path)
+    manager = validator.config_manager
+
+    incremental = IncrementalValidator(data)
+    incremental.sync_task("level_walking", manager.get_task_data("level_walking"))
+
+    def assert_matches_full_run():
+        expected = validator.validate_dataset(data, task_filter=["level_walking"])["tasks"]["level_walking"]
+        actual = incremental.task_result("level_walking")
+        for key in ("failing_strides_by_variable", "failing_strides_map", "global_passing_strides",
+                    "total_strides", "validated_variables", "phase_indices", "stride_mask"):
+            assert actual[key] == expected[key], key
+
+    assert_matches_full_run()
+
+    # Drag one box, then move another to a new phase
+    manager.set_range("level_walking", 50, FEATURES[0], -0.2, 0.4)
+    incremental.update_bound("level_walking", 50, FEATURES[0], -0.2, 0.4)
+    assert_matches_full_run()
+
+    data_ranges = manager.get_data()
+    del data_ranges["level_walking"]["phases"][75][FEATURES[0]]
+    data_ranges["level_walking"]["phases"][25] = {FEATURES[2]: {"min": -0.3, "max": 0.3}}
+    manager.set_data(data_ranges)
+    assert incremental.sync_task("level_walking", manager.get_task_data("level_walking")) == 2
+    assert_matches_full_run()
+
+    failing = incremental.failing_strides_by_variable("level_walking")[FEATURES[2]]
+    assert incremental.violation_count("level_walking", 25, FEATURES[2]) <= len(failing)
+
+
+def test_parallel_validation_matches_serial(tmp_path, validator):
+    path = tmp_path / "validator_phase.parquet"
+    _write_dataset(path)
+    data = LocomotionData(path)
+
+    serial = validator.validate_dataset(data)
+    # Small chunks split the task into several worker jobs
+    parallel = validator.validate_dataset(data, workers=2, chunk_strides=7)
+
+    assert parallel == serial
+    assert parallel["tasks"]["level_walking"]["failing_strides_map"]
+
+
+def test_validation_session_shares_one_validation_run(tmp_path, validator):
+    from contributor_tools.common.validation import ValidationSession
+
+    path = tmp_path / "validator_phase.parquet"
+    _write_dataset(path)
+    session = ValidationSession(path, validator)
+
+    expected = validator.validate(str(path))
+    assert session.result["stats"] == expected["stats"]
+    assert session.result["violations"] == expected["violations"]
+    assert session.result is session.result
+    assert session.tasks == ["level_walking"]
+
+    data = session.locomotion_data
+    data_3d, features, failures, task_config = session.plot_inputs("level_walking")
+    legacy = validator._validate_task_with_failing_features(data, "level_walking")
+    assert {stride: set(names) for stride, names in failures.to_failing_features().items()} == {
+        stride: set(names) for stride, names in legacy.items()
+    }
+    assert features == FEATURES and data_3d.shape == (40, POINTS, 3)
+    assert task_config == validator.config_manager.get_task_data("level_walking")
+
+    # Below/above counts per (phase, variable) check; swapped bounds are (-0.6, 0.2)
+    values = data_3d[:, validator._get_phase_indices(task_config)[50], 1]
+    expected_below = int(np.sum(np.isfinite(values) & (values < -0.6)))
+    stats = session.phase_stats("level_walking")
+    assert stats[FEATURES[1]][50]["below"] == expected_below
+
+    details = session.task_statistics()["level_walking"]
+    assert details["total_strides"] == 40
+    assert details["failing_strides"] == 40 - len(session.result["tasks"]["level_walking"]["global_passing_strides"])
+
+
+def test_phase_violation_table_matches_masks(tmp_path, validator):
+    path = tmp_path / "validator_phase.parquet"
+    _write_dataset(path)
+    data = LocomotionData(path)
+
+    result = validator.validate_dataset(data, include_phase_stats=True)
+    table = result["tasks"]["level_walking"]["phase_stats"]
+    task_config = validator.config_manager.get_task_data("level_walking")
+    phase_indices = validator._get_phase_indices(task_config)
+    data_3d, names = data.get_cycles(None, "level_walking", sorted(FEATURES))
+
+    assert table
+    assert [(row.phase, row.variable) for row in table] == [
+        (phase, var) for phase in phase_indices for var in task_config[phase]
+        if any(r.phase == phase and r.variable == var for r in table)
+    ]
+    _, per_variable, _ = _reference_details(validator, data, "level_walking")
+    for row in table:
+        values = data_3d[:, phase_indices[row.phase], names.index(row.variable)]
+        finite = np.isfinite(values)
+        np.testing.assert_array_equal(row.below_strides, np.flatnonzero(finite & (values < row.min)))
+        np.testing.assert_array_equal(row.above_strides, np.flatnonzero(finite & (values > row.max)))
+        np.testing.assert_array_equal(row.below_values, values[row.below_strides])
+        assert row.n_below == len(row.below_strides) and row.n_above == len(row.above_strides)
+        if row.n_above:
+            assert row.worst_excess == pytest.approx(values[row.above_strides].max() - row.max)
+        if row.n_below:
+            assert row.worst_deficit == pytest.approx(row.min - values[row.below_strides].min())
+    for var in FEATURES:
+        offending = sorted(
+            int(stride) for row in table if row.variable == var
+            for stride in np.concatenate([row.below_strides, row.above_strides])
+        )
+        assert offending == sorted(per_variable[var])
+
+    # Workers build the table of their stride chunks; the parent only merges
+    def no_serial_table(*args, **kwargs):
+        raise AssertionError("phase table re-extracted in the parent process")
+
+    validator.phase_violation_table = no_serial_table
+    parallel = validator.validate_dataset(data, include_phase_stats=True, workers=2, chunk_strides=7)
+    parallel_table = parallel["tasks"]["level_walking"]["phase_stats"]
+    assert len(parallel_table) == len(table)
+    for merged, row in zip(parallel_table, table):
+        assert (merged.phase, merged.variable, merged.n_below, merged.n_above) == \
+            (row.phase, row.variable, row.n_below, row.n_above)
+        assert (merged.worst_deficit, merged.worst_excess) == (row.worst_deficit, row.worst_excess)
+        for name in ("below_strides", "above_strides", "below_values", "above_values"):
+            np.testing.assert_array_equal(getattr(merged, name), getattr(row, name))
+
+
+def test_streaming_validation_matches_in_memory(tmp_path, validator):
+    path = tmp_path / "validator_phase.parquet"
+    _write_dataset(path, n_strides=30)
+    df = pd.read_parquet(path)
+    # Interleave two tasks so strides of each task span record batches
+    odd = (df["step"] % 3 == 1).to_numpy()
+    df.loc[odd, "task"] = "incline_walking"
+    df.to_parquet(path, index=False, row_group_size=1000)
+    validator.config_manager.set_range("incline_walking", 50, FEATURES[0], -0.3, 0.3)
+
+    expected = validator.validate(str(path))
+    streamed = validator.validate(str(path), streaming=True)
+    assert streamed == expected
+    assert expected["tasks"]["incline_walking"]["total_strides"] == 10
+
+    from contributor_tools.common.validation import validate_parquet_streaming
+
+    assert validate_parquet_streaming(validator, path, batch_rows=333) == expected
+
+    # A task that does not divide into whole strides fails the phase check
+    broken = pd.concat([df, df[df["task"] == "incline_walking"].iloc[:100]], ignore_index=True)
+    broken.to_parquet(path, index=False)
+    with pytest.warns(UserWarning, match="not divisible"):
+        expected = validator.validate(str(path))
+    streamed = validate_parquet_streaming(validator, path, batch_rows=400)
+    assert not expected["phase_valid"]
+    # Streaming reports row-count issues but not the per-stride warnings
+    assert [issue for issue in expected.pop("phase_issues")
+            if issue["reason"] in ("task_length", "group_length")] == streamed.pop("phase_issues")
+    assert streamed == expected
+
+
+def test_phase_structure_reports_every_offending_stride(tmp_path, validator):
+    path = tmp_path / "validator_phase.parquet"
+    _write_dataset(path, n_strides=6)
+    df = pd.read_parquet(path)
+    data = LocomotionData(path)
+    assert validator.check_phase_structure(data, check_phase_order=True).issues == []
+
+    # Reverse the phase of one stride, then move 150 rows of step 3 to step 4
+    df.loc[POINTS:2 * POINTS - 1, "phase_ipsi"] = df.loc[POINTS:2 * POINTS - 1, "phase_ipsi"].to_numpy()[::-1]
+    df.loc[3 * POINTS + 100:4 * POINTS - 1, "step"] = 4
+    df.to_parquet(path, index=False)
+    data = LocomotionData(path)
+
+    # Layout issues within a whole task are warnings unless strict_phase is set
+    report = validator.check_phase_structure(data)
+    assert report.valid
+    assert {(issue["reason"], issue["step"]) for issue in report.issues} == {
+        ("group_length", 3), ("group_length", 4), ("mixed_stride", 3),
+    }
+    result = validator.validate_dataset(data)
+    assert result["passed"] and result["phase_valid"] and result["phase_issues"] == report.issues
+
+    strict = validator.check_phase_structure(data, strict_phase=True)
+    assert not strict.valid and strict.issues == report.issues
+    assert not validator.validate_dataset(data, strict_phase=True)["passed"]
+
+    ordered = validator.check_phase_structure(data, check_phase_order=True)
+    phase_order = [issue for issue in ordered.issues if issue["reason"] == "phase_order"]
+    assert [(issue["stride"], issue["subject"]) for issue in phase_order] == [(1, "SUB01")]
+
+
+def test_uneven_subject_groups_do_not_fail_phase_check(tmp_path, validator):
+    path = tmp_path / "validator_phase.parquet"
+    _write_dataset(path, n_strides=6)
+    df = pd.read_parquet(path)
+    # Drop 75 rows from each of two subjects; the task still divides into strides
+    drop = np.r_[0:75, POINTS:POINTS + 75]
+    df.drop(index=drop).to_parquet(path, index=False)
+
+    result = validator.validate(str(path))
+    assert result["passed"] and result["phase_valid"]
+    assert [issue["reason"] for issue in result["phase_issues"]].count("group_length") == 2
+
+    # Streaming applies the same gate and reports the same group warnings
+    streamed = validator.validate(str(path), streaming=True)
+    assert [issue for issue in result.pop("phase_issues") if issue["reason"] == "group_length"] \
+        == streamed.pop("phase_issues")
+    assert streamed == result
+
+
+def test_streaming_excludes_custom_subject_column(tmp_path, validator):
+    path = tmp_path / "validator_phase.parquet"
+    _write_dataset(path, n_strides=6)
+    pd.read_parquet(path).rename(columns={"subject": "velocity_cohort"}).to_parquet(path, index=False)
+
+    from contributor_tools.common.validation import validate_parquet_streaming
+
+    plans = []
+    get_plan = validator.get_validation_plan
+
+    def recording_plan(task, features, *args):
+        plans.append(features)
+        return get_plan(task, features, *args)
+
+    validator.get_validation_plan = recording_plan
+    result = validate_parquet_streaming(validator, path, subject_col="velocity_cohort")
+    assert plans and all("velocity_cohort" not in features for features in plans)
+    assert result["tasks"]["level_walking"]["total_strides"] == 6
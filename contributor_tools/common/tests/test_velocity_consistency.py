@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from contributor_tools.common.validation.report_generator import ValidationReportGenerator
+
+POINTS = 150
+PAIRS = [
+    ("hip_flexion_angle_ipsi_rad", "hip_flexion_velocity_ipsi_rad_s"),
+    ("knee_flexion_angle_ipsi_rad", "knee_flexion_velocity_ipsi_rad_s"),
+    ("ankle_dorsiflexion_angle_ipsi_rad", "ankle_dorsiflexion_velocity_ipsi_rad_s"),
+]
+
+
+def _make_df(seed=0):
+    rng = np.random.default_rng(seed)
+    phase = np.arange(POINTS)
+    frames = []
+    for stride in range(24):
+        n_rows = POINTS if stride != 5 else 120  # one incomplete stride
+        phase_dot = rng.uniform(50, 150)
+        block = {
+            "subject": f"SUB{stride % 3:02d}",
+            "task": "level_walking" if stride % 2 else "incline_walking",
+            "step": stride // 3,
+            "phase_ipsi_dot": np.full(n_rows, phase_dot),
+        }
+        for i, (angle, velocity) in enumerate(PAIRS[:2]):
+            theta = 0.6 * np.sin(2 * np.pi * phase[:n_rows] / POINTS + i)
+            omega = np.gradient(theta) * (100 / 150) * phase_dot
+            block[angle] = theta
+            # Some strides carry a noisy stored velocity
+            block[velocity] = omega + rng.normal(scale=0.9 if stride % 4 == 0 else 0.01, size=n_rows)
+        block[PAIRS[2][0]] = rng.normal(size=n_rows)  # angle without stored velocity
+        frames.append(pd.DataFrame(block))
+    df = pd.concat(frames, ignore_index=True)
+    rows = df.index[(df["subject"] == "SUB01") & (df["step"] == 2)]
+    df.loc[rows, PAIRS[0][0]] = np.nan  # all-NaN angle stride
+    df.loc[rows[:10], PAIRS[1][1]] = np.nan  # partly missing stored velocity
+    # Interleave rows so strides are not contiguous in the frame
+    return df.sample(frac=1.0, random_state=seed).sort_values(["task", "subject"], kind="stable")
+
+
+def _reference(df, angle_col, velocity_col):
+    """Per-stride loop the stride-tensor check replaces."""
+    errors, failing = [], []
+    for stride_idx, (_, stride_df) in enumerate(df.groupby(["subject", "task", "step"], observed=True)):
+        if len(stride_df) != POINTS:
+            continue
+        angle = stride_df[angle_col].values
+        if np.all(np.isnan(angle)):
+            continue
+        expected = np.gradient(angle) * (100 / 150) * stride_df["phase_ipsi_dot"].iloc[0]
+        stored = stride_df[velocity_col].values
+        valid = ~(np.isnan(expected) | np.isnan(stored))
+        if np.all(np.isnan(stored)) or not np.any(valid):
+            continue
+        mae = np.mean(np.abs(expected[valid] - stored[valid]))
+        errors.append(mae)
+        if mae >= 0.5:
+            failing.append(stride_idx)
+    return errors, failing
+
+
+@pytest.fixture
+def generator():
+    generator = ValidationReportGenerator.__new__(ValidationReportGenerator)
+    generator.memory_log_file = None
+    return generator
+
+
+def test_velocity_consistency_matches_per_stride_loop(generator):
+    df = _make_df()
+    results = generator.validate_velocity_consistency(df)
+
+    for angle, velocity in PAIRS[:2]:
+        errors, failing = _reference(df, angle, velocity)
+        result = results[velocity]
+        assert result["failing_strides"] == failing
+        assert result["num_strides"] == len(errors)
+        assert result["total_strides"] == 23
+        assert result["mean_error"] == pytest.approx(np.mean(errors), rel=1e-12)
+        assert result["max_error"] == pytest.approx(np.max(errors), rel=1e-12)
+        assert failing
+
+    assert results[PAIRS[2][1]]["status"] == "calculated_only"
+    assert results["hip_flexion_velocity_contra_rad_s"]["status"] == "angle_missing"
+
+
+def test_velocity_consistency_is_independent_of_chunk_size(generator):
+    df = _make_df(seed=1)
+    whole = generator.validate_velocity_consistency(df)
+    chunked = generator.validate_velocity_consistency(df, chunk_strides=4)
+
+    for angle, velocity in PAIRS[:2]:
+        assert chunked[velocity]["failing_strides"] == whole[velocity]["failing_strides"]
+        assert chunked[velocity]["mean_error"] == whole[velocity]["mean_error"]
+        assert chunked[velocity]["num_strides"] == whole[velocity]["num_strides"]
+
+
+def test_report_loader_numbers_strides_by_sorted_group(generator, tmp_path):
+    df = _make_df()
+    df["phase_ipsi"] = df.groupby(["subject", "task", "step"]).cumcount() * (100 / POINTS)
+    path = tmp_path / "unsorted_phase.parquet"
+    df.to_parquet(path, index=False)
+    generator._required_columns_cache = None
+
+    data = generator._load_dataset_optimized(str(path))
+    cycles, _ = data.get_cycles(None, "level_walking", [PAIRS[1][0]])
+
+    # Sorted (subject, step) groups; the 120-row group is dropped, not the task
+    expected = [
+        group[PAIRS[1][0]].to_numpy()
+        for _, group in df[df["task"] == "level_walking"].groupby(["subject", "step"])
+        if len(group) == POINTS
+    ]
+    assert cycles.shape[0] == 11
+    np.testing.assert_array_equal(cycles[:, :, 0], np.stack(expected))
+    assert data.get_cycles("SUB02", "level_walking", [PAIRS[0][1]])[0].shape[0] == 3
+
+
+def test_velocity_consistency_requires_phase_rate(generator):
+    df = _make_df().drop(columns=["phase_ipsi_dot"])
+    assert "error" in generator.validate_velocity_consistency(df)
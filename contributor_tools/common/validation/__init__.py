@@ -1,10 +1,20 @@
 """Validation engine for locomotion datasets."""
 
-from .validator import Validator, format_validation_result
+from ..stride_mask import StrideMask
+from .validator import PhaseViolationStats, ValidationPlan, Validator, format_validation_result
 from .report_generator import ValidationReportGenerator
+from .incremental import IncrementalValidator
+from .session import ValidationSession
+from .streaming import validate_parquet_streaming
 
 __all__ = [
     "Validator",
+    "ValidationPlan",
+    "PhaseViolationStats",
+    "StrideMask",
     "format_validation_result",
     "ValidationReportGenerator",
+    "IncrementalValidator",
+    "ValidationSession",
+    "validate_parquet_streaming",
 ]
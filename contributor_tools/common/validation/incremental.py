@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Incremental range validation for interactive editing.
+
+Dragging one range box in the validation tuner changes a single
+(phase, variable) bound pair, yet a full ``Validator.validate_dataset`` run
+re-checks every range of the task.  ``IncrementalValidator`` keeps one
+violation bitmask per check and per-stride violation counts, so an edit only
+re-evaluates that check's column and adjusts the counts.
+
+Results use the same rules and structure as ``Validator.validate_dataset``
+task entries (phase index mapping, swapped bounds, non-finite values skipped).
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ..stride_mask import StrideMask
+from .validator import Validator
+
+CheckKey = Tuple[int, str]
+
+
+@dataclass
+class _TaskMasks:
+    """Violation state of one task."""
+
+    total_strides: int
+    stride_counts: np.ndarray
+    # Packed violation bitmask (np.packbits over strides) of each active check
+    bits: Dict[CheckKey, np.ndarray] = field(default_factory=dict)
+    # Every configured (phase, variable) entry, including ones without bounds
+    configured: Dict[CheckKey, Optional[Tuple[float, float]]] = field(default_factory=dict)
+    # Phases of the last synced config, including ones without dataset variables
+    config_phases: Set[int] = field(default_factory=set)
+    var_counts: Dict[str, np.ndarray] = field(default_factory=dict)
+    values: Dict[str, np.ndarray] = field(default_factory=dict)
+
+
+class IncrementalValidator:
+    """
+    Stateful validator that re-evaluates only the range checks that change.
+
+    Args:
+        locomotion_data: Dataset to validate
+        ignore_features: Optional feature names excluded from validation
+    """
+
+    def __init__(self, locomotion_data, ignore_features: Optional[List[str]] = None):
+        self.locomotion_data = locomotion_data
+        self.ignore_features = set(ignore_features or [])
+        self._features = set(locomotion_data.features or [])
+        self._tasks: Dict[str, _TaskMasks] = {}
+
+    # ------------------------------------------------------------------
+    # Edits
+    # ------------------------------------------------------------------
+
+    def update_bound(self, task: str, phase: Any, var_name: str,
+                     min_val: Optional[float], max_val: Optional[float]) -> None:
+        """
+        Set the range of one (phase, variable) check and update its mask.
+
+        Args:
+            task: Task name
+            phase: Phase percentage (0-100)
+            var_name: Variable name
+            min_val: Lower bound (None disables the check)
+            max_val: Upper bound (None disables the check)
+        """
+        key = self._check_key(phase, var_name)
+        if key is None:
+            return
+        state = self._task_state(task)
+        bounds = None if min_val is None or max_val is None else (min(min_val, max_val), max(min_val, max_val))
+        if key in state.configured and state.configured[key] == bounds:
+            return
+
+        self._drop_check(state, key)
+        state.configured[key] = bounds
+        if bounds is None or state.total_strides == 0:
+            return
+
+        values = self._variable_values(task, state, var_name)
+        if values is None:
+            return
+        column = values[:, self._phase_index(key[0])]
+        with np.errstate(invalid='ignore'):
+            violations = np.isfinite(column) & ((column < bounds[0]) | (column > bounds[1]))
+
+        state.bits[key] = np.packbits(violations)
+        state.stride_counts += violations
+        state.var_counts.setdefault(var_name, np.zeros(state.total_strides, dtype=np.int32))
+        state.var_counts[var_name] += violations
+
+    def remove_bound(self, task: str, phase: Any, var_name: str) -> None:
+        """Remove one (phase, variable) check from a task."""
+        key = self._check_key(phase, var_name)
+        if key is None or task not in self._tasks:
+            return
+        state = self._tasks[task]
+        self._drop_check(state, key)
+        state.configured.pop(key, None)
+
+    def sync_task(self, task: str, task_ranges: Dict[Any, Dict[str, Dict[str, float]]]) -> int:
+        """
+        Bring a task's checks in line with a ``{phase: {variable: range}}`` dict.
+
+        Only checks whose bounds differ from the current state are recomputed.
+
+        Returns:
+            Number of checks added, changed or removed
+        """
+        state = self._task_state(task)
+        state.config_phases = {
+            phase for phase in map(Validator._normalize_phase_key, task_ranges) if phase is not None
+        }
+
+        desired: Dict[CheckKey, Tuple[Optional[float], Optional[float]]] = {}
+        for raw_phase, phase_ranges in task_ranges.items():
+            for var_name, var_range in (phase_ranges or {}).items():
+                key = self._check_key(raw_phase, var_name)
+                if key is not None:
+                    desired[key] = (var_range.get('min'), var_range.get('max'))
+
+        changed = 0
+        for key in [key for key in state.configured if key not in desired]:
+            self.remove_bound(task, *key)
+            changed += 1
+        for (phase, var_name), (min_val, max_val) in desired.items():
+            before = state.configured.get((phase, var_name), ())
+            self.update_bound(task, phase, var_name, min_val, max_val)
+            if state.configured.get((phase, var_name)) != before:
+                changed += 1
+        return changed
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def has_task(self, task: str) -> bool:
+        """Whether masks have been built for a task."""
+        return task in self._tasks
+
+    def passing_count(self, task: str) -> Tuple[int, int]:
+        """Return (strides passing every check, total strides) for a task."""
+        state = self._tasks.get(task)
+        if state is None:
+            return 0, 0
+        return int(np.count_nonzero(state.stride_counts == 0)), state.total_strides
+
+    def validated_variables(self, task: str) -> List[str]:
+        """Dataset variables with at least one configured range, sorted."""
+        state = self._tasks.get(task)
+        if state is None or state.total_strides == 0:
+            return []
+        return sorted({var_name for _, var_name in state.configured})
+
+    def global_passing_strides(self, task: str) -> Set[int]:
+        """Strides that pass every check of the task."""
+        state = self._tasks.get(task)
+        if state is None:
+            return set()
+        return set(np.flatnonzero(state.stride_counts == 0).tolist())
+
+    def failing_strides_by_variable(self, task: str) -> Dict[str, Set[int]]:
+        """Strides failing at least one phase check, per validated variable."""
+        state = self._tasks.get(task)
+        failing = {var_name: set() for var_name in self.validated_variables(task)}
+        if state is None:
+            return failing
+        for var_name, counts in state.var_counts.items():
+            if var_name in failing:
+                failing[var_name] = set(np.flatnonzero(counts).tolist())
+        return failing
+
+    def stride_mask(self, task: str) -> StrideMask:
+        """Strides x validated variables failure mask of a task."""
+        state = self._tasks.get(task)
+        validated = self.validated_variables(task)
+        if state is None or not validated:
+            return StrideMask([], 0)
+        empty = np.zeros(state.total_strides, dtype=np.int32)
+        return StrideMask.from_bool(
+            np.column_stack([state.var_counts.get(var_name, empty) > 0 for var_name in validated]),
+            validated,
+        )
+
+    def violation_count(self, task: str, phase: Any, var_name: str) -> int:
+        """Number of strides violating one check (popcount of its bitmask)."""
+        key = self._check_key(phase, var_name)
+        state = self._tasks.get(task)
+        if key is None or state is None or key not in state.bits:
+            return 0
+        return int(np.unpackbits(state.bits[key], count=state.total_strides).sum())
+
+    def task_result(self, task: str) -> Dict[str, Any]:
+        """
+        Current results in the layout of ``validate_dataset()['tasks'][task]``.
+        """
+        state = self._tasks.get(task)
+        validated = self.validated_variables(task)
+        if state is None or not validated:
+            return {
+                'failing_strides_by_variable': {},
+                'failing_strides_map': {},
+                'global_passing_strides': set(),
+                'total_strides': 0,
+                'validated_variables': [],
+                'phase_indices': {},
+                'stride_mask': StrideMask([], 0),
+            }
+
+        phases = sorted({phase for phase, _ in state.configured} | state.config_phases)
+        return {
+            'failing_strides_by_variable': self.failing_strides_by_variable(task),
+            'failing_strides_map': self._failing_strides_map(state, phases),
+            'global_passing_strides': self.global_passing_strides(task),
+            'total_strides': state.total_strides,
+            'validated_variables': validated,
+            'phase_indices': {phase: self._phase_index(phase) for phase in phases},
+            'stride_mask': self.stride_mask(task),
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _check_key(self, phase: Any, var_name: str) -> Optional[CheckKey]:
+        phase_pct = Validator._normalize_phase_key(phase)
+        if phase_pct is None or var_name in self.ignore_features or var_name not in self._features:
+            return None
+        return phase_pct, var_name
+
+    @staticmethod
+    def _phase_index(phase_pct: int) -> int:
+        # Same mapping as Validator._get_phase_indices
+        return int(round((phase_pct / 100.0) * 149))
+
+    def _task_state(self, task: str) -> _TaskMasks:
+        state = self._tasks.get(task)
+        if state is None:
+            rows = None
+            if task in self.locomotion_data.get_tasks():
+                rows = self.locomotion_data.get_row_selection(None, task)
+            n_points = 0
+            if rows is not None:
+                n_points = rows.stop - rows.start if isinstance(rows, slice) else len(rows)
+            total = n_points // 150 if n_points % 150 == 0 else 0
+            state = _TaskMasks(total_strides=total, stride_counts=np.zeros(total, dtype=np.int32))
+            self._tasks[task] = state
+        return state
+
+    def _variable_values(self, task: str, state: _TaskMasks, var_name: str) -> Optional[np.ndarray]:
+        if var_name not in state.values:
+            data_3d, names = self.locomotion_data.get_cycles(None, task, [var_name])
+            if data_3d is None or var_name not in names:
+                return None
+            state.values[var_name] = data_3d[:, :, names.index(var_name)]
+        return state.values[var_name]
+
+    def _drop_check(self, state: _TaskMasks, key: CheckKey) -> None:
+        packed = state.bits.pop(key, None)
+        if packed is None:
+            return
+        violations = np.unpackbits(packed, count=state.total_strides).astype(bool)
+        state.stride_counts -= violations
+        state.var_counts[key[1]] -= violations
+
+    def _failing_strides_map(self, state: _TaskMasks, phases: List[int]) -> Dict[int, List[str]]:
+        # Names in (phase, configured order) of their first violated check
+        failing: Dict[int, List[str]] = {}
+        order = {key: idx for idx, key in enumerate(state.configured)}
+        for phase in phases:
+            keys = sorted((key for key in state.bits if key[0] == phase), key=order.get)
+            for key in keys:
+                violations = np.unpackbits(state.bits[key], count=state.total_strides)
+                for stride_idx in np.flatnonzero(violations).tolist():
+                    names = failing.setdefault(stride_idx, [])
+                    if key[1] not in names:
+                        names.append(key[1])
+        return dict(sorted(failing.items()))
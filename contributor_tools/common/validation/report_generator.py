@@ -34,8 +34,13 @@ from contributor_tools.common.plotting.filters_by_phase_plots import (
     create_filters_by_phase_plot  # Keep for backward compatibility
 )
 from contributor_tools.common.plotting.step_classifier import StepClassifier
+from contributor_tools.common.stride_mask import StrideMask
 from locohub import LocomotionData
 
+# Strides per block in the velocity consistency check; a block of 1000
+# strides with 20 angle/velocity pairs is ~25 MB per intermediate array
+VELOCITY_CHUNK_STRIDES = 1000
+
 
 class ValidationReportGenerator:
     """
@@ -316,93 +321,93 @@ class ValidationReportGenerator:
         # Load data - use column optimization if available
         if required_cols is not None:
             try:
-                df_subset = pd.read_parquet(dataset_path, columns=required_cols)
-                self._log_memory("optimized_load_columns", f"Loaded {len(required_cols)} columns, shape: {df_subset.shape}")
+                # Lazy mode reads only subject/task/phase up front; feature columns
+                # requested later by get_cycles are fetched on demand
+                loco_data = LocomotionData(dataset_path, phase_col=phase_col, lazy=True)
+                loco_data.load_columns(required_cols)
+                self._log_memory("optimized_load_columns", f"Loaded {len(required_cols)} columns, shape: {loco_data.df.shape}")
                 print(f"✅ Column optimization successful")
             except Exception as e:
                 print(f"⚠️  Column loading failed ({e}), falling back to full load")
                 self._log_memory("optimized_load_fallback", f"Column loading failed: {e}")
-                df_subset = pd.read_parquet(dataset_path)
+                loco_data = LocomotionData(dataset_path, phase_col=phase_col)
         else:
             print("📊 Loading full dataset (column optimization unavailable)")
             self._log_memory("full_load", "Loading full dataset")
-            df_subset = pd.read_parquet(dataset_path)
-        
-        # Create a minimal LocomotionData instance by temporarily replacing the DataFrame
-        from locohub import LocomotionData
-        
-        # Create instance with minimal loading
-        loco_data = LocomotionData.__new__(LocomotionData)
-        loco_data.data_path = Path(dataset_path)
-        loco_data.subject_col = 'subject'
-        loco_data.task_col = 'task'
-        loco_data.phase_col = phase_col
-        loco_data.df = df_subset
-        loco_data._cache = {}
-        
-        # Initialize features list
-        loco_data.features = [col for col in df_subset.columns 
-                             if col not in ['subject', 'task', 'step', 'phase_ipsi', 'phase_ipsi_dot']]
-        
-        # Add required methods
-        def get_tasks():
-            return sorted(df_subset['task'].unique())
-        
-        def get_cycles(subject=None, task=None, features=None):
-            # Enhanced version that handles concatenated cycles
-            data_filtered = df_subset.copy()
-            if subject:
-                data_filtered = data_filtered[data_filtered['subject'] == subject]
-            if task:
-                data_filtered = data_filtered[data_filtered['task'] == task]
-                
-            if features is None:
-                features = loco_data.features
-            
-            # Group by subject/task/step and reshape to 3D array
-            groups = data_filtered.groupby(['subject', 'task', 'step'])
-            cycles_list = []
-            total_groups = len(groups)
-            valid_groups = 0
-            total_cycles_extracted = 0
-            
-            for (subj, tsk, step), group in groups:
-                group_len = len(group)
-                if group_len % 150 == 0 and group_len >= 150:  # Valid cycle(s)
-                    valid_groups += 1
-                    n_cycles = group_len // 150
-                    
-                    # Extract feature data and reshape to cycles
-                    group_data = group[features].values
-                    try:
-                        # Reshape to separate individual cycles
-                        cycles_data = group_data.reshape(n_cycles, 150, len(features))
-                        
-                        # Add each cycle individually
-                        for cycle_idx in range(n_cycles):
-                            cycles_list.append(cycles_data[cycle_idx])
-                            total_cycles_extracted += 1
-                            
-                    except ValueError as e:
-                        # Log reshape errors for debugging
-                        print(f"⚠️  Reshape error for {subj}-{tsk}-{step}: {group_len} points, {len(features)} features - {e}")
-            
-            # Log extraction statistics
-            print(f"    Cycle extraction: {valid_groups}/{total_groups} valid groups, {total_cycles_extracted} total cycles")
-            
-            if cycles_list:
-                cycles_3d = np.stack(cycles_list, axis=0)
-                return cycles_3d, features
-            else:
-                return np.array([]).reshape(0, 150, len(features)), features
+            loco_data = LocomotionData(dataset_path, phase_col=phase_col)
         
-        loco_data.get_tasks = get_tasks
-        loco_data.get_cycles = get_cycles
+        # Number strides the way the velocity check and failure histogram do
+        self._order_strides_by_group(loco_data)
         
         self._log_memory("optimized_load_complete", f"Optimized LocomotionData created")
         
         return loco_data
     
+    @staticmethod
+    def _order_strides_by_group(locomotion_data: LocomotionData, points_per_cycle: int = 150) -> None:
+        """
+        Reorder rows into sorted (subject, task, step) groups, in place.
+        
+        ``get_cycles`` then numbers each task's strides by sorted (subject,
+        step) group, matching ``validate_velocity_consistency`` and
+        ``create_subject_failure_histogram``, whatever the file's row order.
+        Groups whose length is not a multiple of ``points_per_cycle`` are
+        dropped, so a malformed group does not void the whole task.
+        
+        Args:
+            locomotion_data: Dataset loaded for the report
+            points_per_cycle: Rows per stride
+        """
+        df = locomotion_data.df
+        if 'step' not in df.columns:
+            return
+        
+        keys = [locomotion_data.subject_col, locomotion_data.task_col, 'step']
+        group_ids = df.groupby(keys, observed=True, sort=True).ngroup().to_numpy()
+        keyed = group_ids >= 0
+        positions = np.flatnonzero(keyed)
+        group_ids = group_ids[keyed]
+        sizes = np.bincount(group_ids) if group_ids.size else np.empty(0, dtype=np.intp)
+        whole = (sizes > 0) & (sizes % points_per_cycle == 0)
+        
+        # Rows ordered by group, keeping file order within each group
+        order = np.argsort(group_ids, kind='stable')
+        rows = positions[order][whole[group_ids[order]]]
+        if len(rows) == len(df) and np.array_equal(rows, np.arange(len(df))):
+            return
+        # Row labels are kept so lazily loaded columns still align
+        locomotion_data.df = df.iloc[rows]
+    
+    def _should_stream_validation(self, dataset_path: str) -> bool:
+        """
+        Decide whether to validate in streaming mode.
+
+        Streams when the decoded size of the parquet file exceeds half of the
+        currently available memory, so validation alone cannot trip the
+        memory circuit breaker.
+        """
+        if not PSUTIL_AVAILABLE:
+            return False
+
+        try:
+            import pyarrow.parquet as pq
+
+            metadata = pq.ParquetFile(dataset_path).metadata
+            decoded_bytes = sum(
+                metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups)
+            )
+            return decoded_bytes > psutil.virtual_memory().available * 0.5
+        except Exception:
+            return False
+
+    def _validate_dataset(self, dataset_path: str) -> Dict:
+        """Run validation, streaming the file if it is too large to load."""
+        streaming = self._should_stream_validation(dataset_path)
+        if streaming:
+            print("📊 Dataset larger than available memory allows - validating in streaming mode")
+            self._log_memory("streaming_validation", "Validating parquet record batches")
+        return self.validator.validate(dataset_path, streaming=streaming)
+
     def _calculate_file_hash(self, file_path: Path) -> str:
         """
         Calculate SHA256 hash of file contents.
@@ -474,7 +479,7 @@ class ValidationReportGenerator:
             self._log_memory("archive_complete", "Validation ranges archived")
             
             # Run validation
-            validation_result = self.validator.validate(dataset_path)
+            validation_result = self._validate_dataset(dataset_path)
             self._log_memory("validation_complete", f"Dataset validation completed")
             print(f"📊 Post-validation memory: {self._get_memory_summary()}")
             
@@ -579,13 +584,13 @@ class ValidationReportGenerator:
                         print(f"  ✅ Validation plot saved: {Path(plot_path).name}")
                     
                     # Generate subject failure histogram (uses minimal memory)
-                    biomechanical_failing_features = self.validator._validate_task_with_failing_features(task_locomotion_data, task)
+                    biomechanical_failing_features = self.validator.task_stride_mask(task_locomotion_data, task)
                     velocity_failing_features = self._get_velocity_failures_for_task(task_locomotion_data, task, velocity_results)
                     merged_failures = self._merge_failure_types(biomechanical_failing_features, velocity_failing_features)
                     
-                    if merged_failures:
+                    legacy_failures = self._convert_merged_failures_to_legacy_format(merged_failures)
+                    if legacy_failures:
                         print(f"  Generating failure histogram...")
-                        legacy_failures = self._convert_merged_failures_to_legacy_format(merged_failures)
                         histogram_path = create_subject_failure_histogram(
                             locomotion_data=task_locomotion_data,
                             task_name=task,
@@ -694,11 +699,11 @@ class ValidationReportGenerator:
                 self._log_memory("plot_batches_cleanup", "Intermediate batches cleaned up")
                 
                 # Get validation information
-                biomechanical_failing_features = self.validator._validate_task_with_failing_features(task_locomotion_data, task)
+                biomechanical_failing_features = self.validator.task_stride_mask(task_locomotion_data, task)
                 velocity_failing_features = self._get_velocity_failures_for_task(task_locomotion_data, task, velocity_results)
                 merged_failures = self._merge_failure_types(biomechanical_failing_features, velocity_failing_features)
                 
-                print(f"    Found {len(merged_failures)} failing strides")
+                print(f"    Found {(merged_failures['biomechanical'] | merged_failures['velocity']).count()} failing strides")
                 
                 # Get task validation data
                 task_validation_data = self.validator.config_manager.get_task_data(task) if self.validator.config_manager.has_task(task) else {}
@@ -741,9 +746,12 @@ class ValidationReportGenerator:
             gc.collect()
             return None
     
-    def _get_velocity_failures_for_task(self, locomotion_data: LocomotionData, task: str, velocity_results: Dict) -> Dict[int, List[str]]:
+    def _get_velocity_failures_for_task(self, locomotion_data: LocomotionData, task: str, velocity_results: Dict) -> StrideMask:
         """
-        Extract velocity failing features for a specific task.
+        Extract velocity failures for a specific task.
+        
+        Strides are numbered per task over the (subject, step) groups in sorted
+        order, each group contributing ``len(group) // 150`` strides.
         
         Args:
             locomotion_data: LocomotionData instance
@@ -751,86 +759,48 @@ class ValidationReportGenerator:
             velocity_results: Results from validate_velocity_consistency
             
         Returns:
-            Dictionary mapping stride indices to list of failed velocity variables
+            StrideMask over the velocity variables with failing strides
         """
-        velocity_failing_features = {}
-        
-        # Filter for task data to build stride mapping
         task_data = locomotion_data.df[locomotion_data.df['task'] == task]
+        group_sizes = task_data.groupby(['subject', 'step'], observed=True, sort=True).size()
+        n_strides = int((group_sizes.to_numpy() // 150).sum())
         
-        # Build mapping from global stride index to task-local stride index
-        stride_idx = 0
-        for subject in sorted(task_data['subject'].unique()):
-            subject_data = task_data[task_data['subject'] == subject]
-            for step in sorted(subject_data['step'].unique()):
-                step_data = subject_data[subject_data['step'] == step]
-                n_cycles = len(step_data) // 150  # 150 points per cycle
-                
-                # Each step can have multiple cycles
-                for cycle in range(n_cycles):
-                    # Check if this stride failed any velocity variables
-                    failed_velocities = []
-                    
-                    for vel_var, result in velocity_results.items():
-                        if 'failing_strides' in result:
-                            if stride_idx in result['failing_strides']:
-                                failed_velocities.append(vel_var)
-                    
-                    if failed_velocities:
-                        velocity_failing_features[stride_idx] = failed_velocities
-                    
-                    stride_idx += 1
-        
-        return velocity_failing_features
+        velocity_failures = {
+            vel_var: result['failing_strides']
+            for vel_var, result in velocity_results.items()
+            if isinstance(result, dict) and 'failing_strides' in result
+        }
+        return StrideMask.from_stride_indices(velocity_failures, n_strides)
     
-    def _merge_failure_types(self, biomechanical_failures: Dict[int, List[str]], 
-                           velocity_failures: Dict[int, List[str]]) -> Dict[int, Dict[str, List[str]]]:
+    def _merge_failure_types(self, biomechanical_failures: StrideMask,
+                           velocity_failures: StrideMask) -> Dict[str, StrideMask]:
         """
         Merge biomechanical and velocity failures while preserving failure type information.
         
         Args:
-            biomechanical_failures: Dict mapping stride indices to failed biomechanical variables
-            velocity_failures: Dict mapping stride indices to failed velocity variables
+            biomechanical_failures: Biomechanical range failures of the task's strides
+            velocity_failures: Velocity consistency failures of the task's strides
             
         Returns:
-            Dictionary with structure: {stride_idx: {'biomechanical': [...], 'velocity': [...]}}
+            ``{'biomechanical': mask, 'velocity': mask}`` with equal stride counts
         """
-        merged_failures = {}
-        
-        # Get all stride indices that failed either type of validation
-        all_failed_strides = set(biomechanical_failures.keys()) | set(velocity_failures.keys())
-        
-        for stride_idx in all_failed_strides:
-            merged_failures[stride_idx] = {
-                'biomechanical': biomechanical_failures.get(stride_idx, []),
-                'velocity': velocity_failures.get(stride_idx, [])
-            }
-        
-        return merged_failures
+        return {
+            'biomechanical': biomechanical_failures,
+            'velocity': velocity_failures.resize(biomechanical_failures.n_strides),
+        }
     
-    def _convert_merged_failures_to_legacy_format(self, merged_failures: Dict[int, Dict[str, List[str]]]) -> Dict[int, List[str]]:
+    def _convert_merged_failures_to_legacy_format(self, merged_failures: Dict[str, StrideMask]) -> Dict[int, List[str]]:
         """
-        Convert merged failure structure back to legacy format for backward compatibility.
+        Convert merged failure masks to the legacy format for backward compatibility.
         
         Args:
-            merged_failures: Dict with structure {stride_idx: {'biomechanical': [...], 'velocity': [...]}}
+            merged_failures: ``{'biomechanical': mask, 'velocity': mask}``
             
         Returns:
             Dict with structure {stride_idx: [all_failed_variables]} (legacy format)
         """
-        legacy_failures = {}
-        
-        for stride_idx, failure_types in merged_failures.items():
-            all_failed_variables = []
-            
-            # Combine biomechanical and velocity failures
-            all_failed_variables.extend(failure_types.get('biomechanical', []))
-            all_failed_variables.extend(failure_types.get('velocity', []))
-            
-            if all_failed_variables:
-                legacy_failures[stride_idx] = all_failed_variables
-        
-        return legacy_failures
+        combined = merged_failures['biomechanical'] | merged_failures['velocity']
+        return combined.to_failing_features()
     
     def _generate_comparison_plots(self, dataset_path: str, timestamp: str) -> None:
         """
@@ -869,7 +839,7 @@ class ValidationReportGenerator:
                 )
                 
                 # Get failing features for filtering (integrated validation)
-                biomechanical_failing_features = self.validator._validate_task_with_failing_features(locomotion_data, task)
+                biomechanical_failing_features = self.validator.task_stride_mask(locomotion_data, task)
                 velocity_failing_features = self._get_velocity_failures_for_task(locomotion_data, task, velocity_results)
                 merged_failures = self._merge_failure_types(biomechanical_failing_features, velocity_failing_features)
                 
@@ -907,19 +877,24 @@ class ValidationReportGenerator:
         
         return violations[task]
     
-    def validate_velocity_consistency(self, df: pd.DataFrame) -> Dict[str, Dict]:
+    def validate_velocity_consistency(self, df: pd.DataFrame,
+                                      chunk_strides: int = VELOCITY_CHUNK_STRIDES) -> Dict[str, Dict]:
         """
         Validate that velocities match angles using chain rule: dθ/dt = (dθ/dφ) × (dφ/dt)
-        Memory optimized version that processes velocity variables one at a time.
+        
+        All angle/velocity pairs are checked together on (strides, 150, pairs)
+        blocks of at most ``chunk_strides`` strides, so peak memory does not
+        grow with the dataset. Strides are the (subject, task, step) groups in
+        sorted order; groups without exactly 150 rows are skipped but keep
+        their position in the stride numbering.
         
         Args:
             df: DataFrame with phase-indexed data including phase_ipsi_dot
+            chunk_strides: Strides extracted and reduced per block
             
         Returns:
             Dictionary with consistency results for each velocity variable
         """
-        import numpy as np
-        import gc
         from locohub.feature_constants import (
             ANGLE_FEATURES, VELOCITY_FEATURES,
             SEGMENT_ANGLE_FEATURES, SEGMENT_VELOCITY_FEATURES
@@ -950,68 +925,64 @@ class ValidationReportGenerator:
         
         print(f"Validating {len(angle_velocity_pairs)} velocity variables...")
         
-        # Process each velocity variable with progress tracking
-        for i, (angle_col, velocity_col) in enumerate(angle_velocity_pairs, 1):
-            print(f"  Processing {i}/{len(angle_velocity_pairs)}: {velocity_col}")
-            
-            # Check memory before processing each variable
-            try:
-                self._log_memory("velocity_variable", f"Processing {velocity_col}")
-            except MemoryError as e:
-                print(f"💥 Velocity validation aborted due to memory limit: {e}")
-                results[velocity_col] = {'status': 'memory_limit_exceeded', 'message': str(e)}
-                break
+        try:
+            self._log_memory("velocity_validation", f"Checking {len(angle_velocity_pairs)} velocity variables")
+        except MemoryError as e:
+            print(f"💥 Velocity validation aborted due to memory limit: {e}")
+            if angle_velocity_pairs:
+                results[angle_velocity_pairs[0][1]] = {'status': 'memory_limit_exceeded', 'message': str(e)}
+            return results
+        
+        # Pairs whose stored velocity can be compared
+        compared_pairs = [
+            (angle_col, velocity_col) for angle_col, velocity_col in angle_velocity_pairs
+            if angle_col in df.columns and velocity_col in df.columns
+        ]
+        angle_cols = [angle_col for angle_col, _ in compared_pairs]
+        velocity_cols = [velocity_col for _, velocity_col in compared_pairs]
+        
+        stride_ids, stride_rows = self._stride_rows(df)
+        stride_count = len(stride_ids)
+        n_pairs = len(compared_pairs)
+        
+        if n_pairs and stride_count:
+            column_positions = df.columns.get_indexer(['phase_ipsi_dot'] + angle_cols + velocity_cols)
+            mae = np.empty((stride_count, n_pairs))
+            compared = np.empty((stride_count, n_pairs), dtype=bool)
+            for start in range(0, stride_count, chunk_strides):
+                stop = min(start + chunk_strides, stride_count)
+                try:
+                    self._log_memory("velocity_chunk", f"Strides {start}-{stop} of {stride_count}")
+                except MemoryError as e:
+                    print(f"💥 Velocity validation aborted due to memory limit: {e}")
+                    results[velocity_cols[0]] = {'status': 'memory_limit_exceeded', 'message': str(e)}
+                    return results
                 
+                # Select the block's rows before converting to float
+                block_rows = stride_rows[start:stop].ravel()
+                tensor = df.iloc[block_rows, column_positions].to_numpy(dtype=float)
+                tensor = tensor.reshape(stop - start, 150, len(column_positions))
+                mae[start:stop], compared[start:stop] = self._velocity_errors(tensor, n_pairs)
+                del tensor
+        
+        pair_column = {velocity_col: idx for idx, velocity_col in enumerate(velocity_cols)}
+        
+        for angle_col, velocity_col in angle_velocity_pairs:
             if angle_col not in df.columns:
                 results[velocity_col] = {'status': 'angle_missing', 'message': f'Angle column {angle_col} not found'}
                 continue
             
-            errors = []
-            stride_count = 0
+            errors = np.empty(0)
             failing_stride_indices = []  # Track which strides failed velocity validation
-            
-            # Process each stride
-            for stride_idx, ((subject, task, step), stride_df) in enumerate(df.groupby(['subject', 'task', 'step'])):
-                if len(stride_df) != 150:
-                    continue
-                
-                stride_count += 1
-                phase_dot = stride_df['phase_ipsi_dot'].iloc[0]  # Constant for stride
-                
-                # Calculate expected velocity from angle using chain rule
-                angle_data = stride_df[angle_col].values
-                
-                # Skip if all NaN
-                if np.all(np.isnan(angle_data)):
-                    continue
-                
-                # Calculate gradient with respect to index
-                dangle_dindex = np.gradient(angle_data)
-                
-                # Convert to per-phase-percent (150 points = 100%)
-                dangle_dphase = dangle_dindex * (100 / 150)
-                
-                # Apply chain rule: dθ/dt = (dθ/dφ) × (dφ/dt)
-                expected_velocity = dangle_dphase * phase_dot
-                
-                # Check if stored velocity exists
-                if velocity_col in stride_df.columns:
-                    stored_velocity = stride_df[velocity_col].values
-                    
-                    # Skip if stored velocity is all NaN
-                    if not np.all(np.isnan(stored_velocity)):
-                        # Calculate mean absolute error
-                        valid_mask = ~(np.isnan(expected_velocity) | np.isnan(stored_velocity))
-                        if np.any(valid_mask):
-                            mae = np.mean(np.abs(expected_velocity[valid_mask] - stored_velocity[valid_mask]))
-                            errors.append(mae)
-                            
-                            # Check if this stride fails velocity validation
-                            if mae >= 0.5:  # Using same threshold as before
-                                failing_stride_indices.append(stride_idx)
+            idx = pair_column.get(velocity_col)
+            if idx is not None and stride_count:
+                errors = mae[compared[:, idx], idx]
+                # Using same threshold as before
+                failing = compared[:, idx] & (mae[:, idx] >= 0.5)
+                failing_stride_indices = stride_ids[failing].tolist()
             
             # Determine pass/fail (threshold: 0.5 rad/s mean error)
-            if errors:
+            if errors.size:
                 mean_error = np.mean(errors)
                 max_error = np.max(errors)
                 std_error = np.std(errors)
@@ -1028,7 +999,7 @@ class ValidationReportGenerator:
                     'failing_strides': failing_stride_indices  # Track failing stride indices
                 }
                 status_symbol = "✅" if mean_error < 0.5 else "❌"
-                print(f"    {status_symbol} {results[velocity_col]['status'].upper()}: {len(failing_stride_indices)} failing strides")
+                print(f"  {status_symbol} {velocity_col} {results[velocity_col]['status'].upper()}: {len(failing_stride_indices)} failing strides")
             else:
                 results[velocity_col] = {
                     'status': 'calculated_only',
@@ -1036,14 +1007,78 @@ class ValidationReportGenerator:
                     'total_strides': stride_count,
                     'failing_strides': []  # Empty list for consistency
                 }
-                print(f"    ⚠️  CALCULATED_ONLY: No stored velocities to compare")
-            
-            # Memory cleanup after each variable
-            gc.collect()
+                print(f"  ⚠️  {velocity_col} CALCULATED_ONLY: No stored velocities to compare")
         
         print(f"Velocity validation completed: {len(results)} variables processed")
         return results
     
+    @staticmethod
+    def _velocity_errors(tensor: np.ndarray, n_pairs: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per-stride mean absolute velocity error of a block of strides.
+        
+        Args:
+            tensor: (n_strides, 150, 1 + 2 * n_pairs) array holding
+                phase_ipsi_dot, the angles, then the stored velocities
+            n_pairs: Number of angle/velocity pairs
+            
+        Returns:
+            Tuple of (mae, compared), both (n_strides, n_pairs); strides with
+            an all-NaN angle or stored velocity are not compared
+        """
+        phase_dot = tensor[:, 0, 0]  # Constant for stride
+        angle_data = tensor[:, :, 1:1 + n_pairs]
+        stored_velocity = tensor[:, :, 1 + n_pairs:]
+        
+        # Calculate gradient with respect to index, convert to per-phase-percent
+        # (150 points = 100%) and apply chain rule: dθ/dt = (dθ/dφ) × (dφ/dt)
+        dangle_dphase = np.gradient(angle_data, axis=1) * (100 / 150)
+        expected_velocity = dangle_dphase * phase_dot[:, None, None]
+        
+        # Mean absolute error over points where both velocities are defined
+        valid_mask = ~(np.isnan(expected_velocity) | np.isnan(stored_velocity))
+        n_valid = valid_mask.sum(axis=1)
+        abs_error = np.where(valid_mask, np.abs(expected_velocity - stored_velocity), 0.0)
+        # Reduce over a contiguous phase axis so fully valid strides sum in
+        # the same order as np.mean over one stride
+        abs_error = np.ascontiguousarray(abs_error.transpose(0, 2, 1))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mae = abs_error.sum(axis=2) / n_valid
+        
+        compared = (
+            ~np.isnan(angle_data).all(axis=1)
+            & ~np.isnan(stored_velocity).all(axis=1)
+            & (n_valid > 0)
+        )
+        return mae, compared
+    
+    @staticmethod
+    def _stride_rows(df: pd.DataFrame, points_per_cycle: int = 150) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Locate the rows of the complete (subject, task, step) strides of a DataFrame.
+        
+        Args:
+            df: Phase-indexed DataFrame
+            points_per_cycle: Rows a stride must have to be included
+            
+        Returns:
+            Tuple of (stride_ids, rows): the ordinal of each included stride
+            among all groups in sorted key order, and the positional rows of
+            each stride, shape (n_strides, points_per_cycle)
+        """
+        group_ids = df.groupby(['subject', 'task', 'step'], observed=True, sort=True).ngroup()
+        keyed = group_ids.notna().to_numpy()
+        positions = np.flatnonzero(keyed)
+        group_ids = group_ids.to_numpy()[keyed].astype(np.intp)
+        
+        # Rows ordered by group, keeping file order within each group
+        order = np.argsort(group_ids, kind='stable')
+        sizes = np.bincount(group_ids) if group_ids.size else np.empty(0, dtype=np.intp)
+        stride_ids = np.flatnonzero(sizes == points_per_cycle)
+        
+        rows = positions[order][sizes[group_ids[order]] == points_per_cycle]
+        return stride_ids, rows.reshape(len(stride_ids), points_per_cycle)
+    
     def _map_step_violations_to_cycles(self, step_violations: Dict[str, List[int]], 
                                       data: pd.DataFrame, task: str) -> Dict[str, List[int]]:
         """
@@ -1298,7 +1333,7 @@ class ValidationReportGenerator:
         self.ranges_archive_path, self.ranges_hash = self._archive_ranges_file(dataset_name, timestamp)
         
         # Run validation
-        validation_result = self.validator.validate(dataset_path)
+        validation_result = self._validate_dataset(dataset_path)
         
         # Generate plots if requested
         plot_paths = {}
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Validation session: one dataset load shared by summary, statistics and plots.
+
+``quick_validation_check`` used to load the parquet file separately for task
+discovery, validation, per-task statistics and plotting, and re-validated every
+task before plotting it.  A ``ValidationSession`` loads the dataset once, runs
+the validator once, and serves everything else from that shared state,
+including the per-phase below/above table the validator builds during its
+range check.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from locohub import LocomotionData
+
+from ..stride_mask import StrideMask
+from .validator import PhaseViolationStats, Validator
+
+PhaseStats = Dict[str, Dict[int, Dict[str, int]]]
+
+
+class ValidationSession:
+    """
+    Validate a dataset once and derive reports and plot inputs from the result.
+
+    Args:
+        dataset_path: Path to phase-indexed parquet file
+        validator: Validator holding the ranges to check against
+        ignore_features: Optional feature names excluded from validation
+        workers: Number of worker processes used by the validator
+    """
+
+    def __init__(self, dataset_path: Union[str, Path], validator: Validator,
+                 ignore_features: Optional[List[str]] = None, workers: int = 1):
+        self.dataset_path = Path(dataset_path)
+        self.validator = validator
+        self.ignore_features = ignore_features
+        self.workers = workers
+        self.locomotion_data = LocomotionData(self.dataset_path, phase_col='phase_ipsi')
+        self._result: Optional[Dict[str, Any]] = None
+        self._phase_stats: Dict[str, PhaseStats] = {}
+
+    @property
+    def tasks(self) -> List[str]:
+        """Tasks present in the dataset."""
+        return self.locomotion_data.get_tasks()
+
+    @property
+    def result(self) -> Dict[str, Any]:
+        """Validation result in the layout of ``Validator.validate``; computed once."""
+        if self._result is None:
+            result = self.validator.validate_dataset(
+                locomotion_data=self.locomotion_data,
+                ignore_features=self.ignore_features,
+                workers=self.workers,
+                include_phase_stats=True,
+            )
+            result['stats']['dataset'] = self.dataset_path.stem
+            self._result = result
+        return self._result
+
+    def total_strides(self, task: str) -> int:
+        """Number of strides of a task, whether or not it has ranges."""
+        task_result = self.result['tasks'].get(task)
+        if task_result and task_result['total_strides']:
+            return task_result['total_strides']
+        rows = self.locomotion_data.get_row_selection(None, task)
+        if rows is None:
+            return 0
+        n_points = rows.stop - rows.start if isinstance(rows, slice) else len(rows)
+        return n_points // self.locomotion_data.POINTS_PER_CYCLE
+
+    def failing_features(self, task: str) -> Dict[int, List[str]]:
+        """Failing variable names per stride, as used by the plotting code."""
+        task_result = self.result['tasks'].get(task, {})
+        return task_result.get('failing_strides_map', {})
+
+    def stride_mask(self, task: str) -> StrideMask:
+        """Strides x validated variables failure mask of a task."""
+        task_result = self.result['tasks'].get(task, {})
+        return task_result.get('stride_mask', StrideMask([], self.total_strides(task)))
+
+    def phase_stats(self, task: str) -> PhaseStats:
+        """
+        Below/above counts per violated check, from the validator's phase table.
+
+        Returns:
+            ``{feature: {phase_pct: {'below': n, 'above': n}}}``
+        """
+        if task not in self._phase_stats:
+            stats: PhaseStats = {}
+            for row in self.phase_table(task):
+                stats.setdefault(row.variable, {})[row.phase] = {'below': row.n_below, 'above': row.n_above}
+            self._phase_stats[task] = stats
+        return self._phase_stats[task]
+
+    def phase_table(self, task: str) -> List[PhaseViolationStats]:
+        """Per-(phase, variable) violation table of a task (see ``PhaseViolationStats``)."""
+        return self.result['tasks'].get(task, {}).get('phase_stats', [])
+
+    def plot_inputs(self, task: str) -> Tuple[Optional[np.ndarray], List[str], StrideMask, Dict]:
+        """Return (data_3d, feature_names, stride_mask, task_config) for plotting."""
+        data_3d, feature_names = self.locomotion_data.get_cycles(subject=None, task=task)
+        task_config = self.validator.config_manager.get_task_data(task)
+        return data_3d, feature_names, self.stride_mask(task), task_config
+
+    def task_statistics(self) -> Dict[str, Dict[str, object]]:
+        """Collect per-task stride and feature statistics for reporting."""
+        task_details: Dict[str, Dict[str, object]] = {}
+        result = self.result
+        if result.get('mode', 'phase') != 'phase':
+            return task_details
+
+        dataset_tasks = set(self.tasks)
+        all_tasks = sorted(dataset_tasks | set(result.get('violations', {})))
+
+        for task in all_tasks:
+            total_strides = self.total_strides(task) if task in dataset_tasks else 0
+            violations = result.get('violations', {}).get(task, {})
+
+            failing_stride_indices: Set[int] = set()
+            for indices in violations.values():
+                failing_stride_indices.update(indices)
+
+            failing_strides = len(failing_stride_indices)
+            pass_rate = 1.0
+            if total_strides > 0:
+                pass_rate = max(0.0, 1.0 - (failing_strides / total_strides))
+
+            feature_phase_stats = self.phase_stats(task) if total_strides > 0 else {}
+
+            feature_failures = []
+            for feature, indices in violations.items():
+                unique_indices = len(set(indices))
+                failed_percentage = (unique_indices / total_strides) if total_strides else 0.0
+
+                phase_breakdown = [
+                    {'phase': phase_pct, 'below': counts['below'], 'above': counts['above']}
+                    for phase_pct, counts in feature_phase_stats.get(feature, {}).items()
+                ]
+                phase_breakdown.sort(key=lambda item: item['below'] + item['above'], reverse=True)
+
+                feature_failures.append({
+                    'feature': feature,
+                    'failed_strides': unique_indices,
+                    'failed_percentage': failed_percentage,
+                    'phase_breakdown': phase_breakdown
+                })
+
+            feature_failures.sort(key=lambda item: item['failed_strides'], reverse=True)
+
+            task_details[task] = {
+                'total_strides': total_strides,
+                'failing_strides': failing_strides,
+                'pass_rate': pass_rate,
+                'feature_failures': feature_failures
+            }
+
+        return task_details
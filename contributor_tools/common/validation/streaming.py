@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Streaming (out-of-core) range validation of phase-indexed parquet files.
+
+``Validator.validate`` builds a ``LocomotionData`` holding the whole dataset,
+which does not fit in memory for the largest exports.  This module reads the
+file in record batches of at most ``batch_rows`` rows and only the columns
+that have ranges.  Each task's rows are cut into 150-point strides in file
+order; a partial stride at the end of a batch is carried into the next batch.
+Violation counters are updated one batch at a time, so memory stays bounded by
+the batch size plus the (usually small) failure records.
+
+Results have the layout of ``Validator.validate``: strides are numbered per
+task in file order, as ``LocomotionData.get_cycles`` does, and the phase gate
+is the same task row-count check.  Row counts per (subject, task[, step]) are
+summed batch by batch for the ``group_length`` warnings; the per-stride
+``mixed_stride`` and ``phase_order`` warnings need the whole index in memory
+and are only reported by the in-memory validator.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from locohub import LocomotionData
+
+from ..stride_mask import StrideMask
+from .validator import TaskValidationDetails, ValidationPlan, Validator, _plain, _violation_summary
+
+POINTS_PER_CYCLE = 150
+
+# Rows per record batch; 500 strides of a 200-feature dataset is ~120 MB
+DEFAULT_BATCH_ROWS = POINTS_PER_CYCLE * 500
+
+
+class _TaskAccumulator:
+    """Running validation state of one task."""
+
+    def __init__(self, plan: ValidationPlan):
+        self.plan = plan
+        self.check_arrays = (plan.phase_idx, plan.mins, plan.maxs, plan.check_rank)
+        self.carry: Optional[np.ndarray] = None
+        self.n_strides = 0
+        self.failing_features: Dict[int, List[str]] = {}
+        self.per_variable_failures: Dict[str, List[int]] = {var: [] for var in plan.validated_variables}
+        self.passing: List[np.ndarray] = []
+        self.masks: List[StrideMask] = []
+
+    def add_rows(self, values: np.ndarray, validator: Validator) -> None:
+        """Validate the complete strides in ``values`` (rows x validated variables)."""
+        if self.carry is not None:
+            values = np.concatenate([self.carry, values])
+        n_complete = len(values) // POINTS_PER_CYCLE
+        split = n_complete * POINTS_PER_CYCLE
+        self.carry = values[split:].copy() if split < len(values) else None
+        if n_complete == 0:
+            return
+
+        data_3d = values[:split].reshape(n_complete, POINTS_PER_CYCLE, values.shape[1])
+        fail_counts, first_rank = _violation_summary(data_3d, *self.check_arrays)
+        details = validator._details_from_summary(
+            self.plan, self.plan.validated_variables, fail_counts, first_rank
+        )
+
+        offset = self.n_strides
+        for stride_idx, names in details.failing_features.items():
+            self.failing_features[offset + stride_idx] = names
+        for var_name, indices in details.per_variable_failures.items():
+            self.per_variable_failures[var_name].extend(idx + offset for idx in indices)
+        self.passing.append(np.flatnonzero(fail_counts.any(axis=1) == 0) + offset)
+        self.masks.append(details.stride_mask)
+        self.n_strides += n_complete
+
+    @property
+    def complete(self) -> bool:
+        """Whether the task's rows formed whole strides."""
+        return self.carry is None
+
+    def details(self) -> TaskValidationDetails:
+        passing = np.concatenate(self.passing) if self.passing else np.empty(0, dtype=np.intp)
+        return TaskValidationDetails(
+            failing_features=self.failing_features,
+            per_variable_failures=self.per_variable_failures,
+            total_strides=self.n_strides,
+            validated_variables=list(self.plan.validated_variables),
+            global_passing_strides=set(passing.tolist()),
+            phase_indices=dict(self.plan.phase_indices),
+            stride_mask=StrideMask.concatenate(self.masks),
+        )
+
+
+def validate_parquet_streaming(
+    validator: Validator,
+    dataset_path: Union[str, Path],
+    ignore_features: Optional[List[str]] = None,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    task_col: str = 'task',
+    subject_col: str = 'subject',
+) -> Dict[str, Any]:
+    """
+    Validate a phase-indexed parquet file without loading it into memory.
+
+    Args:
+        validator: Validator holding the ranges to check against
+        dataset_path: Path to phase-indexed parquet file
+        ignore_features: Optional feature names excluded from validation
+        batch_rows: Maximum rows read per record batch
+        task_col: Name of the task column
+        subject_col: Name of the subject column
+
+    Returns:
+        Validation result with the layout of ``Validator.validate``
+    """
+    import pyarrow.parquet as pq
+
+    dataset_path = Path(dataset_path)
+    parquet_file = pq.ParquetFile(dataset_path)
+    features = LocomotionData.feature_columns(parquet_file.schema_arrow.names, subject_col=subject_col,
+                                              task_col=task_col)
+    config_tasks = set(validator.config_manager.get_tasks())
+
+    plans: Dict[str, Optional[ValidationPlan]] = {}
+    for task in config_tasks:
+        plan = validator.get_validation_plan(task, features, ignore_features)
+        plans[task] = plan if plan is not None and plan.validated_variables else None
+    columns = sorted({var for plan in plans.values() if plan for var in plan.validated_variables})
+    column_position = {name: 1 + idx for idx, name in enumerate(columns)}
+    group_cols = [subject_col, task_col]
+    if 'step' in parquet_file.schema_arrow.names:
+        group_cols.append('step')
+    if subject_col not in parquet_file.schema_arrow.names:
+        group_cols = []
+    label_cols = [col for col in group_cols if col != task_col]
+
+    row_counts: Dict[str, int] = {}
+    group_sizes: List[pd.Series] = []
+    accumulators: Dict[str, _TaskAccumulator] = {}
+
+    read_columns = [task_col] + columns + label_cols
+    for batch in parquet_file.iter_batches(batch_size=batch_rows, columns=read_columns):
+        task_labels = batch.column(0).to_pandas()
+        task_codes, task_names = pd.factorize(task_labels)
+        if group_cols:
+            labels = {col: batch.column(len(columns) + 1 + idx).to_pandas()
+                      for idx, col in enumerate(label_cols)}
+            labels[task_col] = task_labels
+            group_sizes.append(pd.DataFrame(labels).groupby(group_cols, observed=True, sort=False).size())
+        order = np.argsort(task_codes, kind='stable')
+        bounds = np.searchsorted(task_codes[order], np.arange(len(task_names) + 1))
+        column_values: Dict[str, np.ndarray] = {}
+
+        for code, task in enumerate(task_names):
+            positions = order[bounds[code]:bounds[code + 1]]
+            row_counts[task] = row_counts.get(task, 0) + len(positions)
+            plan = plans.get(task)
+            if plan is None:
+                continue
+
+            for var_name in plan.validated_variables:
+                if var_name not in column_values:
+                    column = batch.column(column_position[var_name])
+                    column_values[var_name] = column.to_numpy(zero_copy_only=False).astype(float, copy=False)
+            values = np.column_stack([column_values[var][positions] for var in plan.validated_variables])
+
+            accumulator = accumulators.get(task)
+            if accumulator is None:
+                accumulator = accumulators[task] = _TaskAccumulator(plan)
+            accumulator.add_rows(values, validator)
+
+    # Task row counts gate the phase check; group row counts are warnings
+    phase_issues = [
+        {'task': task, 'subject': None, 'step': None, 'stride': None,
+         'n_points': row_counts[task], 'reason': 'task_length'}
+        for task in sorted(row_counts) if row_counts[task] % POINTS_PER_CYCLE != 0
+    ]
+    if group_sizes:
+        sizes = pd.concat(group_sizes).groupby(level=list(range(len(group_cols))), sort=True).sum()
+        for key, n_points in sizes[sizes % POINTS_PER_CYCLE != 0].items():
+            phase_issues.append({'task': key[1], 'subject': _plain(key[0]),
+                                 'step': _plain(key[2]) if len(key) > 2 else None,
+                                 'stride': None, 'n_points': int(n_points), 'reason': 'group_length'})
+    phase_valid, phase_msg = True, "Phase structure valid (150 points per cycle)"
+    if phase_issues and phase_issues[0]['reason'] == 'task_length':
+        phase_valid = False
+        phase_msg = f"Task '{phase_issues[0]['task']}' has {phase_issues[0]['n_points']} points, not divisible by 150"
+
+    tasks = [task for task in sorted(row_counts) if task in config_tasks]
+    task_details: Dict[str, TaskValidationDetails] = {}
+    for task in tasks:
+        accumulator = accumulators.get(task)
+        # Tasks that do not divide into whole strides are skipped, as get_cycles does
+        if accumulator is None or not accumulator.complete or accumulator.n_strides == 0:
+            task_details[task] = validator._empty_details()
+        else:
+            task_details[task] = accumulator.details()
+
+    return validator._assemble_result(
+        tasks,
+        task_details,
+        phase_valid,
+        phase_msg,
+        phase_issues=phase_issues,
+        features=features,
+        ignore_features=ignore_features,
+        dataset_name=dataset_path.stem,
+    )
@@ -6,22 +6,51 @@ Core validation functionality without unnecessary complexity.
 Focuses solely on checking if biomechanical data meets specifications.
 """
 
+import tempfile
 import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional, Any, Set
 
 # Import configuration manager (now in contributor_tools/common/)
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent.parent))
 from contributor_tools.common.config_manager import ValidationConfigManager
-from locohub import LocomotionData
+from contributor_tools.common.stride_mask import StrideMask
+from locohub import CycleCache, LocomotionData
 
 
 # ============================================================================
 # SIMPLIFIED VALIDATOR
 # ============================================================================
 
+@dataclass(eq=False)
+class PhaseViolationStats:
+    """Below/above-range summary of one violated (task, phase, variable) check.
+
+    Bounds are the ones the validator applies (swapped if configured as
+    max < min).  Stride indices index the task's ``get_cycles`` strides and
+    are ascending; the value arrays hold the offending values in that order.
+    """
+
+    task: str
+    phase: int
+    phase_index: int
+    variable: str
+    min: float
+    max: float
+    n_below: int
+    n_above: int
+    worst_deficit: float
+    worst_excess: float
+    below_strides: np.ndarray
+    above_strides: np.ndarray
+    below_values: np.ndarray
+    above_values: np.ndarray
+
+
 @dataclass
 class TaskValidationDetails:
     """Rich validation information for a single task."""
@@ -32,6 +61,49 @@ class TaskValidationDetails:
     validated_variables: List[str]
     global_passing_strides: Set[int]
     phase_indices: Dict[int, int]
+    phase_stats: List[PhaseViolationStats] = field(default_factory=list)
+    stride_mask: StrideMask = field(default_factory=lambda: StrideMask([], 0))
+
+
+@dataclass
+class PhaseStructureReport:
+    """Outcome of ``Validator.check_phase_structure``.
+
+    Each issue is a dict with task, subject, step, stride (``get_cycles``
+    index, None for row-count issues), n_points and reason.  ``valid`` can be
+    True while ``issues`` lists warnings (see ``strict_phase``).
+    """
+
+    valid: bool
+    message: str
+    issues: List[Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class ValidationPlan:
+    """Range checks of one task compiled against a dataset's feature layout.
+
+    Bound arrays have one row per checked phase and one column per entry of
+    ``validated_variables`` (the data_3d feature order); unchecked entries
+    are NaN.  Plans are shared through a cache, so the arrays are read-only.
+    """
+
+    task: str
+    phase_indices: Dict[int, int]
+    validated_variables: List[str]
+    phase_idx: np.ndarray
+    mins: np.ndarray
+    maxs: np.ndarray
+    check_rank: np.ndarray
+    phase_variable_checks: int
+
+
+# Compiled plans keyed by (ranges fingerprint, task, feature layout, ignored
+# features); shared by all Validator instances
+_PLAN_CACHE = CycleCache(max_entries=256)
+
+# Strides per process-pool job when validating in parallel
+DEFAULT_CHUNK_STRIDES = 20000
 
 
 class Validator:
@@ -47,7 +119,8 @@ class Validator:
     Supports arbitrary phase points defined in YAML configuration.
     """
     
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None,
+                 config_manager: Optional[ValidationConfigManager] = None):
         """
         Initialize validator with configuration.
         
@@ -55,21 +128,31 @@ class Validator:
             config_path: Optional path to config file or directory. 
                         If file, loads that specific config.
                         If directory or None, uses default config.
+            config_manager: Optional already loaded configuration; takes
+                        precedence over config_path
         """
-        if config_path and Path(config_path).is_file():
+        if config_manager is not None:
+            self.config_manager = config_manager
+        elif config_path and Path(config_path).is_file():
             # If it's a file, load it directly
             self.config_manager = ValidationConfigManager(config_path)
         else:
             # If it's a directory or None, use default behavior
             self.config_manager = ValidationConfigManager()
         
-    def validate(self, dataset_path: str, ignore_features: List[str] = None) -> Dict[str, Any]:
+    def validate(self, dataset_path: str, ignore_features: List[str] = None,
+                 workers: int = 1, streaming: bool = False) -> Dict[str, Any]:
         """
         Validate a dataset against specifications.
         
         Args:
             dataset_path: Path to phase-indexed parquet file
             ignore_features: Optional list of feature names to ignore during validation
+            workers: Number of worker processes (1 validates in-process)
+            streaming: Read the parquet file in record batches instead of
+                loading it (bounded memory for datasets larger than RAM;
+                ignores ``workers``).  The pass/fail verdict is the same;
+                per-stride phase warnings are not reported.
             
         Returns:
             Dictionary with validation results:
@@ -78,12 +161,17 @@ class Validator:
             - violations: Dict of violations by task and variable
             - stats: Summary statistics
         """
+        if streaming:
+            from .streaming import validate_parquet_streaming
+            return validate_parquet_streaming(self, dataset_path, ignore_features=ignore_features)
+
         # Load dataset with proper phase column name
         locomotion_data = LocomotionData(dataset_path, phase_col='phase_ipsi')
 
         result = self.validate_dataset(
             locomotion_data=locomotion_data,
-            ignore_features=ignore_features
+            ignore_features=ignore_features,
+            workers=workers
         )
 
         # Ensure dataset name is populated for compatibility
@@ -95,10 +183,30 @@ class Validator:
         locomotion_data: LocomotionData,
         ignore_features: Optional[List[str]] = None,
         task_filter: Optional[List[str]] = None,
+        workers: int = 1,
+        chunk_strides: int = DEFAULT_CHUNK_STRIDES,
+        include_phase_stats: bool = False,
+        strict_phase: bool = False,
     ) -> Dict[str, Any]:
-        """Validate a pre-loaded locomotion dataset against current ranges."""
+        """
+        Validate a pre-loaded locomotion dataset against current ranges.
 
-        phase_valid, phase_msg = self._validate_phase_structure(locomotion_data)
+        Args:
+            locomotion_data: Phase-indexed dataset
+            ignore_features: Optional feature names excluded from validation
+            task_filter: Optional subset of tasks to validate
+            workers: Number of worker processes; with more than one, tasks
+                (and stride chunks of large tasks) are validated on a process
+                pool.  Results are identical to the serial path.
+            chunk_strides: Maximum strides per worker job when parallel
+            include_phase_stats: Add each task's per-(phase, variable)
+                below/above table (list of PhaseViolationStats) under
+                ``'phase_stats'`` in its task entry
+            strict_phase: Fail the phase check on per-group and per-stride
+                layout issues too, not only on task row counts
+        """
+
+        phase_report = self.check_phase_structure(locomotion_data, strict_phase=strict_phase)
 
         tasks_in_data = locomotion_data.get_tasks()
         config_tasks = set(self.config_manager.get_tasks())
@@ -106,6 +214,45 @@ class Validator:
         if task_filter:
             tasks = [t for t in tasks if t in task_filter]
 
+        if workers > 1 and tasks:
+            task_details = self._validate_tasks_parallel(
+                locomotion_data, tasks, ignore_features, workers, chunk_strides,
+                include_phase_stats=include_phase_stats
+            )
+        else:
+            task_details = {
+                task: self._validate_task_details(
+                    locomotion_data, task, ignore_features=ignore_features,
+                    include_phase_stats=include_phase_stats
+                )
+                for task in tasks
+            }
+
+        return self._assemble_result(
+            tasks,
+            task_details,
+            phase_report.valid,
+            phase_report.message,
+            phase_issues=phase_report.issues,
+            features=locomotion_data.features,
+            ignore_features=ignore_features,
+            dataset_name=getattr(locomotion_data, 'data_path', Path('unknown')).stem,
+            include_phase_stats=include_phase_stats,
+        )
+
+    def _assemble_result(
+        self,
+        tasks: List[str],
+        task_details: Dict[str, TaskValidationDetails],
+        phase_valid: bool,
+        phase_msg: str,
+        phase_issues: List[Dict[str, Any]],
+        features: Optional[List[str]],
+        ignore_features: Optional[List[str]],
+        dataset_name: str,
+        include_phase_stats: bool = False,
+    ) -> Dict[str, Any]:
+        """Build the validation result dictionary from per-task details."""
         violations: Dict[str, Dict[str, List[int]]] = {}
         task_results: Dict[str, Dict[str, Any]] = {}
 
@@ -115,11 +262,7 @@ class Validator:
         total_failing_strides = 0
 
         for task in tasks:
-            details = self._validate_task_details(
-                locomotion_data,
-                task,
-                ignore_features=ignore_features
-            )
+            details = task_details[task]
 
             task_results[task] = {
                 'failing_strides_by_variable': {
@@ -131,7 +274,10 @@ class Validator:
                 'total_strides': details.total_strides,
                 'validated_variables': details.validated_variables,
                 'phase_indices': details.phase_indices,
+                'stride_mask': details.stride_mask,
             }
+            if include_phase_stats:
+                task_results[task]['phase_stats'] = details.phase_stats
 
             if details.per_variable_failures:
                 violations[task] = {
@@ -141,18 +287,13 @@ class Validator:
                 }
 
             total_strides += details.total_strides
-            total_failing_strides += details.total_strides - len(details.global_passing_strides)
+            total_failing_strides += details.stride_mask.count()
             total_violations += sum(len(indices) for indices in details.per_variable_failures.values())
 
-            # Determine how many variable/phase checks were executed for this task
-            task_ranges = self.config_manager.get_task_data(task)
-            phase_variable_checks = 0
+            # Number of variable/phase checks executed for this task
             if details.validated_variables:
-                for phase_ranges in task_ranges.values():
-                    for var_name in details.validated_variables:
-                        if var_name in phase_ranges:
-                            phase_variable_checks += 1
-            total_checks += details.total_strides * phase_variable_checks
+                plan = self.get_validation_plan(task, features, ignore_features)
+                total_checks += details.total_strides * plan.phase_variable_checks
 
         stride_pass_rate = (
             1.0 - (total_failing_strides / total_strides)
@@ -175,6 +316,7 @@ class Validator:
             'quality_gate_threshold': pass_rate_threshold,
             'phase_valid': phase_valid,
             'phase_message': phase_msg,
+            'phase_issues': phase_issues,
             'violations': violations,
             'tasks': task_results,
             'stats': {
@@ -185,7 +327,7 @@ class Validator:
                 'pass_rate': stride_pass_rate,
                 'variable_pass_rate': variable_pass_rate,
                 'num_tasks': len(tasks),
-                'dataset': getattr(locomotion_data, 'data_path', Path('unknown')).stem,
+                'dataset': dataset_name,
                 'pass_rate_threshold': pass_rate_threshold,
             },
             'mode': 'phase'
@@ -195,31 +337,113 @@ class Validator:
     
     def _validate_phase_structure(self, locomotion_data: LocomotionData) -> Tuple[bool, str]:
         """Check if all cycles have exactly 150 points."""
-        # Check each task to ensure proper phase structure
-        tasks = locomotion_data.get_tasks()
-        
-        for task in tasks:
-            task_data = locomotion_data.df[locomotion_data.df['task'] == task]
-            n_points = len(task_data)
-            
-            # Check if divisible by 150
-            if n_points % 150 != 0:
-                return False, f"Task '{task}' has {n_points} points, not divisible by 150"
-            
-            # Verify phase values if present
-            if 'phase' in task_data.columns:
-                # Group by cycle and check each has 150 points
-                n_cycles = n_points // 150
-                for cycle_idx in range(n_cycles):
-                    cycle_start = cycle_idx * 150
-                    cycle_end = (cycle_idx + 1) * 150
-                    cycle_data = task_data.iloc[cycle_start:cycle_end]
-                    
-                    if len(cycle_data) != 150:
-                        return False, f"Cycle {cycle_idx} in task '{task}' has {len(cycle_data)} points"
-        
-        return True, "Phase structure valid (150 points per cycle)"
-    
+        report = self.check_phase_structure(locomotion_data)
+        return report.valid, report.message
+
+    def check_phase_structure(
+        self,
+        locomotion_data: LocomotionData,
+        check_phase_order: bool = False,
+        strict_phase: bool = False,
+    ) -> PhaseStructureReport:
+        """
+        Check the stride layout of every task in one vectorized pass.
+
+        Checks, in order of severity:
+
+        - ``task_length``: a task's row count is not a multiple of 150
+        - ``group_length``: a (subject, task[, step]) group's row count is not
+          a multiple of 150
+        - ``mixed_stride``: a 150-row block (as cut by ``get_cycles``) holds
+          rows of more than one subject or step
+        - ``phase_order``: ``phase_ipsi`` is not strictly increasing within a
+          block (only with ``check_phase_order``)
+
+        Only ``task_length`` issues make the structure invalid; the others are
+        reported as warnings unless ``strict_phase`` is set.
+
+        Args:
+            locomotion_data: Phase-indexed dataset
+            check_phase_order: Also require increasing phase within each stride
+            strict_phase: Treat every issue, not only ``task_length``, as invalid
+
+        Returns:
+            PhaseStructureReport listing every offending task, group and stride
+        """
+        points = 150
+        df = locomotion_data.df
+        subject_col = locomotion_data.subject_col
+        group_cols = [subject_col, locomotion_data.task_col]
+        if 'step' in df.columns:
+            group_cols.append('step')
+
+        issues: List[Dict[str, Any]] = []
+        first_message = None
+
+        # Row-count checks from the (subject, task) index and one groupby
+        for task in locomotion_data.get_tasks():
+            rows = locomotion_data.get_row_selection(None, task)
+            n_points = rows.stop - rows.start if isinstance(rows, slice) else len(rows)
+            if n_points % points != 0:
+                issues.append({'task': task, 'subject': None, 'step': None, 'stride': None,
+                               'n_points': n_points, 'reason': 'task_length'})
+                if first_message is None:
+                    first_message = f"Task '{task}' has {n_points} points, not divisible by 150"
+
+        group_sizes = df.groupby(group_cols, observed=True, sort=True).size()
+        for key, n_points in group_sizes[group_sizes % points != 0].items():
+            issues.append({'task': key[1], 'subject': _plain(key[0]),
+                           'step': _plain(key[2]) if len(key) > 2 else None,
+                           'stride': None, 'n_points': int(n_points), 'reason': 'group_length'})
+
+        # Per-stride checks on the 150-row blocks of every whole task
+        label_codes = [pd.factorize(df[col])[0] for col in group_cols if col != locomotion_data.task_col]
+        phase = df[locomotion_data.phase_col].to_numpy(dtype=float) \
+            if check_phase_order and locomotion_data.phase_col in df.columns else None
+
+        for task in locomotion_data.get_tasks():
+            rows = locomotion_data.get_row_selection(None, task)
+            positions = np.arange(rows.start, rows.stop) if isinstance(rows, slice) else np.asarray(rows)
+            if len(positions) == 0 or len(positions) % points != 0:
+                continue
+            blocks = positions.reshape(-1, points)
+
+            mixed = np.zeros(len(blocks), dtype=bool)
+            for codes in label_codes:
+                block_codes = codes[blocks]
+                mixed |= (block_codes != block_codes[:, :1]).any(axis=1)
+
+            disordered = np.zeros(len(blocks), dtype=bool)
+            if phase is not None:
+                with np.errstate(invalid='ignore'):
+                    disordered = ~(np.diff(phase[blocks], axis=1) > 0).all(axis=1)
+
+            for reason, mask in (('mixed_stride', mixed), ('phase_order', disordered & ~mixed)):
+                for stride in np.flatnonzero(mask).tolist():
+                    first_row = blocks[stride, 0]
+                    issues.append({
+                        'task': task,
+                        'subject': _plain(df[subject_col].iat[first_row]),
+                        'step': _plain(df['step'].iat[first_row]) if 'step' in df.columns else None,
+                        'stride': stride,
+                        'n_points': points,
+                        'reason': reason,
+                    })
+
+        if first_message is None and not (strict_phase and issues):
+            return PhaseStructureReport(True, "Phase structure valid (150 points per cycle)", issues)
+
+        if first_message is None:
+            first = issues[0]
+            where = f"subject '{first['subject']}'"
+            if first['stride'] is not None:
+                where += f", stride {first['stride']}"
+            first_message = (
+                f"{len(issues)} stride structure issue(s); first: task '{first['task']}', "
+                f"{where} ({first['reason']})"
+            )
+        return PhaseStructureReport(False, first_message, issues)
+
     @staticmethod
     def _normalize_phase_key(phase_key: Any) -> Optional[int]:
         """Normalize a phase key from the config to an integer percentage."""
@@ -303,15 +527,105 @@ class Validator:
             ignore_features=ignore_features
         ).failing_features
 
-    def _validate_task_details(
+    def task_stride_mask(
         self,
         locomotion_data: LocomotionData,
         task_name: str,
         ignore_features: Optional[List[str]] = None
+    ) -> StrideMask:
+        """
+        Validate task data and return its strides x variables failure mask.
+
+        Args:
+            locomotion_data: The locomotion data object
+            task_name: Name of the task to validate
+            ignore_features: Optional list of feature names to ignore during validation
+
+        Returns:
+            StrideMask over the task's validated variables
+        """
+        return self._validate_task_details(
+            locomotion_data,
+            task_name,
+            ignore_features=ignore_features
+        ).stride_mask
+
+    def _validate_task_details(
+        self,
+        locomotion_data: LocomotionData,
+        task_name: str,
+        ignore_features: Optional[List[str]] = None,
+        include_phase_stats: bool = False
     ) -> TaskValidationDetails:
         """Return rich validation details for a specific task."""
 
-        empty_details = TaskValidationDetails(
+        prepared = self._prepare_task(locomotion_data, task_name, ignore_features)
+        if prepared is None:
+            return self._empty_details()
+        plan, data_3d, feature_names, check_arrays = prepared
+
+        if not include_phase_stats:
+            fail_counts, first_rank = _violation_summary(data_3d, *check_arrays)
+            return self._details_from_summary(plan, feature_names, fail_counts, first_rank)
+
+        # Keep the two sides of the check apart for the phase table
+        phase_idx, mins, maxs, check_rank = check_arrays
+        values = data_3d[:, phase_idx, :]
+        below, above = self._range_bound_masks(values, mins, maxs)
+        fail_counts, first_rank = _summarize_violations(below | above, check_rank)
+        details = self._details_from_summary(plan, feature_names, fail_counts, first_rank)
+        details.phase_stats = _phase_violation_stats(
+            task_name, plan.phase_indices, feature_names, values, below, above, check_arrays
+        )
+        return details
+
+    def phase_violation_table(
+        self,
+        locomotion_data: LocomotionData,
+        task_name: str,
+        ignore_features: Optional[List[str]] = None
+    ) -> List[PhaseViolationStats]:
+        """
+        Per-(phase, variable) below/above statistics of one task.
+
+        Args:
+            locomotion_data: Phase-indexed dataset
+            task_name: Task to check
+            ignore_features: Optional feature names excluded from validation
+
+        Returns:
+            One PhaseViolationStats per violated check, in config order
+        """
+        prepared = self._prepare_task(locomotion_data, task_name, ignore_features)
+        if prepared is None:
+            return []
+        plan, data_3d, feature_names, check_arrays = prepared
+        return self.phase_violation_stats_for_cycles(task_name, data_3d, feature_names, check_arrays)
+
+    def phase_violation_stats_for_cycles(
+        self,
+        task_name: str,
+        data_3d: np.ndarray,
+        feature_names: List[str],
+        check_arrays: Optional[Tuple[np.ndarray, ...]] = None
+    ) -> List[PhaseViolationStats]:
+        """
+        Per-(phase, variable) below/above statistics of an already extracted
+        (n_strides, 150, n_features) array of a task's cycles.
+        """
+        task_ranges = self.config_manager.get_task_data(task_name)
+        phase_indices = self._get_phase_indices(task_ranges)
+        if check_arrays is None:
+            feature_index = {name: idx for idx, name in enumerate(feature_names)}
+            check_arrays = self._compile_range_arrays(task_ranges, phase_indices, feature_index)
+        phase_idx, mins, maxs, _ = check_arrays
+        values = data_3d[:, phase_idx, :]
+        below, above = self._range_bound_masks(values, mins, maxs)
+        return _phase_violation_stats(task_name, phase_indices, feature_names, values, below, above, check_arrays)
+
+    @staticmethod
+    def _empty_details() -> TaskValidationDetails:
+        return TaskValidationDetails(
             failing_features={},
             per_variable_failures={},
             total_strides=0,
@@ -320,9 +634,189 @@ class Validator:
             phase_indices={}
         )
 
+    def _prepare_task(
+        self,
+        locomotion_data: LocomotionData,
+        task_name: str,
+        ignore_features: Optional[List[str]] = None
+    ) -> Optional[Tuple[ValidationPlan, np.ndarray, List[str], Tuple[np.ndarray, ...]]]:
+        """
+        Extract a task's cycles and the range arrays matching their layout.
+
+        Returns:
+            (plan, data_3d, feature_names, (phase_idx, mins, maxs, check_rank)),
+            or None if the task has nothing to validate
+        """
+        plan = self.get_validation_plan(task_name, locomotion_data.features, ignore_features)
+        if plan is None or not plan.validated_variables:
+            return None
+
+        data_3d, feature_names = locomotion_data.get_cycles(
+            subject=None,
+            task=task_name,
+            features=list(plan.validated_variables)
+        )
+
+        if data_3d is None or data_3d.size == 0:
+            return None
+
+        if feature_names == plan.validated_variables:
+            check_arrays = (plan.phase_idx, plan.mins, plan.maxs, plan.check_rank)
+        else:
+            # Some variables could not be extracted; compile against the actual layout
+            feature_index = {name: idx for idx, name in enumerate(feature_names)}
+            check_arrays = self._compile_range_arrays(
+                self.config_manager.get_task_data(task_name), plan.phase_indices, feature_index
+            )
+        return plan, data_3d, feature_names, check_arrays
+
+    @staticmethod
+    def _details_from_summary(
+        plan: ValidationPlan,
+        feature_names: List[str],
+        fail_counts: np.ndarray,
+        first_rank: np.ndarray,
+    ) -> TaskValidationDetails:
+        """Build task details from per-(stride, variable) violation summaries."""
+        validated_variables = plan.validated_variables
+        feature_index = {name: idx for idx, name in enumerate(feature_names)}
+        total_strides = fail_counts.shape[0]
+        failing_mask = fail_counts.any(axis=1)
+
+        # Failing names are reported in the order their first violated check
+        # appears in the (phase, variable) iteration of the config
+        failing_features: Dict[int, List[str]] = {}
+        for stride_idx in np.flatnonzero(failing_mask):
+            failed = np.flatnonzero(fail_counts[stride_idx])
+            order = failed[np.argsort(first_rank[stride_idx, failed], kind='stable')]
+            failing_features[int(stride_idx)] = [feature_names[idx] for idx in order]
+
+        # A stride is listed once per violated phase in per_variable_failures
+        stride_indices = np.arange(total_strides)
+        per_variable_failures: Dict[str, List[int]] = {}
+        for var_name in validated_variables:
+            var_idx = feature_index.get(var_name)
+            if var_idx is None:
+                per_variable_failures[var_name] = []
+            else:
+                per_variable_failures[var_name] = np.repeat(stride_indices, fail_counts[:, var_idx]).tolist()
+
+        global_passing = set(np.flatnonzero(~failing_mask).tolist())
+
+        # Bit matrix over all validated variables, in plan order
+        columns = [feature_index.get(var_name) for var_name in validated_variables]
+        failed_bits = np.zeros((total_strides, len(validated_variables)), dtype=bool)
+        present = [pos for pos, column in enumerate(columns) if column is not None]
+        failed_bits[:, present] = fail_counts[:, [columns[pos] for pos in present]] > 0
+
+        return TaskValidationDetails(
+            failing_features=failing_features,
+            per_variable_failures=per_variable_failures,
+            total_strides=total_strides,
+            validated_variables=list(validated_variables),
+            global_passing_strides=global_passing,
+            phase_indices=dict(plan.phase_indices),
+            stride_mask=StrideMask.from_bool(failed_bits, validated_variables),
+        )
+
+    def _validate_tasks_parallel(
+        self,
+        locomotion_data: LocomotionData,
+        tasks: List[str],
+        ignore_features: Optional[List[str]],
+        workers: int,
+        chunk_strides: int,
+        include_phase_stats: bool = False,
+    ) -> Dict[str, TaskValidationDetails]:
+        """
+        Validate tasks on a process pool.
+
+        Each task's cycles are written once to a temporary ``.npy`` file that
+        the workers memory-map, so only stride ranges and the small range
+        arrays are pickled.  Tasks larger than ``chunk_strides`` are split
+        into several stride ranges; the summaries are concatenated in stride
+        order and turned into details by the same code as the serial path.
+        With ``include_phase_stats`` the workers also build the phase table
+        of their stride range, and the chunk tables are merged.
+        """
+        details: Dict[str, TaskValidationDetails] = {}
+        pending = {}
+        with tempfile.TemporaryDirectory(prefix='locohub_validation_') as tmp_dir, \
+                ProcessPoolExecutor(max_workers=workers) as pool:
+            for task_num, task in enumerate(tasks):
+                prepared = self._prepare_task(locomotion_data, task, ignore_features)
+                if prepared is None:
+                    details[task] = self._empty_details()
+                    continue
+                plan, data_3d, feature_names, check_arrays = prepared
+
+                cycles_path = str(Path(tmp_dir) / f'task_{task_num}.npy')
+                np.save(cycles_path, data_3d)
+                n_strides = data_3d.shape[0]
+                del data_3d
+
+                stats_args = (task, plan.phase_indices, feature_names) if include_phase_stats else ()
+                futures = [
+                    pool.submit(_summarize_stride_chunk, cycles_path, start,
+                                min(start + chunk_strides, n_strides), check_arrays, *stats_args)
+                    for start in range(0, n_strides, chunk_strides)
+                ]
+                pending[task] = (plan, feature_names, check_arrays, futures)
+
+            for task, (plan, feature_names, check_arrays, futures) in pending.items():
+                summaries = [future.result() for future in futures]
+                fail_counts = np.concatenate([summary[0] for summary in summaries])
+                first_rank = np.concatenate([summary[1] for summary in summaries])
+                details[task] = self._details_from_summary(plan, feature_names, fail_counts, first_rank)
+                if include_phase_stats:
+                    details[task].phase_stats = _merge_phase_violation_stats(
+                        [summary[2] for summary in summaries], feature_names, check_arrays
+                    )
+
+        return {task: details[task] for task in tasks}
+
+    def get_validation_plan(
+        self,
+        task_name: str,
+        features: Optional[List[str]],
+        ignore_features: Optional[List[str]] = None,
+    ) -> Optional[ValidationPlan]:
+        """
+        Get the compiled range checks of a task for a dataset's features.
+
+        Plans are cached by the config's ranges fingerprint, so repeated
+        validations against unchanged ranges skip walking the config.
+
+        Args:
+            task_name: Task to compile
+            features: Feature names available in the dataset
+            ignore_features: Optional feature names excluded from validation
+
+        Returns:
+            ValidationPlan, or None if the task is not in the configuration
+        """
         if not self.config_manager.has_task(task_name):
-            return empty_details
+            return None
 
+        key = (
+            self.config_manager.ranges_fingerprint(),
+            task_name,
+            tuple(features or ()),
+            frozenset(ignore_features or ()),
+        )
+        plan = _PLAN_CACHE.get(key)
+        if plan is None:
+            plan = self._compile_plan(task_name, features, ignore_features)
+            _PLAN_CACHE.put(key, plan)
+        return plan
+
+    def _compile_plan(
+        self,
+        task_name: str,
+        features: Optional[List[str]],
+        ignore_features: Optional[List[str]] = None,
+    ) -> ValidationPlan:
+        """Walk the task's config once and build its ValidationPlan."""
         task_ranges = self.config_manager.get_task_data(task_name)
         phase_indices = self._get_phase_indices(task_ranges)
 
@@ -333,76 +827,133 @@ class Validator:
         if ignore_features:
             all_variables_to_check -= set(ignore_features)
 
-        dataset_features = set(locomotion_data.features or [])
+        dataset_features = set(features or [])
         validated_variables = [
             var for var in sorted(all_variables_to_check)
             if var in dataset_features
         ]
 
-        if not validated_variables:
-            return empty_details
+        feature_index = {name: idx for idx, name in enumerate(validated_variables)}
+        phase_idx, mins, maxs, check_rank = self._compile_range_arrays(
+            task_ranges, phase_indices, feature_index
+        )
+        for array in (phase_idx, mins, maxs, check_rank):
+            array.flags.writeable = False
 
-        data_3d, feature_names = locomotion_data.get_cycles(
-            subject=None,
+        phase_variable_checks = sum(
+            1
+            for phase_ranges in task_ranges.values()
+            for var_name in validated_variables
+            if var_name in phase_ranges
+        )
+
+        return ValidationPlan(
             task=task_name,
-            features=list(validated_variables)
+            phase_indices=phase_indices,
+            validated_variables=validated_variables,
+            phase_idx=phase_idx,
+            mins=mins,
+            maxs=maxs,
+            check_rank=check_rank,
+            phase_variable_checks=phase_variable_checks,
         )
 
-        if data_3d is None or data_3d.size == 0:
-            return empty_details
+    @staticmethod
+    def _compile_range_arrays(
+        task_ranges: Dict,
+        phase_indices: Dict[int, int],
+        feature_index: Dict[str, int],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compile a task's YAML ranges into dense arrays for the range check.
 
-        feature_index = {name: idx for idx, name in enumerate(feature_names)}
-        total_strides = data_3d.shape[0]
+        Args:
+            task_ranges: {phase_pct: {variable: {'min', 'max'}}} from the config
+            phase_indices: Phase percentage to cycle index mapping
+            feature_index: Variable name to position in the data_3d feature axis
 
-        failing_features: Dict[int, List[str]] = {}
-        per_variable_failures: Dict[str, List[int]] = {var: [] for var in validated_variables}
-        failing_stride_set: Set[int] = set()
-
-        for stride_idx in range(total_strides):
-            stride_failures: List[str] = []
-            for phase_pct, phase_idx in phase_indices.items():
-                phase_ranges = task_ranges.get(phase_pct, {})
-                for var_name, var_range in phase_ranges.items():
-                    if var_name not in feature_index:
-                        continue
-
-                    var_idx = feature_index[var_name]
-                    value = data_3d[stride_idx, phase_idx, var_idx]
-
-                    min_val = var_range.get('min')
-                    max_val = var_range.get('max')
-
-                    if min_val is None or max_val is None:
-                        continue
-                    if min_val > max_val:
-                        min_val, max_val = max_val, min_val
-                    if not np.isfinite(value):
-                        continue
-
-                    if value < min_val or value > max_val:
-                        if var_name not in stride_failures:
-                            stride_failures.append(var_name)
-                        failing_stride_set.add(stride_idx)
-                        per_variable_failures.setdefault(var_name, []).append(stride_idx)
-
-            if stride_failures:
-                failing_features[stride_idx] = stride_failures
-
-        global_passing = set(range(total_strides)) - failing_stride_set
-
-        # Ensure variables with no failures still appear with empty lists
-        for var_name in validated_variables:
-            per_variable_failures.setdefault(var_name, [])
+        Returns:
+            Tuple of (phase_idx, mins, maxs, check_rank):
+            - phase_idx: (n_phases,) cycle index of each checked phase
+            - mins, maxs: (n_phases, n_features) bounds, NaN where not checked
+            - check_rank: (n_phases, n_features) position of each check in the
+              phase/variable iteration order of the config
+        """
+        n_features = len(feature_index)
+        rows = []
+        next_rank = 0
+        for phase_pct, cycle_idx in phase_indices.items():
+            row_min = np.full(n_features, np.nan)
+            row_max = np.full(n_features, np.nan)
+            row_rank = np.zeros(n_features, dtype=np.int64)
+            checked = False
+            for var_name, var_range in task_ranges.get(phase_pct, {}).items():
+                var_idx = feature_index.get(var_name)
+                if var_idx is None:
+                    continue
+                min_val = var_range.get('min')
+                max_val = var_range.get('max')
+                if min_val is None or max_val is None:
+                    continue
+                if min_val > max_val:
+                    min_val, max_val = max_val, min_val
+                row_min[var_idx] = min_val
+                row_max[var_idx] = max_val
+                row_rank[var_idx] = next_rank
+                next_rank += 1
+                checked = True
+            if checked:
+                rows.append((cycle_idx, row_min, row_max, row_rank))
+
+        if not rows:
+            empty = np.empty((0, n_features))
+            return np.empty(0, dtype=np.intp), empty, empty.copy(), np.empty((0, n_features), dtype=np.int64)
+
+        phase_idx = np.array([row[0] for row in rows], dtype=np.intp)
+        mins = np.vstack([row[1] for row in rows])
+        maxs = np.vstack([row[2] for row in rows])
+        check_rank = np.vstack([row[3] for row in rows])
+        return phase_idx, mins, maxs, check_rank
+
+    @staticmethod
+    def _range_violation_mask(
+        data_3d: np.ndarray,
+        phase_idx: np.ndarray,
+        mins: np.ndarray,
+        maxs: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Evaluate every range check with one broadcast comparison.
+
+        Returns:
+            Boolean array (n_strides, n_phases, n_features), True where a finite
+            value lies outside its range. Unchecked entries (NaN bounds) and
+            non-finite values never count as violations.
+        """
+        values = data_3d[:, phase_idx, :]
+        with np.errstate(invalid='ignore'):
+            return np.isfinite(values) & ((values < mins) | (values > maxs))
+
+    @staticmethod
+    def _range_bound_masks(
+        values: np.ndarray,
+        mins: np.ndarray,
+        maxs: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Split the range check of gathered phase values into its two sides.
+
+        Args:
+            values: (n_strides, n_phases, n_features) values at the checked phases
+
+        Returns:
+            (below, above) boolean arrays shaped like ``values``; their union is
+            ``_range_violation_mask``
+        """
+        finite = np.isfinite(values)
+        with np.errstate(invalid='ignore'):
+            return finite & (values < mins), finite & (values > maxs)
 
-        return TaskValidationDetails(
-            failing_features=failing_features,
-            per_variable_failures=per_variable_failures,
-            total_strides=total_strides,
-            validated_variables=validated_variables,
-            global_passing_strides=global_passing,
-            phase_indices=phase_indices,
-        )
-    
     def _check_variable_3d(self, data_3d: np.ndarray, phase_idx: int, 
                           var_idx: int, var_range: Dict) -> List[int]:
         """
@@ -417,25 +968,169 @@ class Validator:
         Returns:
             List of cycle indices that violate the range
         """
-        violations = []
-        
         min_val = var_range.get('min', -float('inf'))
         max_val = var_range.get('max', float('inf'))
         
-        # Check each cycle at the specified phase
-        n_cycles = data_3d.shape[0]
-        for cycle_idx in range(n_cycles):
-            # Direct indexing: get value at this cycle, phase, and variable
-            value = data_3d[cycle_idx, phase_idx, var_idx]
-            
-            # Check if value is within range
-            if value < min_val or value > max_val:
-                violations.append(cycle_idx)
-        
-        return violations
+        # Values of every cycle at this phase and variable
+        values = data_3d[:, phase_idx, var_idx]
+        with np.errstate(invalid='ignore'):
+            return np.flatnonzero((values < min_val) | (values > max_val)).tolist()
     
 
 
+# ============================================================================
+# RANGE CHECK KERNEL
+# ============================================================================
+
+def _plain(value: Any) -> Any:
+    """Convert numpy scalars to Python values (for JSON summaries)."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _violation_summary(
+    data_3d: np.ndarray,
+    phase_idx: np.ndarray,
+    mins: np.ndarray,
+    maxs: np.ndarray,
+    check_rank: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce the range checks of a block of strides.
+
+    Returns:
+        (fail_counts, first_rank), both (n_strides, n_features): the number of
+        violated phases per stride and variable, and the config rank of the
+        first violated check (dtype max where none failed)
+    """
+    violations = Validator._range_violation_mask(data_3d, phase_idx, mins, maxs)
+    return _summarize_violations(violations, check_rank)
+
+
+def _summarize_violations(violations: np.ndarray, check_rank: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    fail_counts = violations.sum(axis=1)
+    no_check = np.iinfo(check_rank.dtype).max
+    first_rank = np.where(violations, check_rank, no_check).min(axis=1)
+    return fail_counts, first_rank
+
+
+def _phase_violation_stats(
+    task: str,
+    phase_indices: Dict[int, int],
+    feature_names: List[str],
+    values: np.ndarray,
+    below: np.ndarray,
+    above: np.ndarray,
+    check_arrays: Tuple[np.ndarray, ...],
+    stride_offset: int = 0,
+) -> List[PhaseViolationStats]:
+    """
+    Build the per-(phase, variable) table from the below/above masks.
+
+    Only violated checks get a row; rows follow the config's check order.
+    ``stride_offset`` is added to the reported stride indices.
+    """
+    phase_idx, mins, maxs, check_rank = check_arrays
+    n_below = below.sum(axis=0)
+    n_above = above.sum(axis=0)
+    rows, cols = np.nonzero(n_below + n_above)
+    order = np.argsort(check_rank[rows, cols], kind='stable')
+    # Phase-to-index rounding is strictly increasing, so it can be inverted
+    phase_by_index = {index: phase for phase, index in phase_indices.items()}
+
+    table: List[PhaseViolationStats] = []
+    for row, col in zip(rows[order].tolist(), cols[order].tolist()):
+        below_strides = np.flatnonzero(below[:, row, col])
+        above_strides = np.flatnonzero(above[:, row, col])
+        below_values = values[below_strides, row, col]
+        above_values = values[above_strides, row, col]
+        min_val = float(mins[row, col])
+        max_val = float(maxs[row, col])
+        table.append(PhaseViolationStats(
+            task=task,
+            phase=phase_by_index[int(phase_idx[row])],
+            phase_index=int(phase_idx[row]),
+            variable=feature_names[col],
+            min=min_val,
+            max=max_val,
+            n_below=int(n_below[row, col]),
+            n_above=int(n_above[row, col]),
+            worst_deficit=float(min_val - below_values.min()) if below_values.size else 0.0,
+            worst_excess=float(above_values.max() - max_val) if above_values.size else 0.0,
+            below_strides=below_strides + stride_offset,
+            above_strides=above_strides + stride_offset,
+            below_values=below_values,
+            above_values=above_values,
+        ))
+    return table
+
+
+def _merge_phase_violation_stats(
+    chunk_tables: List[List[PhaseViolationStats]],
+    feature_names: List[str],
+    check_arrays: Tuple[np.ndarray, ...],
+) -> List[PhaseViolationStats]:
+    """Combine the phase tables of consecutive stride chunks of one task."""
+    phase_idx, _, _, check_rank = check_arrays
+    row_of = {index: row for row, index in enumerate(phase_idx.tolist())}
+    col_of = {name: col for col, name in enumerate(feature_names)}
+
+    grouped: Dict[Tuple[int, str], List[PhaseViolationStats]] = {}
+    for table in chunk_tables:
+        for stats in table:
+            grouped.setdefault((stats.phase_index, stats.variable), []).append(stats)
+
+    merged: List[PhaseViolationStats] = []
+    for parts in grouped.values():
+        first = parts[0]
+        merged.append(PhaseViolationStats(
+            task=first.task,
+            phase=first.phase,
+            phase_index=first.phase_index,
+            variable=first.variable,
+            min=first.min,
+            max=first.max,
+            n_below=sum(part.n_below for part in parts),
+            n_above=sum(part.n_above for part in parts),
+            worst_deficit=max(part.worst_deficit for part in parts),
+            worst_excess=max(part.worst_excess for part in parts),
+            below_strides=np.concatenate([part.below_strides for part in parts]),
+            above_strides=np.concatenate([part.above_strides for part in parts]),
+            below_values=np.concatenate([part.below_values for part in parts]),
+            above_values=np.concatenate([part.above_values for part in parts]),
+        ))
+    merged.sort(key=lambda stats: check_rank[row_of[stats.phase_index], col_of[stats.variable]])
+    return merged
+
+
+def _summarize_stride_chunk(
+    cycles_path: str,
+    start: int,
+    stop: int,
+    check_arrays: Tuple[np.ndarray, ...],
+    task: Optional[str] = None,
+    phase_indices: Optional[Dict[int, int]] = None,
+    feature_names: Optional[List[str]] = None,
+) -> tuple:
+    """
+    Process-pool worker: summarize strides [start, stop) of a memory-mapped task.
+
+    Returns (fail_counts, first_rank), plus the chunk's phase table (stride
+    indices relative to the whole task) when ``task`` is given.
+    """
+    data_3d = np.asarray(np.load(cycles_path, mmap_mode='r')[start:stop])
+    if task is None:
+        return _violation_summary(data_3d, *check_arrays)
+
+    phase_idx, mins, maxs, check_rank = check_arrays
+    values = data_3d[:, phase_idx, :]
+    below, above = Validator._range_bound_masks(values, mins, maxs)
+    fail_counts, first_rank = _summarize_violations(below | above, check_rank)
+    table = _phase_violation_stats(
+        task, phase_indices, feature_names, values, below, above, check_arrays, stride_offset=start
+    )
+    return fail_counts, first_rank, table
+
+
 # ============================================================================
 # VALIDATION RESULT FORMATTER
 # ============================================================================
@@ -39,6 +39,7 @@ from tqdm import tqdm
 # Add common utilities to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'common'))
 from phase_detection import VerticalGRFConfig, detect_vertical_grf_events
+from parquet_io import write_dataset_parquet
 
 from dataset_configs import (
     DATASET_SHORT_CODES,
@@ -496,13 +497,13 @@ def process_dataset(
     if all_time_dfs:
         combined_time = pd.concat(all_time_dfs, ignore_index=True)
         time_path = output_dir / f'{dataset}_time.parquet'
-        combined_time.to_parquet(time_path, index=False)
+        write_dataset_parquet(combined_time, time_path)
         print(f"Saved time-indexed data: {time_path} ({len(combined_time)} rows)")
 
     if all_phase_dfs:
         combined_phase = pd.concat(all_phase_dfs, ignore_index=True)
         phase_path = output_dir / f'{dataset}_phase.parquet'
-        combined_phase.to_parquet(phase_path, index=False)
+        write_dataset_parquet(combined_phase, phase_path)
         print(f"Saved phase-normalized data: {phase_path} ({len(combined_phase)} rows)")
 
     return time_path, phase_path
@@ -44,6 +44,7 @@ from common.stride_segmentation import (
     filter_segments_by_duration_iqr,
     remove_transition_segments,
 )
+from common.parquet_io import write_dataset_parquet
 
 # Configuration
 NUM_POINTS = 150  # Points per gait cycle
@@ -1675,12 +1676,16 @@ def main():
         print(f"Tasks: {combined_df['task'].unique().tolist()}")
 
         # Show exo state distribution (now in task_info per standard)
-        exo_states = combined_df['task_info'].str.extract(r'exo_state:(\w+)')[0].value_counts()
+        # Extract from the distinct task_info strings only, then weight by row counts
+        task_info_counts = combined_df['task_info'].value_counts()
+        exo_states = task_info_counts.groupby(
+            task_info_counts.index.str.extract(r'exo_state:(\w+)', expand=False)
+        ).sum().sort_values(ascending=False)
         print(f"\nExo states (strides):")
         for state, count in exo_states.items():
             print(f"  {state}: {count // NUM_POINTS}")
 
-        combined_df.to_parquet(output_path, index=False)
+        write_dataset_parquet(combined_df, output_path)
         print("Done!")
     else:
         print("No data to save!")
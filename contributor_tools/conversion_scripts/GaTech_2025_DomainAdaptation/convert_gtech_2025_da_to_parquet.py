@@ -43,6 +43,7 @@ from common.stride_segmentation import (
     filter_segments_by_duration_iqr,
     remove_transition_segments,
 )
+from common.parquet_io import write_dataset_parquet
 
 # Configuration
 NUM_POINTS = 150  # Points per gait cycle
@@ -1070,12 +1071,16 @@ def main():
         print(f"Tasks: {combined_df['task'].unique().tolist()}")
 
         # Show model variant distribution
-        model_counts = combined_df['task_info'].str.extract(r'model:(\w+)')[0].value_counts()
+        # Extract from the distinct task_info strings only, then weight by row counts
+        task_info_counts = combined_df['task_info'].value_counts()
+        model_counts = task_info_counts.groupby(
+            task_info_counts.index.str.extract(r'model:(\w+)', expand=False)
+        ).sum().sort_values(ascending=False)
         print(f"\nModel variants (strides):")
         for variant, count in model_counts.items():
             print(f"  {variant}: {count // NUM_POINTS}")
 
-        combined_df.to_parquet(output_path, index=False)
+        write_dataset_parquet(combined_df, output_path)
         print("Done!")
     else:
         print("No data to save!")
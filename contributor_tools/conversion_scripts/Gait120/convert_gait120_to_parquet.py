@@ -59,6 +59,7 @@ from common.force_plate import (
     ForcePlateConfig,
     process_force_plate_data,
 )
+from common.parquet_io import write_dataset_parquet
 
 # Configuration
 NUM_POINTS = 150  # Target points per gait cycle (standard format)
@@ -1135,7 +1136,7 @@ def main():
         for task, count in task_counts.items():
             print(f"  {task}: {count}")
 
-        combined_df.to_parquet(output_path, index=False)
+        write_dataset_parquet(combined_df, output_path)
         print("\nDone!")
     else:
         print("No data to save!")
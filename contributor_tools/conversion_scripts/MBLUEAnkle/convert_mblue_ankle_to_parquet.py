@@ -25,6 +25,10 @@ from scipy.interpolate import interp1d
 from scipy.io import loadmat
 from tqdm import tqdm
 
+# Add path for common utilities
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from common.parquet_io import write_dataset_parquet
+
 # Configuration
 NUM_POINTS = 150  # Target points per gait cycle (standard format)
 SOURCE_POINTS = 101  # Points in source data
@@ -1649,7 +1653,7 @@ def main():
         print(f"Unique subjects: {combined_df['subject'].nunique()}")
         print(f"Tasks: {combined_df['task'].unique().tolist()}")
 
-        combined_df.to_parquet(output_path, index=False)
+        write_dataset_parquet(combined_df, output_path)
         print("Done!")
     else:
         print("No data to save!")
@@ -33,6 +33,7 @@ Output: Phase-normalized parquet file with 150 points per gait cycle.
 """
 
 import numpy as np
+import sys
 import pandas as pd
 from pathlib import Path
 from scipy.io import loadmat
@@ -40,6 +41,10 @@ from scipy.interpolate import interp1d
 from typing import Dict, List, Tuple, Optional
 import argparse
 
+# Add path for common utilities
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from common.parquet_io import write_dataset_parquet
+
 
 # Configuration
 NUM_POINTS_INPUT = 101  # Input data has 101 points (0-100%)
@@ -379,7 +384,7 @@ def main():
         print(f"Unique subjects: {combined_df['subject'].nunique()}")
         print(f"Tasks: {combined_df['task'].unique().tolist()}")
 
-        combined_df.to_parquet(output_path, index=False)
+        write_dataset_parquet(combined_df, output_path)
         print("Done!")
     else:
         print("No data to save!")
@@ -17,6 +17,9 @@ from .. import config
 _TIME_WRITERS: Dict[Path, pq.ParquetWriter] = {}
 _PHASE_WRITERS: Dict[Path, pq.ParquetWriter] = {}
 
+# Label columns repeated on every row; written as Arrow dictionary arrays
+_LABEL_COLUMNS = ("subject", "task", "task_id", "task_info")
+
 
 def write_time_chunk(df: pd.DataFrame, events, output_root: Path, dataset_name: str) -> None:
     """Append a time-indexed chunk to the dataset export."""
@@ -29,7 +32,7 @@ def write_time_chunk(df: pd.DataFrame, events, output_root: Path, dataset_name:
     df_out = df.copy()
     df_out["step"] = step_values
 
-    table = pa.Table.from_pandas(df_out, preserve_index=False)
+    table = _encode_label_columns(pa.Table.from_pandas(df_out, preserve_index=False))
     _write_table(Path(paths["time"]), table, cache=_TIME_WRITERS)
 
 
@@ -42,7 +45,7 @@ def write_phase_chunk(df: pd.DataFrame, events, output_root: Path, dataset_name:
 
     paths = config.dataset_output_paths(output_root, dataset_name)
     phase_df = pd.concat(stride_frames, ignore_index=True)
-    table = pa.Table.from_pandas(phase_df, preserve_index=False)
+    table = _encode_label_columns(pa.Table.from_pandas(phase_df, preserve_index=False))
     _write_table(Path(paths["phase"]), table, cache=_PHASE_WRITERS)
 
 
@@ -111,6 +114,18 @@ def _phase_dataframe_from_events(df: pd.DataFrame, events) -> list[pd.DataFrame]
     return frames
 
 
+def _encode_label_columns(table: pa.Table) -> pa.Table:
+    # dictionary_encode always uses int32 indices, so chunk schemas stay equal
+    for name in _LABEL_COLUMNS:
+        index = table.schema.get_field_index(name)
+        if index < 0:
+            continue
+        field_type = table.schema.field(index).type
+        if pa.types.is_string(field_type) or pa.types.is_large_string(field_type):
+            table = table.set_column(index, name, table.column(index).dictionary_encode())
+    return table
+
+
 def _write_table(path: Path, table: pa.Table, *, cache: Dict[Path, pq.ParquetWriter]) -> None:
     writer = cache.get(path)
     if writer is None:
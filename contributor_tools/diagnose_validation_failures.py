@@ -34,6 +34,7 @@ if src_dir.exists() and str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
 from contributor_tools.common.config_manager import ValidationConfigManager as ConfigManager
+from contributor_tools.common.validation import Validator
 from locohub import LocomotionData
 from contributor_tools.common.near_miss_analysis import (
     compute_clean_statistics,
@@ -53,11 +54,13 @@ def analyze_failures(
     """
     Analyze validation failures and categorize as under/over bounds.
 
+    Reads the validator's per-(phase, variable) violation table; the full
+    (unfiltered) table of each task is kept under ``'phase_table'``.
+
     Returns:
         Tuple of (results dict, failure_records list for CSV export)
     """
-    df = locomotion_data.df
-    features = locomotion_data.features
+    validator = Validator(config_manager=config_manager)
 
     tasks = locomotion_data.get_tasks()
     if task_filter:
@@ -67,10 +70,9 @@ def analyze_failures(
     failure_records = []  # For CSV export
 
     for task in tasks:
-        task_df = df[df['task'] == task].copy()
-        task_df.reset_index(drop=True, inplace=True)
-
-        n_strides = len(task_df) // 150
+        rows = locomotion_data.get_row_selection(None, task)
+        row_positions = np.arange(rows.start, rows.stop) if isinstance(rows, slice) else rows
+        n_strides = len(row_positions) // 150
         if n_strides == 0:
             continue
 
@@ -80,137 +82,101 @@ def analyze_failures(
         if not task_ranges:
             continue
 
+        phase_table = validator.phase_violation_table(locomotion_data, task)
         task_results = {
             'total_strides': n_strides,
-            'features': {}
+            'features': {},
+            'phase_table': phase_table,
         }
 
-        # Reshape data to 3D: (strides, phases, features)
-        data_3d = task_df[features].values.reshape(n_strides, 150, len(features))
-        feature_to_idx = {f: i for i, f in enumerate(features)}
-
-        for phase_pct, phase_ranges in task_ranges.items():
-            phase_pct = int(phase_pct)
-            # Convert percentage (0-100) to data index (0-149)
-            phase_idx = round(phase_pct / 100 * 149)
-
-            for var_name, var_range in phase_ranges.items():
-                if var_name not in feature_to_idx:
-                    continue
-
-                # Apply feature filter if specified
-                if feature_filter and var_name != feature_filter:
-                    continue
-
-                var_idx = feature_to_idx[var_name]
-                min_val = var_range.get('min')
-                max_val = var_range.get('max')
-
-                if min_val is None or max_val is None:
-                    continue
-
-                # Get all values at this phase for this variable
-                values = data_3d[:, phase_idx, var_idx]
-                valid_mask = np.isfinite(values)
-
-                # Get stride indices for valid values
-                valid_indices = np.where(valid_mask)[0]
-                valid_values = values[valid_mask]
-
-                if len(valid_values) == 0:
-                    continue
-
-                # Count under/over violations
-                under_mask = valid_values < min_val
-                over_mask = valid_values > max_val
-
-                n_under = np.sum(under_mask)
-                n_over = np.sum(over_mask)
-
-                if n_under == 0 and n_over == 0:
-                    continue
-
-                # Calculate statistics for failures
-                under_values = valid_values[under_mask] if n_under > 0 else np.array([])
-                over_values = valid_values[over_mask] if n_over > 0 else np.array([])
-
-                # Export detailed stride-level failures if requested
-                if export_details:
-                    under_indices = valid_indices[under_mask]
-                    over_indices = valid_indices[over_mask]
-
-                    for idx, val in zip(under_indices, under_values):
-                        # Get subject/step info from the stride
-                        row_start = idx * 150
-                        subject = task_df.iloc[row_start]['subject']
-                        step = task_df.iloc[row_start]['step']
-                        failure_records.append({
-                            'task': task,
-                            'feature': var_name,
-                            'phase': phase_idx,
-                            'phase_pct': phase_pct,
-                            'stride_idx': int(idx),
-                            'subject': subject,
-                            'step': step,
-                            'violation': 'under',
-                            'actual_value': float(val),
-                            'bound_min': min_val,
-                            'bound_max': max_val,
-                            'deficit': float(min_val - val)
-                        })
-
-                    for idx, val in zip(over_indices, over_values):
-                        row_start = idx * 150
-                        subject = task_df.iloc[row_start]['subject']
-                        step = task_df.iloc[row_start]['step']
-                        failure_records.append({
-                            'task': task,
-                            'feature': var_name,
-                            'phase': phase_idx,
-                            'phase_pct': phase_pct,
-                            'stride_idx': int(idx),
-                            'subject': subject,
-                            'step': step,
-                            'violation': 'over',
-                            'actual_value': float(val),
-                            'bound_min': min_val,
-                            'bound_max': max_val,
-                            'excess': float(val - max_val)
-                        })
-
-                if var_name not in task_results['features']:
-                    task_results['features'][var_name] = {
-                        'phases': {},
-                        'total_under': 0,
-                        'total_over': 0,
-                        'bounds': {'min': min_val, 'max': max_val}
-                    }
-
-                phase_info = {
-                    'n_under': int(n_under),
-                    'n_over': int(n_over),
+        stride_info = None
+        if export_details:
+            # Subject/step of each stride, read from its first row
+            first_rows = locomotion_data.df.iloc[row_positions[::150][:n_strides]]
+            stride_info = list(zip(first_rows['subject'], first_rows['step']))
+
+        for row in phase_table:
+            var_name = row.variable
+            phase_pct = row.phase
+
+            # Apply feature filter if specified
+            if feature_filter and var_name != feature_filter:
+                continue
+
+            min_val = row.min
+            max_val = row.max
+            under_values = row.below_values
+            over_values = row.above_values
+
+            # Export detailed stride-level failures if requested
+            if export_details:
+                for idx, val in zip(row.below_strides.tolist(), under_values.tolist()):
+                    subject, step = stride_info[idx]
+                    failure_records.append({
+                        'task': task,
+                        'feature': var_name,
+                        'phase': row.phase_index,
+                        'phase_pct': phase_pct,
+                        'stride_idx': idx,
+                        'subject': subject,
+                        'step': step,
+                        'violation': 'under',
+                        'actual_value': val,
+                        'bound_min': min_val,
+                        'bound_max': max_val,
+                        'deficit': min_val - val
+                    })
+
+                for idx, val in zip(row.above_strides.tolist(), over_values.tolist()):
+                    subject, step = stride_info[idx]
+                    failure_records.append({
+                        'task': task,
+                        'feature': var_name,
+                        'phase': row.phase_index,
+                        'phase_pct': phase_pct,
+                        'stride_idx': idx,
+                        'subject': subject,
+                        'step': step,
+                        'violation': 'over',
+                        'actual_value': val,
+                        'bound_min': min_val,
+                        'bound_max': max_val,
+                        'excess': val - max_val
+                    })
+
+            if var_name not in task_results['features']:
+                task_results['features'][var_name] = {
+                    'phases': {},
+                    'total_under': 0,
+                    'total_over': 0,
                     'bounds': {'min': min_val, 'max': max_val}
                 }
 
-                if n_under > 0:
-                    phase_info['under_stats'] = {
-                        'min_value': float(np.min(under_values)),
-                        'mean_value': float(np.mean(under_values)),
-                        'max_value': float(np.max(under_values)),
-                        'deficit': float(min_val - np.min(under_values))
-                    }
-
-                if n_over > 0:
-                    phase_info['over_stats'] = {
-                        'min_value': float(np.min(over_values)),
-                        'mean_value': float(np.mean(over_values)),
-                        'max_value': float(np.max(over_values)),
-                        'excess': float(np.max(over_values) - max_val)
-                    }
-
-                task_results['features'][var_name]['phases'][phase_pct] = phase_info
-                task_results['features'][var_name]['total_under'] += n_under
-                task_results['features'][var_name]['total_over'] += n_over
+            phase_info = {
+                'n_under': row.n_below,
+                'n_over': row.n_above,
+                'bounds': {'min': min_val, 'max': max_val}
+            }
+
+            if row.n_below > 0:
+                phase_info['under_stats'] = {
+                    'min_value': float(np.min(under_values)),
+                    'mean_value': float(np.mean(under_values)),
+                    'max_value': float(np.max(under_values)),
+                    'deficit': row.worst_deficit
+                }
+
+            if row.n_above > 0:
+                phase_info['over_stats'] = {
+                    'min_value': float(np.min(over_values)),
+                    'mean_value': float(np.mean(over_values)),
+                    'max_value': float(np.max(over_values)),
+                    'excess': row.worst_excess
+                }
+
+            task_results['features'][var_name]['phases'][phase_pct] = phase_info
+            task_results['features'][var_name]['total_under'] += row.n_below
+            task_results['features'][var_name]['total_over'] += row.n_above
 
         results[task] = task_results
 
@@ -629,15 +595,13 @@ def main():
             if n_strides == 0:
                 continue
 
-            # Count total failing strides for this task
+            # A stride fails if it fails any feature at any phase
+            phase_table = results[task]['phase_table'] if task in results else None
             total_failing = 0
-            if task in results:
-                # A stride fails if it fails any feature at any phase
-                # Use the results we already computed
-                task_results = results[task]
-                # Approximate: count unique failing strides would require recomputation
-                # For now, just show the marginal analysis
-                total_failing = n_strides - int(n_strides * 0.5)  # Placeholder
+            if phase_table:
+                total_failing = len(np.unique(np.concatenate(
+                    [np.concatenate([row.below_strides, row.above_strides]) for row in phase_table]
+                )))
 
             # Compute clean statistics
             clean_stats = compute_clean_statistics(
@@ -652,7 +616,8 @@ def main():
             marginal_failures, suggestions = identify_marginal_failures(
                 df, task, features, config_manager, clean_stats,
                 max_phases_failed=args.max_phases,
-                max_zscore=args.max_zscore
+                max_zscore=args.max_zscore,
+                phase_table=phase_table
             )
 
             # Print summary
@@ -105,7 +105,7 @@ if src_dir.exists() and str(src_dir) not in sys.path:
 from locohub import LocomotionData
 from locohub.feature_constants import get_feature_list
 from contributor_tools.common.config_manager import ValidationConfigManager
-from contributor_tools.common.validation import Validator
+from contributor_tools.common.validation import IncrementalValidator, Validator
 from locohub import task_registry
 from contributor_tools.common.plotting import get_task_classification
 
@@ -616,6 +616,7 @@ class InteractiveValidationTuner:
         self._boxes_by_axis = defaultdict(list)
         self._axis_aliases = {}
         self.validator = Validator()
+        self._incremental_validator = None  # Per-check violation masks for the loaded dataset
         self.data_cache = {}
         self.phase_template = np.linspace(0, 100, 150)
         self.max_traces_per_axis = 350
@@ -2235,15 +2236,10 @@ class InteractiveValidationTuner:
             self._set_status(message)
             return failing_strides
 
-        # Sync validator config with current in-memory ranges
-        self.validator.config_manager.set_data(copy.deepcopy(self.full_validation_data))
-
-        validation_result = self.validator.validate_dataset(
-            locomotion_data=self.locomotion_data,
-            task_filter=[self.current_task]
-        )
-
-        task_info = validation_result['tasks'].get(self.current_task, {})
+        # Re-check only the ranges that changed since the last validation
+        incremental = self._get_incremental_validator()
+        incremental.sync_task(self.current_task, self.full_validation_data.get(self.current_task, {}))
+        task_info = incremental.task_result(self.current_task)
 
         failing_map = task_info.get('failing_strides_by_variable', {})
         for var_name, stride_set in failing_map.items():
@@ -2282,6 +2278,13 @@ class InteractiveValidationTuner:
 
         return failing_strides
     
+    def _get_incremental_validator(self):
+        """Return the incremental validator of the loaded dataset, creating it if needed."""
+        if (self._incremental_validator is None
+                or self._incremental_validator.locomotion_data is not self.locomotion_data):
+            self._incremental_validator = IncrementalValidator(self.locomotion_data)
+        return self._incremental_validator
+
     def get_expanded_y_range(self, var_name):
         """Get y-axis range with expanded margins for more dragging space."""
         y_min, y_max = -1, 1  # Default
@@ -2369,26 +2372,15 @@ class InteractiveValidationTuner:
                 self.data_cache[cache_key] = np.empty((0, self.phase_template.size))
             return
 
-        all_data = []
         try:
-            subjects = self.locomotion_data.get_subjects()
-            for subject in subjects:
-                try:
-                    cycles_data, feature_names = self.locomotion_data.get_cycles(
-                        subject=subject,
-                        task=self.current_task,
-                        features=None
-                    )
-                    
-                    if cycles_data.size > 0 and var_name in feature_names:
-                        var_idx = feature_names.index(var_name)
-                        all_data.append(cycles_data[:, :, var_idx])
-                except:
-                    continue
+            # One gather across all subjects instead of a per-subject loop + vstack
+            cycles_data, feature_names, _ = self.locomotion_data.get_cycles_batch(
+                tasks=[self.current_task],
+                features=[var_name]
+            )
             
-            if all_data:
-                all_data = np.vstack(all_data)
-                self.data_cache[cache_key] = all_data
+            if cycles_data is not None and cycles_data.size > 0 and var_name in feature_names:
+                self.data_cache[cache_key] = cycles_data[:, :, feature_names.index(var_name)]
         except:
             pass
     
@@ -2413,28 +2405,14 @@ class InteractiveValidationTuner:
         if cache_key in self.data_cache:
             all_data = self.data_cache[cache_key]
         else:
-            collected = []
             try:
-                subjects = self.locomotion_data.get_subjects()
-                for subject in subjects:
-                    try:
-                        cycles_data, feature_names = self.locomotion_data.get_cycles(
-                            subject=subject,
-                            task=self.current_task,
-                            features=None
-                        )
-
-                        if not hasattr(cycles_data, 'size') or cycles_data.size == 0:
-                            continue
-
-                        if var_name in feature_names:
-                            var_idx = feature_names.index(var_name)
-                            collected.append(cycles_data[:, :, var_idx])
-                    except Exception:
-                        continue
+                cycles_data, feature_names, _ = self.locomotion_data.get_cycles_batch(
+                    tasks=[self.current_task],
+                    features=[var_name]
+                )
 
-                if collected:
-                    all_data = np.vstack(collected)
+                if cycles_data is not None and cycles_data.size > 0 and var_name in feature_names:
+                    all_data = cycles_data[:, :, feature_names.index(var_name)]
                 else:
                     all_data = np.empty((0, self.phase_template.size))
                 self.data_cache[cache_key] = all_data
@@ -2514,28 +2492,14 @@ class InteractiveValidationTuner:
             # Load data from all subjects
             all_data = []
             try:
-                subjects = self.locomotion_data.get_subjects()
-                for subject in subjects:
-                    try:
-                        cycles_data, feature_names = self.locomotion_data.get_cycles(
-                            subject=subject,
-                            task=self.current_task,
-                            features=None
-                        )
-                        
-                        if cycles_data.size == 0:
-                            continue
-                        
-                        # Find variable index
-                        if var_name in feature_names:
-                            var_idx = feature_names.index(var_name)
-                            all_data.append(cycles_data[:, :, var_idx])
-                    except:
-                        continue
+                cycles_data, feature_names, _ = self.locomotion_data.get_cycles_batch(
+                    tasks=[self.current_task],
+                    features=[var_name]
+                )
                 
                 # Cache the data
-                if all_data:
-                    all_data = np.vstack(all_data)
+                if cycles_data is not None and cycles_data.size > 0 and var_name in feature_names:
+                    all_data = cycles_data[:, :, feature_names.index(var_name)]
                     self.data_cache[cache_key] = all_data
             except:
                 pass
@@ -2601,7 +2565,18 @@ class InteractiveValidationTuner:
                 box.paired_box.redraw()
 
             self.modified = True
-            self.status_bar.config(text=f"Modified: {box.var_name} at phase {box.phase}% - Press Validate to update")
+            status = f"Modified: {box.var_name} at phase {box.phase}%"
+
+            # Re-check just this box so the pass count updates while dragging
+            if self.locomotion_data and self._dataset_has_task(self.current_task):
+                incremental = self._get_incremental_validator()
+                if incremental.has_task(self.current_task):
+                    incremental.update_bound(self.current_task, box.phase, box.var_name, min_val, max_val)
+                else:
+                    incremental.sync_task(self.current_task, self.full_validation_data.get(self.current_task, {}))
+                passing, total = incremental.passing_count(self.current_task)
+                status += f" - {passing}/{total} strides pass"
+            self.status_bar.config(text=f"{status} - Press Validate to update")
             
             # Enable validate button
             if hasattr(self, 'validate_button'):
@@ -597,7 +597,7 @@ def _compute_feature_task_groups(
     if not feature_columns:
         return None, None, None
 
-    grouped = df.groupby('task')
+    grouped = df.groupby('task', observed=True)
     try:
         coverage = grouped[feature_columns].agg(lambda col: float(col.notna().mean()))
     except Exception as exc:
@@ -32,12 +32,10 @@ import argparse
 import json
 import math
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, timezone
-import pandas as pd
 import threading
 import time
-import numpy as np
 
 # Ensure repository root and src/ are importable so `import locohub` works
 project_root = Path(__file__).parent.parent
@@ -47,9 +45,8 @@ if str(project_root) not in sys.path:
 if src_dir.exists() and str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
-from contributor_tools.common.validation import Validator
+from contributor_tools.common.validation import ValidationSession, Validator
 from locohub import task_registry
-from locohub import LocomotionData
 
 # Detect if we're in a headless environment (no display available)
 import os
@@ -251,15 +248,14 @@ def create_scrollable_figure(parent, fig):
     canvas_frame.after(100, configure_scroll_region)
 
 
-def generate_plots(dataset_path: str, validator: Validator, task_filter: Optional[str] = None,
+def generate_plots(session: ValidationSession, task_filter: Optional[str] = None,
                   output_dir: Optional[str] = None, use_column_names: bool = False,
                   show_local_passing: bool = False) -> None:
     """
     Generate validation plots using the same plotting functions as report generator.
 
     Args:
-        dataset_path: Path to dataset
-        validator: Initialized validator
+        session: Validation session holding the loaded dataset and results
         task_filter: Optional single task to plot (if None, plot all)
         output_dir: Where to save plots (if None, show interactively)
         use_column_names: If True, use actual column names instead of pretty labels
@@ -278,12 +274,11 @@ def generate_plots(dataset_path: str, validator: Validator, task_filter: Optiona
     from contributor_tools.common.plotting import create_task_combined_plot
     import matplotlib.pyplot as plt
 
-    locomotion_data = LocomotionData(dataset_path, phase_col='phase_ipsi')
-    dataset_name = Path(dataset_path).stem
+    dataset_name = session.dataset_path.stem
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
     
     # Determine which tasks to plot
-    all_tasks = locomotion_data.get_tasks()
+    all_tasks = session.tasks
     if task_filter:
         if task_filter not in all_tasks:
             print(f"❌ Task '{task_filter}' not found in dataset")
@@ -309,19 +304,13 @@ def generate_plots(dataset_path: str, validator: Validator, task_filter: Optiona
         print(f"\n📍 Processing {task}...")
         
         try:
-            # Get validation failures for this task
-            failures = validator._validate_task_with_failing_features(locomotion_data, task)
+            # Task data, validation failures and config from the shared session
+            data_3d, features, failures, task_config = session.plot_inputs(task)
             
-            # Get task data
-            data_3d, features = locomotion_data.get_cycles(subject=None, task=task)
-            
-            if data_3d.size == 0:
+            if data_3d is None or data_3d.size == 0:
                 print(f"  ⚠️  No data available for {task}")
                 continue
             
-            # Get validation config for this task
-            task_config = validator.config_manager.get_task_data(task)
-            
             # Generate plot using the same function as report generator
             plot_path = create_task_combined_plot(
                 validation_data=task_config,
@@ -396,6 +385,14 @@ def print_validation_summary(result: Dict, task_details: Optional[Dict[str, Dict
 
     phase_icon = "✅" if result['phase_valid'] else "❌"
     print(f"Phase Structure: {phase_icon} {result['phase_message']}")
+    phase_issues = result.get('phase_issues') or []
+    for issue in phase_issues[:5]:
+        location = f"subject {issue['subject']}" if issue['subject'] is not None else "all subjects"
+        if issue['stride'] is not None:
+            location += f", stride {issue['stride']}"
+        print(f"   • {issue['task']}: {location} ({issue['reason']}, {issue['n_points']} points)")
+    if len(phase_issues) > 5:
+        print(f"   ... and {len(phase_issues) - 5} more")
 
     print(f"\nTasks Evaluated: {stats.get('num_tasks', 0)}")
 
@@ -722,132 +719,6 @@ def _base_task_name(task: str) -> str:
     return task_lower
 
 
-def _collect_dataset_tasks(dataset_path: Path) -> List[str]:
-    """Return unique task names present in the dataset parquet."""
-
-    try:
-        df = pd.read_parquet(dataset_path, columns=['task'])
-    except Exception:
-        df = pd.read_parquet(dataset_path)
-    if 'task' not in df.columns:
-        return []
-    return sorted(x for x in df['task'].dropna().unique())
-
-
-def _compute_task_statistics(dataset_path: Path, validator: Validator, result: Dict) -> Dict[str, Dict[str, object]]:
-    """Collect per-task stride and feature statistics for reporting."""
-    task_details: Dict[str, Dict[str, object]] = {}
-
-    if result.get('mode', 'phase') != 'phase':
-        return task_details
-
-    locomotion_data = LocomotionData(dataset_path, phase_col='phase_ipsi')
-    dataset_tasks = list(locomotion_data.get_tasks())
-    violation_tasks = list(result.get('violations', {}).keys())
-    all_tasks = sorted(set(dataset_tasks) | set(violation_tasks))
-
-    for task in all_tasks:
-        total_strides = 0
-        if task in dataset_tasks:
-            task_df = locomotion_data.df[locomotion_data.df['task'] == task]
-            if locomotion_data.POINTS_PER_CYCLE:
-                total_strides = len(task_df) // locomotion_data.POINTS_PER_CYCLE
-
-        violations = result.get('violations', {}).get(task, {})
-
-        failing_stride_indices: Set[int] = set()
-        for indices in violations.values():
-            failing_stride_indices.update(indices)
-
-        failing_strides = len(failing_stride_indices)
-        pass_rate = 1.0
-        if total_strides > 0:
-            pass_rate = max(0.0, 1.0 - (failing_strides / total_strides))
-
-        # Analyse failures by phase (below / above limits)
-        feature_phase_stats: Dict[str, Dict[int, Dict[str, int]]] = {}
-        task_config = validator.config_manager.get_task_data(task)
-
-        if task_config and total_strides > 0:
-            config_features = sorted({
-                feature_name
-                for phase_data in task_config.values()
-                for feature_name in phase_data.keys()
-            })
-
-            if config_features:
-                data_3d, feature_names = locomotion_data.get_cycles(
-                    subject=None,
-                    task=task,
-                    features=config_features
-                )
-
-                if data_3d is not None and data_3d.size:
-                    feature_index = {name: idx for idx, name in enumerate(feature_names)}
-                    points_per_cycle = locomotion_data.POINTS_PER_CYCLE or data_3d.shape[1]
-
-                    for phase_pct, phase_variables in task_config.items():
-                        phase_idx = int(round((phase_pct / 100.0) * (points_per_cycle - 1)))
-                        phase_idx = max(0, min(points_per_cycle - 1, phase_idx))
-
-                        for feature_name, limits in phase_variables.items():
-                            idx = feature_index.get(feature_name)
-                            if idx is None:
-                                continue
-
-                            values = data_3d[:, phase_idx, idx]
-                            values = values[np.isfinite(values)]
-                            if values.size == 0:
-                                continue
-
-                            min_val = limits.get('min')
-                            max_val = limits.get('max')
-                            if min_val is None and max_val is None:
-                                continue
-
-                            below = int(np.sum(values < min_val)) if min_val is not None else 0
-                            above = int(np.sum(values > max_val)) if max_val is not None else 0
-
-                            if below or above:
-                                phase_stats = feature_phase_stats.setdefault(feature_name, {})
-                                stats_entry = phase_stats.setdefault(phase_pct, {'below': 0, 'above': 0})
-                                stats_entry['below'] += below
-                                stats_entry['above'] += above
-
-        feature_failures = []
-        for feature, indices in violations.items():
-            unique_indices = len(set(indices))
-            failed_percentage = (unique_indices / total_strides) if total_strides else 0.0
-
-            phase_breakdown = []
-            for phase_pct, counts in feature_phase_stats.get(feature, {}).items():
-                phase_breakdown.append({
-                    'phase': phase_pct,
-                    'below': counts.get('below', 0),
-                    'above': counts.get('above', 0)
-                })
-
-            phase_breakdown.sort(key=lambda item: item['below'] + item['above'], reverse=True)
-
-            feature_failures.append({
-                'feature': feature,
-                'failed_strides': unique_indices,
-                'failed_percentage': failed_percentage,
-                'phase_breakdown': phase_breakdown
-            })
-
-        feature_failures.sort(key=lambda item: item['failed_strides'], reverse=True)
-
-        task_details[task] = {
-            'total_strides': total_strides,
-            'failing_strides': failing_strides,
-            'pass_rate': pass_rate,
-            'feature_failures': feature_failures
-        }
-
-    return task_details
-
-
 def _report_task_registry_mismatches(dataset_tasks: List[str], range_tasks: List[str]) -> bool:
     """Warn about tasks missing from the canonical registry or ranges."""
 
@@ -931,6 +802,13 @@ def main():
         "--compare",
         help="Compare results to a previous summary JSON file"
     )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Validate tasks in parallel across N worker processes (default: 1)"
+    )
     
     args = parser.parse_args()
     
@@ -954,26 +832,21 @@ def main():
     print(f"📋 Using ranges: {ranges_file.name}")
     
     try:
-        dataset_tasks: List[str] = []
-        try:
-            dataset_tasks = _collect_dataset_tasks(dataset_path)
-        except Exception as exc:
-            print(f"\n⚠️  Could not inspect dataset tasks: {exc}")
-
-        # Initialize validator
+        # Initialize validator and load the dataset once for every step below
         validator = Validator(config_path=ranges_file)
+        session = ValidationSession(dataset_path, validator, workers=args.workers)
         range_tasks = list(validator.config_manager.get_tasks())
 
-        registry_ok = _report_task_registry_mismatches(dataset_tasks, range_tasks)
+        registry_ok = _report_task_registry_mismatches(session.tasks, range_tasks)
 
         # Run validation
-        result = validator.validate(str(dataset_path))
+        result = session.result
         mode = result.get('mode', 'phase')
 
         task_details = None
         if mode == 'phase':
             try:
-                task_details = _compute_task_statistics(dataset_path, validator, result)
+                task_details = session.task_statistics()
             except Exception as exc:
                 print(f"\n⚠️  Could not compute per-task statistics: {exc}")
 
@@ -1001,8 +874,7 @@ def main():
                 print("\n⚠️  Plots are only available for phase-indexed datasets. Skipping plot generation.")
             else:
                 generate_plots(
-                    dataset_path=str(dataset_path),
-                    validator=validator,
+                    session=session,
                     task_filter=args.task,
                     output_dir=args.output_dir,
                     use_column_names=args.use_column_names,
@@ -5,6 +5,10 @@ Core classes and functions for biomechanical data processing.
 """
 
 from .locomotion_data import LocomotionData, efficient_reshape_3d
+from .cycle_cache import CycleCache, CacheInfo
+from .cycle_stats import CycleStats
+from .cycle_limits import CycleValidation, LimitsTable
+from .population import PopulationAggregator, aggregate_parquet_files
 from .feature_constants import (
     ANGLE_FEATURES,
     VELOCITY_FEATURES, 
@@ -22,6 +26,13 @@ __version__ = "0.1.0"
 __all__ = [
     'LocomotionData',
     'efficient_reshape_3d',
+    'CycleCache',
+    'CacheInfo',
+    'CycleStats',
+    'CycleValidation',
+    'LimitsTable',
+    'PopulationAggregator',
+    'aggregate_parquet_files',
     'ANGLE_FEATURES',
     'VELOCITY_FEATURES',
     'MOMENT_FEATURES',
@@ -0,0 +1,136 @@
+"""Uncompressed Arrow IPC sidecar cache for parquet datasets.
+
+Decoding a compressed parquet file dominates the start-up time of every tool
+that loads a phase dataset.  The first load writes the decoded table next to
+the parquet file as an uncompressed Arrow IPC file (``<name>.parquet.arrow``);
+later loads memory-map it, so opening is near-instant and the pages are shared
+by all processes on the host that read the same dataset.
+
+The cache records the size and modification time of the parquet file it was
+built from and is rebuilt when either changes.  Set the ``LOCOHUB_ARROW_CACHE``
+environment variable to ``1`` to enable the cache for every LocomotionData
+created without an explicit ``arrow_cache`` argument (e.g. in the CLI tools).
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import warnings
+from pathlib import Path
+from typing import List, Optional, Union
+
+ARROW_CACHE_ENV_VAR = "LOCOHUB_ARROW_CACHE"
+CACHE_SUFFIX = ".arrow"
+
+_SIZE_KEY = b"locohub_source_size"
+_MTIME_KEY = b"locohub_source_mtime_ns"
+
+
+def arrow_cache_enabled(setting: Optional[Union[bool, str, Path]]) -> bool:
+    """Resolve an ``arrow_cache`` argument, falling back to the environment."""
+    if setting is None:
+        return os.environ.get(ARROW_CACHE_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+    return setting is not False
+
+
+def cache_path_for(data_path: Union[str, Path],
+                   setting: Optional[Union[bool, str, Path]] = True) -> Path:
+    """Sidecar location: an explicit path, or ``<data_path>.arrow`` next to the file."""
+    if isinstance(setting, (str, Path)):
+        return Path(setting)
+    data_path = Path(data_path)
+    return data_path.with_name(data_path.name + CACHE_SUFFIX)
+
+
+def _source_key(data_path: Path) -> dict:
+    stat = data_path.stat()
+    return {_SIZE_KEY: str(stat.st_size).encode(), _MTIME_KEY: str(stat.st_mtime_ns).encode()}
+
+
+def open_cached_table(data_path: Union[str, Path], cache_path: Union[str, Path]):
+    """
+    Memory-map the sidecar cache if it matches the current parquet file.
+
+    Returns
+    -------
+    pyarrow.Table or None
+        Table backed by the memory-mapped file, or None if the cache is
+        missing, stale or unreadable.
+    """
+    import pyarrow as pa
+
+    cache_path = Path(cache_path)
+    if not cache_path.exists():
+        return None
+    try:
+        reader = pa.ipc.open_file(pa.memory_map(str(cache_path), "r"))
+        metadata = reader.schema.metadata or {}
+        key = _source_key(Path(data_path))
+        if any(metadata.get(name) != value for name, value in key.items()):
+            return None
+        return reader.read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None
+
+
+def build_cache(data_path: Union[str, Path], cache_path: Union[str, Path]):
+    """
+    Decode the parquet file once and write it as an uncompressed IPC file.
+
+    The file is written to a temporary name and renamed into place, so
+    concurrent readers never see a partial cache.  If the cache cannot be
+    written (e.g. a read-only dataset directory) the decoded table is returned
+    and a warning is issued.
+
+    Returns
+    -------
+    pyarrow.Table
+        Memory-mapped cache table, or the in-memory table if writing failed
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    data_path = Path(data_path)
+    cache_path = Path(cache_path)
+    key = _source_key(data_path)
+    table = pq.read_table(data_path)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **key})
+
+    tmp_name = None
+    try:
+        fd, tmp_name = tempfile.mkstemp(prefix=cache_path.name + ".", suffix=".tmp",
+                                        dir=str(cache_path.parent))
+        os.close(fd)
+        with pa.OSFile(tmp_name, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        # mkstemp creates owner-only files; the cache is meant to be shared
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, cache_path)
+        tmp_name = None
+    except OSError as e:
+        warnings.warn(f"Could not write Arrow cache {cache_path}: {e}")
+        return table
+    finally:
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+    cached = open_cached_table(data_path, cache_path)
+    return cached if cached is not None else table
+
+
+def read_table(data_path: Union[str, Path], cache_path: Union[str, Path],
+               columns: Optional[List[str]] = None):
+    """Return the dataset (optionally only *columns*) from the cache, building it if needed."""
+    table = open_cached_table(data_path, cache_path)
+    if table is None:
+        table = build_cache(data_path, cache_path)
+    if columns is not None:
+        table = table.select(columns)
+    return table
+
+
+def table_to_pandas(table):
+    """Convert without consolidating blocks so non-null numeric columns can stay zero-copy."""
+    return table.to_pandas(split_blocks=True)
@@ -0,0 +1,122 @@
+"""Bounded cache for extracted cycle arrays.
+
+LocomotionData keeps the arrays returned by ``get_cycles`` in a cache so that
+repeated requests skip re-extraction.  ``CycleCache`` bounds that cache by entry
+count and/or total array bytes and evicts the least recently used entries once
+either budget is exceeded.  Any object exposing the same ``get``/``put``/
+``clear``/``info`` methods can be passed to LocomotionData instead.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Optional
+
+import numpy as np
+
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    ["hits", "misses", "evictions", "entries", "nbytes", "max_entries", "max_bytes"],
+)
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Approximate memory held by a cached value (arrays inside tuples/lists/dicts)."""
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(item) for item in value.values())
+    return int(getattr(value, "nbytes", 0) or 0)
+
+
+class CycleCache:
+    """
+    Least-recently-used cache with optional entry and byte budgets.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of cached entries. None means unbounded.
+    max_bytes : int, optional
+        Maximum total ``nbytes`` of cached arrays. None means unbounded.
+        Values larger than the whole budget are not stored.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        if max_entries is not None and max_entries < 0:
+            raise ValueError("max_entries must be non-negative")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: dict = {}
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a cached value and mark it as most recently used."""
+        if key not in self._entries:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting least recently used entries to stay in budget."""
+        size = estimate_nbytes(value)
+        if key in self._entries:
+            self._remove(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if self.max_entries == 0:
+            return
+
+        self._entries[key] = value
+        self._sizes[key] = size
+        self._nbytes += size
+        self._evict()
+
+    def clear(self) -> None:
+        """Drop all entries (statistics are kept)."""
+        self._entries.clear()
+        self._sizes.clear()
+        self._nbytes = 0
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss/eviction statistics and current usage."""
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=len(self._entries),
+            nbytes=self._nbytes,
+            max_entries=self.max_entries,
+            max_bytes=self.max_bytes,
+        )
+
+    def _remove(self, key: Hashable) -> None:
+        del self._entries[key]
+        self._nbytes -= self._sizes.pop(key)
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._nbytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
@@ -0,0 +1,162 @@
+"""Vectorized physiological plausibility checks of a (n_cycles, 150, n_features) cycle array.
+
+``LimitsTable`` compiles the per-feature limits of ``feature_constants``
+(or caller overrides) into lower/upper/jump arrays aligned with a feature
+list, so ``LocomotionData.validate_cycles`` checks every feature in one
+broadcast over the cycle array instead of a Python loop with substring
+tests.  The outcome is a per-cycle x per-feature bit mask of failure reasons.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .feature_constants import get_physiological_limits
+except ImportError:
+    # Fallback for standalone scripts
+    from feature_constants import get_physiological_limits
+
+
+# Failure reason bits of CycleValidation.reasons
+NONFINITE = np.uint8(1)
+BELOW_MIN = np.uint8(2)
+ABOVE_MAX = np.uint8(4)
+JUMP = np.uint8(8)
+REASON_NAMES = {'nonfinite': NONFINITE, 'below_min': BELOW_MIN, 'above_max': ABOVE_MAX, 'jump': JUMP}
+
+Limits = Tuple[Optional[float], Optional[float], Optional[float]]
+
+
+@dataclass(frozen=True)
+class LimitsTable:
+    """
+    Plausibility limits aligned with a feature list.
+
+    Attributes
+    ----------
+    feature_names : tuple of str
+        Feature order of the arrays
+    lower, upper : ndarray
+        Allowed value range per feature (``-inf``/``inf`` when unchecked)
+    max_jump : ndarray
+        Largest allowed change between consecutive phase points per feature
+        (``inf`` when unchecked)
+    """
+
+    feature_names: Tuple[str, ...]
+    lower: np.ndarray
+    upper: np.ndarray
+    max_jump: np.ndarray
+
+    @classmethod
+    def from_features(cls, feature_names: Sequence[str],
+                      overrides: Optional[Mapping[str, Limits]] = None) -> 'LimitsTable':
+        """
+        Compile the limits of ``feature_names``.
+
+        Parameters
+        ----------
+        feature_names : sequence of str
+            Features in cycle array order
+        overrides : mapping, optional
+            Feature -> (min, max, max jump) replacing the default limits;
+            None entries disable a check
+
+        Returns
+        -------
+        LimitsTable
+            Shared, read-only table when there are no overrides
+        """
+        if not overrides:
+            return _default_table(tuple(feature_names))
+        return cls._compile(tuple(feature_names), overrides)
+
+    @classmethod
+    def _compile(cls, feature_names: Tuple[str, ...],
+                 overrides: Optional[Mapping[str, Limits]] = None) -> 'LimitsTable':
+        overrides = overrides or {}
+        limits = [overrides[name] if name in overrides else get_physiological_limits(name)
+                  for name in feature_names]
+        limits = [entry if entry is not None else (None, None, None) for entry in limits]
+
+        def column(position: int, missing: float) -> np.ndarray:
+            values = np.array([missing if entry[position] is None else entry[position] for entry in limits],
+                              dtype=float)
+            values.flags.writeable = False
+            return values
+
+        return cls(feature_names, column(0, -np.inf), column(1, np.inf), column(2, np.inf))
+
+    def check(self, data_3d: np.ndarray) -> np.ndarray:
+        """
+        Failure reasons of every cycle and feature.
+
+        Parameters
+        ----------
+        data_3d : ndarray
+            Cycles of shape (n_cycles, 150, n_features) in table feature order
+
+        Returns
+        -------
+        reasons : ndarray
+            uint8 array of shape (n_cycles, n_features), an OR of the reason bits
+        """
+        finite = np.isfinite(data_3d)
+        reasons = np.where(finite.all(axis=1), 0, NONFINITE).astype(np.uint8)
+        # NaN compares False, so non-finite points only set NONFINITE
+        reasons |= np.where((data_3d < self.lower).any(axis=1), BELOW_MIN, 0).astype(np.uint8)
+        reasons |= np.where((data_3d > self.upper).any(axis=1), ABOVE_MAX, 0).astype(np.uint8)
+
+        jump_columns = np.flatnonzero(np.isfinite(self.max_jump))
+        if len(jump_columns) and data_3d.shape[1] > 1:
+            steps = np.abs(np.diff(data_3d[:, :, jump_columns], axis=1))
+            jumps = (steps > self.max_jump[jump_columns]).any(axis=1)
+            reasons[:, jump_columns] |= np.where(jumps, JUMP, 0).astype(np.uint8)
+        return reasons
+
+
+@lru_cache(maxsize=64)
+def _default_table(feature_names: Tuple[str, ...]) -> LimitsTable:
+    return LimitsTable._compile(feature_names)
+
+
+@dataclass(frozen=True)
+class CycleValidation:
+    """
+    Outcome of ``LocomotionData.validate_cycles(..., return_reasons=True)``.
+
+    Attributes
+    ----------
+    valid : ndarray
+        Boolean array of shape (n_cycles,), True where no feature failed
+    reasons : ndarray
+        uint8 array of shape (n_cycles, n_features) of reason bits
+        (``NONFINITE``, ``BELOW_MIN``, ``ABOVE_MAX``, ``JUMP``)
+    feature_names : list of str
+        Feature order of ``reasons``
+    """
+
+    valid: np.ndarray
+    reasons: np.ndarray
+    feature_names: List[str]
+
+    def mask(self, reason: str) -> np.ndarray:
+        """Boolean (n_cycles, n_features) mask of one reason, e.g. ``'jump'``."""
+        try:
+            bit = REASON_NAMES[reason]
+        except KeyError:
+            raise KeyError(f"Unknown reason '{reason}'; available: {list(REASON_NAMES)}") from None
+        return (self.reasons & bit) != 0
+
+    def summary(self) -> pd.DataFrame:
+        """Number of failing cycles per feature and reason."""
+        counts: Dict[str, np.ndarray] = {name: self.mask(name).sum(axis=0) for name in REASON_NAMES}
+        summary = pd.DataFrame(counts, index=self.feature_names)
+        summary.index.name = 'feature'
+        return summary
@@ -0,0 +1,167 @@
+"""Shared summary statistics of a (n_cycles, 150, n_features) cycle array.
+
+``get_mean_patterns``, ``get_std_patterns``, ``calculate_rom``,
+``find_outlier_cycles`` and ``get_summary_statistics`` all reduce the same
+cycles.  ``CycleStats`` computes the mean/std patterns up front (the common
+request) and the per-cycle extremes, outlier RMSE and quantiles on first
+access, so LocomotionData can cache one object next to the cycle arrays and
+serve each method from it without paying for statistics it does not use.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+DEFAULT_QUANTILES = (0.25, 0.5, 0.75)
+
+# Statistics computed on first access; cached in the instance __dict__
+_LAZY_ARRAYS = ('cycle_min', 'cycle_max', 'rmse_per_cycle', 'overall_min', 'overall_max')
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    # Instances are shared through the cycle cache
+    array.flags.writeable = False
+    return array
+
+
+@dataclass(frozen=True, eq=False)
+class CycleStats:
+    """
+    Statistics of one (subject, task, features) cycle array.
+
+    Attributes
+    ----------
+    feature_names : list of str
+        Feature order of every per-feature array
+    n_cycles : int
+        Number of cycles reduced
+    mean, std : ndarray
+        Phase patterns across cycles, shape (150, n_features); ``std`` is the
+        population standard deviation (``ddof=0``)
+    overall_mean, overall_std : ndarray
+        Statistics over all points of all cycles, shape (n_features,)
+    cycles : ndarray
+        The reduced cycle array, kept for the statistics computed on access
+    quantile_levels : tuple of float
+        Levels available from ``quantiles``
+
+    The following are computed on first access:
+
+    cycle_min, cycle_max : ndarray
+        Extremes of each cycle, shape (n_cycles, n_features)
+    rmse_per_cycle : ndarray
+        RMS deviation of each cycle from the mean pattern over all phases and
+        features, shape (n_cycles,)
+    overall_min, overall_max : ndarray
+        Extremes over all points, shape (n_features,)
+    quantiles : dict
+        Quantile level -> values over all points, shape (n_features,)
+    """
+
+    feature_names: List[str]
+    n_cycles: int
+    mean: np.ndarray
+    std: np.ndarray
+    overall_mean: np.ndarray
+    overall_std: np.ndarray
+    cycles: np.ndarray = field(repr=False)
+    quantile_levels: Tuple[float, ...] = DEFAULT_QUANTILES
+
+    @classmethod
+    def from_cycles(cls, data_3d: np.ndarray, feature_names: Sequence[str],
+                    quantiles: Sequence[float] = DEFAULT_QUANTILES) -> 'CycleStats':
+        """
+        Compute the mean/std statistics of a cycle array.
+
+        Parameters
+        ----------
+        data_3d : ndarray
+            Cycles of shape (n_cycles, 150, n_features)
+        feature_names : sequence of str
+            Names of the last axis
+        quantiles : sequence of float
+            Quantile levels in [0, 1] computed (on access) over all points
+
+        Returns
+        -------
+        CycleStats
+        """
+        mean = np.mean(data_3d, axis=0)
+        std = np.std(data_3d, axis=0)
+
+        # Every phase holds n_cycles points, so the overall moments follow
+        # from the phase moments (law of total variance)
+        overall_mean = np.mean(mean, axis=0)
+        overall_std = np.sqrt(np.mean(std ** 2 + (mean - overall_mean) ** 2, axis=0))
+
+        return cls(
+            feature_names=list(feature_names),
+            n_cycles=data_3d.shape[0],
+            mean=mean,
+            std=std,
+            overall_mean=overall_mean,
+            overall_std=overall_std,
+            cycles=data_3d,
+            quantile_levels=tuple(sorted({float(q) for q in quantiles})),
+        )
+
+    def __post_init__(self):
+        for array in (self.mean, self.std, self.overall_mean, self.overall_std):
+            _read_only(array)
+
+    @cached_property
+    def cycle_min(self) -> np.ndarray:
+        return _read_only(np.min(self.cycles, axis=1))
+
+    @cached_property
+    def cycle_max(self) -> np.ndarray:
+        return _read_only(np.max(self.cycles, axis=1))
+
+    @cached_property
+    def overall_min(self) -> np.ndarray:
+        return _read_only(np.min(self.cycle_min, axis=0))
+
+    @cached_property
+    def overall_max(self) -> np.ndarray:
+        return _read_only(np.max(self.cycle_max, axis=0))
+
+    @cached_property
+    def rmse_per_cycle(self) -> np.ndarray:
+        deviations = self.cycles - self.mean[np.newaxis, :, :]
+        squared = np.multiply(deviations, deviations, out=deviations)
+        return _read_only(np.sqrt(np.mean(squared, axis=(1, 2))))
+
+    @cached_property
+    def quantiles(self) -> Dict[float, np.ndarray]:
+        if not self.quantile_levels:
+            return {}
+        n_cycles, n_points, n_features = self.cycles.shape
+        # np.quantile partitions once for all requested levels
+        values = np.quantile(self.cycles.reshape(n_cycles * n_points, n_features),
+                             self.quantile_levels, axis=0)
+        return {level: _read_only(values[idx]) for idx, level in enumerate(self.quantile_levels)}
+
+    @property
+    def rom(self) -> np.ndarray:
+        """Range of motion of each cycle, shape (n_cycles, n_features)."""
+        return self.cycle_max - self.cycle_min
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the arrays (used by the cycle cache budget)."""
+        arrays = [self.mean, self.std, self.overall_mean, self.overall_std, self.cycles]
+        arrays += [self.__dict__[name] for name in _LAZY_ARRAYS if name in self.__dict__]
+        arrays += list(self.__dict__.get('quantiles', {}).values())
+        return int(sum(array.nbytes for array in arrays))
+
+    def quantile(self, q: float) -> np.ndarray:
+        """Values of quantile level ``q`` over all points, per feature."""
+        try:
+            return self.quantiles[float(q)]
+        except KeyError:
+            raise KeyError(f"Quantile {q} was not computed; available: {list(self.quantile_levels)}") from None
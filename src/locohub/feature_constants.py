@@ -31,7 +31,8 @@ Usage:
     data_array = data[:, :, feature_map['knee_flexion_angle_ipsi_rad']]  # Always gets correct index
 """
 
-from typing import Dict
+import math
+from typing import Dict, Optional, Tuple
 
 from locohub import task_registry as _task_registry
 
@@ -263,6 +264,55 @@ TIME_CANONICAL_COLUMNS = (
 )
 
 
+# Physiological plausibility limits per column group, used by
+# LocomotionData.validate_cycles: (min, max, max jump between consecutive
+# phase points).  None disables a check; non-finite values always fail.
+PHYSIOLOGICAL_LIMITS: Dict[str, Tuple[Optional[float], Optional[float], Optional[float]]] = {
+    'joint_angles': (-math.pi, math.pi, 0.5236),  # jump: 30 deg
+    'segment_angles': (-math.pi, math.pi, 0.5236),
+    'joint_velocities': (-17.45, 17.45, None),  # 1000 deg/s
+    'segment_velocities': (-17.45, 17.45, None),
+    'moments': (-300.0, 300.0, None),  # Nm
+    'moments_normalized': (-5.0, 5.0, None),  # Nm/kg
+    'assistance_moments': (-5.0, 5.0, None),
+    'biological_moments': (-5.0, 5.0, None),
+    'grf': (-15000.0, 15000.0, None),  # N
+    'grf_normalized': (-10.0, 10.0, None),  # BW
+}
+
+# Column group of non-canonical features, by unit suffix
+UNIT_LIMIT_GROUPS = {
+    '_rad': 'joint_angles',
+    '_rad_s': 'joint_velocities',
+    '_Nm': 'moments',
+    '_Nm_kg': 'moments_normalized',
+    '_N': 'grf',
+    '_BW': 'grf_normalized',
+}
+
+
+def get_physiological_limits(feature: str) -> Optional[Tuple[Optional[float], Optional[float], Optional[float]]]:
+    """
+    Get the (min, max, max jump) plausibility limits of a feature.
+
+    Canonical features use the limits of their column group; other features
+    fall back to the group of their unit suffix (e.g. ``_Nm`` vs ``_Nm_kg``).
+
+    Args:
+        feature: Standard variable name
+
+    Returns:
+        Limits tuple, or None if the feature has no physiological limits
+    """
+    for group, features in CANONICAL_COLUMN_GROUPS.items():
+        if group in PHYSIOLOGICAL_LIMITS and feature in features:
+            return PHYSIOLOGICAL_LIMITS[group]
+    for suffix, group in UNIT_LIMIT_GROUPS.items():
+        if feature.endswith(suffix):
+            return PHYSIOLOGICAL_LIMITS[group]
+    return None
+
+
 def get_kinematic_feature_map() -> Dict[str, int]:
     """
     Get feature index mapping for kinematic variables.
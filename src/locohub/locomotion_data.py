@@ -30,6 +30,7 @@ Quick Start:
     # Quality assessment
     valid_mask = loco.validate_cycles('SUB01', 'normal_walk')
     outliers = loco.find_outlier_cycles('SUB01', 'normal_walk')
+    flagged = loco.find_outliers_all(method='mahalanobis')
     
     # Variable name validation
     validation_report = loco.get_validation_report()
@@ -64,6 +65,7 @@ Variable Naming:
 All variable names must follow these standard conventions. Non-compliant names will raise an error.
 """
 
+import itertools
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -86,6 +88,11 @@ try:
         COP_FEATURES,
         LEGACY_GRF_ALIASES,
     )
+    from .cycle_cache import CycleCache, CacheInfo
+    from .cycle_stats import CycleStats, DEFAULT_QUANTILES
+    from .outliers import score_groups_parallel
+    from .cycle_limits import CycleValidation, LimitsTable
+    from .arrow_cache import arrow_cache_enabled, cache_path_for, read_table as read_arrow_table, table_to_pandas
 except ImportError:
     # Fallback for standalone scripts
     from feature_constants import (
@@ -100,6 +107,11 @@ except ImportError:
         COP_FEATURES,
         LEGACY_GRF_ALIASES,
     )
+    from cycle_cache import CycleCache, CacheInfo
+    from cycle_stats import CycleStats, DEFAULT_QUANTILES
+    from outliers import score_groups_parallel
+    from cycle_limits import CycleValidation, LimitsTable
+    from arrow_cache import arrow_cache_enabled, cache_path_for, read_table as read_arrow_table, table_to_pandas
 
 # Optional imports for visualization
 try:
@@ -114,6 +126,10 @@ try:
 except ImportError:
     SEABORN_AVAILABLE = False
 
+# Identifies the data behind cached cycle arrays, so instances that share one
+# cache (filtered views, or a cache passed to several datasets) never mix rows
+_CACHE_TOKENS = itertools.count()
+
 
 class LocomotionData:
     """
@@ -122,6 +138,9 @@ class LocomotionData:
     
     POINTS_PER_CYCLE = 150
     
+    # Label columns repeated on every row of a stride; stored as categoricals
+    CATEGORICAL_COLUMNS = ('subject', 'task', 'task_id', 'task_info')
+    
     # Standard variable naming convention: <joint>_<motion>_<measurement>_<side>_<unit>
     STANDARD_JOINTS = ['hip', 'knee', 'ankle', 'pelvis', 'trunk', 'thigh', 'shank', 'foot']
     STANDARD_MOTIONS = ['flexion', 'adduction', 'rotation', 'dorsiflexion', 'tilt', 'obliquity', 'lateral', 'progression',
@@ -141,7 +160,16 @@ class LocomotionData:
                  subject_col: str = 'subject',
                  task_col: str = 'task',
                  phase_col: str = 'phase_ipsi',
-                 file_type: str = 'auto'):
+                 file_type: str = 'auto',
+                 lazy: bool = False,
+                 cycle_store: bool = False,
+                 cycle_dtype: Union[str, np.dtype] = 'float64',
+                 cache_max_entries: Optional[int] = None,
+                 cache_max_bytes: Optional[int] = None,
+                 cache: Optional[CycleCache] = None,
+                 validate: str = 'fast',
+                 categorical: bool = True,
+                 arrow_cache: Optional[Union[bool, str, Path]] = None):
         """
         Initialize with phase-indexed locomotion data.
         
@@ -157,6 +185,46 @@ class LocomotionData:
             Column name for phase values
         file_type : str
             'parquet', 'csv', or 'auto' to detect from extension
+        lazy : bool
+            If True, only read the parquet schema and the subject/task/phase
+            columns up front. Feature columns are read on demand the first
+            time they are requested (e.g. by get_cycles) and then stay
+            resident in ``self.df``. Requires a parquet file.
+        cycle_store : bool
+            If True, materialise each task once as a single C-contiguous
+            (n_cycles, 150, n_features) array holding every feature. get_cycles
+            then returns read-only views into that array instead of caching a
+            copy per feature subset.
+        cycle_dtype : str or dtype
+            Dtype of the cycle store arrays, e.g. 'float32' to halve memory.
+            Only used when ``cycle_store`` is True.
+        cache_max_entries : int, optional
+            Maximum number of get_cycles results kept in the LRU cache.
+            None (default) means unbounded.
+        cache_max_bytes : int, optional
+            Maximum total bytes of cached arrays, e.g. 2_000_000_000.
+            Least recently used entries are evicted beyond this budget.
+        cache : CycleCache, optional
+            Cache object to use instead of creating one from the limits above.
+            Any object with CycleCache's get/put/clear/info methods works.
+            One cache can be shared by several datasets; entries are keyed
+            per dataset.
+        validate : str
+            Data format checks run on load:
+            'fast' (default) uses vectorized phase min/max and a grouped
+            nunique for time-indexed detection; 'full' scans every value and
+            loops over every subject-task group; 'off' skips the phase checks.
+            Required columns and variable names are always validated.
+        categorical : bool
+            If True (default), store the subject, task, task_id and task_info
+            columns as pandas categoricals so the per-row strings are held once
+            and masks/groupbys compare integer codes.
+        arrow_cache : bool or path, optional
+            Keep an uncompressed Arrow IPC copy of the parquet file (default
+            ``<data_path>.arrow``, or the given path) and memory-map it on later
+            loads. The cache is rebuilt when the parquet size or mtime changes.
+            None (default) enables it only if the LOCOHUB_ARROW_CACHE
+            environment variable is set to 1.
         
         Raises
         ------
@@ -169,6 +237,35 @@ class LocomotionData:
         self.subject_col = subject_col
         self.task_col = task_col
         self.phase_col = phase_col
+        if validate not in ('fast', 'full', 'off'):
+            raise ValueError(f"Unsupported validate mode: {validate}. Use 'fast', 'full', or 'off'")
+        self.lazy = lazy
+        self.validate_mode = validate
+        self.categorical = categorical
+        self.cycle_store = cycle_store
+        self.cycle_dtype = np.dtype(cycle_dtype)
+        
+        # Sidecar Arrow IPC cache (parquet only)
+        self._arrow_cache_path = None
+        if arrow_cache_enabled(arrow_cache):
+            is_parquet = file_type == 'parquet' or (file_type == 'auto' and self.data_path.suffix.lower() == '.parquet')
+            if is_parquet:
+                self._arrow_cache_path = cache_path_for(self.data_path, arrow_cache)
+            elif arrow_cache is not None:
+                raise ValueError(f"arrow_cache requires a parquet file, got {self.data_path.name}")
+        
+        # Lazy mode bookkeeping: full column list from the parquet schema and
+        # the on-disk name of columns renamed in-memory (legacy aliases)
+        self._schema_columns = None
+        self._column_sources = {}
+        
+        # Instance owning the DataFrame that row selections refer to; filtered
+        # instances point at the unfiltered data and materialise df on demand.
+        # Replacing df bumps _df_version; selections made before then are stale
+        self._source = self
+        self._base_rows = None
+        self._df_version = 0
+        self._source_version = 0
         
         # Validate file existence
         if not self.data_path.exists():
@@ -176,21 +273,45 @@ class LocomotionData:
         
         # Load data with enhanced error handling
         try:
-            self.df = self._load_data_with_validation(file_type)
+            if lazy:
+                self._df = self._load_index_columns(file_type)
+            else:
+                self._df = self._load_data_with_validation(file_type)
         except Exception as e:
             raise ValueError(f"Failed to load data from {self.data_path}: {str(e)}")
 
         # Apply legacy GRF naming aliases so older datasets continue to load
         self._apply_legacy_naming_aliases()
         
+        # Dictionary-encode the repeated label columns
+        self._df = self._encode_categoricals(self._df)
+        
         # Validate required columns
         self._validate_required_columns()
         
+        # Index (subject, task) row ranges once so extraction avoids full-table masks
+        self._build_row_index()
+        
         # Validate data format
-        self._validate_data_format()
+        self._validate_data_format(validate)
+        
+        # Bounded LRU cache for 3D arrays
+        if cache is None:
+            cache = CycleCache(max_entries=cache_max_entries, max_bytes=cache_max_bytes)
+        self._cache = cache
+        self._cache_token = next(_CACHE_TOKENS)
         
-        # Cache for 3D arrays
-        self._cache = {}
+        # Cache keys for all-subject results are scoped to the subjects held;
+        # None means the full dataset
+        self._cache_scope = None
+        
+        # Per-task (cycles, subject cycle offsets) arrays for cycle_store mode
+        self._task_stores = {}
+        
+        # Per-cycle metadata table (built on first use) and parsed task_info
+        # strings, each distinct string parsed once
+        self._cycle_table = None
+        self._parsed_task_info = {}
         
         # Identify biomechanical features
         self._identify_features()
@@ -203,9 +324,10 @@ class LocomotionData:
         Rename legacy GRF columns (vertical_grf_*, anterior_grf_*, lateral_grf_*)
         to the new <signal_type>_<axis>_<side>_<unit> schema in-place.
         """
+        available_columns = self._available_columns()
         renamed = {}
         for old, new in LEGACY_GRF_ALIASES.items():
-            if old in self.df.columns and new not in self.df.columns:
+            if old in available_columns and new not in available_columns:
                 renamed[old] = new
         if renamed:
             warnings.warn(
@@ -214,7 +336,163 @@ class LocomotionData:
                 + "; ".join(f"{o}→{n}" for o, n in renamed.items()),
                 UserWarning,
             )
-            self.df = self.df.rename(columns=renamed)
+            self._df = self._df.rename(columns=renamed)
+            if self._schema_columns is not None:
+                self._schema_columns = [renamed.get(col, col) for col in self._schema_columns]
+                self._column_sources.update({new: old for old, new in renamed.items()})
+    
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        Underlying phase-indexed DataFrame.
+        
+        Filtered instances hold only a row selection over the unfiltered data;
+        their DataFrame is built from it on first access.  Assigning a new
+        DataFrame invalidates instances filtered from this one: reading their
+        rows raises RuntimeError.
+        """
+        if self._df is None:
+            frame = self._frame
+            self._df = frame.iloc[_expand_rows(self._base_rows)]
+        return self._df
+    
+    @df.setter
+    def df(self, value: pd.DataFrame) -> None:
+        # A replaced DataFrame owns its rows: detach from any parent data and
+        # rebuild everything derived from the old row layout
+        self._df = value
+        self._source = self
+        self._base_rows = None
+        self._df_version += 1
+        self._source_version = self._df_version
+        self._task_stores = {}
+        self._cycle_table = None
+        self._cache = CycleCache(max_entries=getattr(self._cache, 'max_entries', None),
+                                 max_bytes=getattr(self._cache, 'max_bytes', None))
+        self._cache_token = next(_CACHE_TOKENS)
+        self._cache_scope = None
+        self._build_row_index()
+    
+    def _check_source(self) -> None:
+        """Raise if the data this instance selects rows from was replaced."""
+        if self._source_version != self._source._df_version:
+            raise RuntimeError(
+                "The data this instance was filtered from has been replaced "
+                "(df was reassigned); filter the updated data again"
+            )
+    
+    @property
+    def _frame(self) -> pd.DataFrame:
+        """DataFrame that ``_base_rows`` and the row index point into."""
+        self._check_source()
+        return self._source._df
+    
+    def _available_columns(self) -> List[str]:
+        """Columns present in the dataset, including ones not yet loaded in lazy mode."""
+        if self._schema_columns is not None:
+            return self._schema_columns
+        return list(self._frame.columns)
+    
+    def _load_index_columns(self, file_type: str) -> pd.DataFrame:
+        """Read the parquet schema and only the subject/task/phase columns (lazy mode)."""
+        import pyarrow.parquet as pq
+        
+        if file_type not in ('auto', 'parquet'):
+            raise ValueError(f"Lazy loading requires a parquet file, got file_type '{file_type}'")
+        
+        try:
+            schema_columns = pq.ParquetFile(self.data_path).schema_arrow.names
+        except Exception as e:
+            raise ValueError(f"Failed to read parquet schema: {str(e)}")
+        
+        # Skip serialized pandas index columns, they are not data columns
+        self._schema_columns = [col for col in schema_columns
+                                if not col.startswith('__index_level_')]
+        
+        index_cols = [col for col in (self.subject_col, self.task_col, self.phase_col)
+                      if col in self._schema_columns]
+        df = self._read_parquet(index_cols)
+        
+        # Positional index so lazily loaded columns can be aligned by row number
+        df.index = pd.RangeIndex(len(df))
+        return df
+    
+    def load_columns(self, columns: List[str]) -> List[str]:
+        """
+        Make dataset columns resident in ``self.df``.
+        
+        In lazy mode, columns that are not loaded yet are read from the parquet
+        file (only those columns) and appended to ``self.df``. Eagerly loaded
+        datasets already hold every column, so this is a no-op for them.
+        
+        Parameters
+        ----------
+        columns : list of str
+            Column names to load. Names not present in the dataset are ignored.
+        
+        Returns
+        -------
+        list of str
+            Columns that were read from disk by this call
+        """
+        if self._source is not self:
+            # Columns are read into the unfiltered data and shared with it
+            self._check_source()
+            loaded = self._source.load_columns(columns)
+            if self._df is not None:
+                frame = self._frame
+                absent = [col for col in dict.fromkeys(columns)
+                          if col in frame.columns and col not in self._df.columns]
+                if absent:
+                    extra = frame.iloc[_expand_rows(self._base_rows), frame.columns.get_indexer(absent)]
+                    self._df = pd.concat([self._df, extra], axis=1)
+            return loaded
+        
+        available = set(self._available_columns())
+        missing = [col for col in dict.fromkeys(columns)
+                   if col in available and col not in self._df.columns]
+        if not missing:
+            return []
+        
+        sources = [self._column_sources.get(col, col) for col in missing]
+        try:
+            loaded = self._read_parquet(sources)
+        except Exception as e:
+            raise ValueError(f"Failed to load columns {missing} from {self.data_path}: {str(e)}")
+        loaded.columns = missing
+        loaded.index = pd.RangeIndex(len(loaded))
+        loaded = self._encode_categoricals(loaded)
+        
+        # A replaced DataFrame may keep only some rows of the file (by label)
+        if not loaded.index.equals(self._df.index):
+            loaded = loaded.iloc[self._df.index.to_numpy()]
+            loaded.index = self._df.index
+        
+        self._df = pd.concat([self._df, loaded], axis=1)
+        return missing
+    
+    def _read_parquet(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read parquet columns, through the memory-mapped Arrow cache when enabled."""
+        if self._arrow_cache_path is None:
+            return pd.read_parquet(self.data_path, columns=columns)
+        return table_to_pandas(read_arrow_table(self.data_path, self._arrow_cache_path, columns))
+    
+    def _encode_categoricals(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert label columns (subject, task, task_id, task_info) to categoricals."""
+        if not self.categorical:
+            return df
+        
+        for col in dict.fromkeys((self.subject_col, self.task_col) + self.CATEGORICAL_COLUMNS):
+            if col not in df.columns:
+                continue
+            values = df[col]
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                df[col] = values.astype('category')
+            elif not values.cat.categories.is_monotonic_increasing:
+                # Dictionaries written by other tools may be unsorted; keep
+                # sorted categories so sorted groupbys match string order
+                df[col] = values.cat.set_categories(values.cat.categories.sort_values())
+        return df
     
     def _load_data_with_validation(self, file_type: str) -> pd.DataFrame:
         """Load data with format detection and validation."""
@@ -241,7 +519,7 @@ class LocomotionData:
         # Load based on specified type
         if file_type == 'parquet':
             try:
-                df = pd.read_parquet(self.data_path)
+                df = self._read_parquet()
             except Exception as e:
                 raise ValueError(f"Failed to read parquet file: {str(e)}")
         elif file_type == 'csv':
@@ -266,50 +544,67 @@ class LocomotionData:
                         f"Hint: Use custom column names in constructor if your data uses different names")
             raise ValueError(error_msg)
     
-    def _validate_data_format(self):
+    def _build_row_index(self) -> None:
+        """
+        Build the (subject, task) -> row selection index.
+        
+        Uses one groupby pass per key set at load time. Each entry is a slice when
+        the group's rows are contiguous in the file (the usual layout for converted
+        datasets) and an array of row positions otherwise, so get_cycles and
+        filter never rebuild boolean masks over the full DataFrame.
+        """
+        group_rows = self.df.groupby([self.subject_col, self.task_col],
+                                     sort=True, observed=True).indices
+        self.row_index = {key: _compact_rows(rows) for key, rows in group_rows.items()}
+        
+        task_rows = self.df.groupby(self.task_col, sort=True, observed=True).indices
+        self._task_rows = {task: _compact_rows(rows) for task, rows in task_rows.items()}
+    
+    def get_row_selection(self, subject: Optional[str],
+                          task: str) -> Optional[Union[slice, np.ndarray]]:
+        """
+        Get the rows of ``df`` holding a subject-task combination.
+        
+        Parameters
+        ----------
+        subject : str or None
+            Subject ID. If None, returns the rows of all subjects for the task.
+        task : str
+            Task name
+        
+        Returns
+        -------
+        slice or ndarray or None
+            Positional row selection, or None if the combination is not present.
+            Positions refer to the unfiltered dataset's ``df`` (for filtered
+            instances, the DataFrame of the instance they were filtered from).
+        """
+        if subject is None:
+            return self._task_rows.get(task)
+        return self.row_index.get((subject, task))
+    
+    def _take_rows(self, rows: Union[slice, np.ndarray], columns: List[str]) -> np.ndarray:
+        """Copy only the selected rows of the requested columns into an array."""
+        frame = self._frame
+        col_positions = frame.columns.get_indexer(columns)
+        return frame.iloc[rows, col_positions].to_numpy()
+    
+    def _validate_data_format(self, mode: str = 'full'):
         """Validate basic data format requirements."""
         # Check for empty dataset
         if len(self.df) == 0:
             raise ValueError("Dataset is empty")
         
         # Check for phase data format
-        if self.phase_col in self.df.columns:
-            phase_values = self.df[self.phase_col].dropna()
-            
-            if len(phase_values) == 0:
-                warnings.warn("Phase column contains only NaN values")
+        if mode != 'off' and self.phase_col in self.df.columns:
+            if mode == 'full':
+                self._check_phase_values_full()
             else:
-                # Check phase range - avoid numpy compatibility issues
-                try:
-                    # Convert to list first to avoid numpy issues
-                    phase_list = phase_values.tolist()
-                    min_phase, max_phase = min(phase_list), max(phase_list)
-                except (TypeError, ValueError, AttributeError):
-                    # Skip range check if there are issues
-                    min_phase, max_phase = 0.0, 100.0
-                
-                if min_phase < 0 or max_phase > 100:
-                    warnings.warn(f"Phase values outside expected range [0-100]: [{min_phase:.1f}, {max_phase:.1f}]")
-                
-                # Check for time-indexed vs phase-indexed data
-                if 'time' in self.df.columns or 'time_s' in self.df.columns:
-                    # Detect if this is time-indexed data
-                    phase_unique_per_subject_task = []
-                    for (subject, task), group in self.df.groupby([self.subject_col, self.task_col]):
-                        phase_unique_per_subject_task.append(group[self.phase_col].nunique())
-                    
-                    avg_unique_phases = np.mean(phase_unique_per_subject_task)
-                    
-                    if avg_unique_phases < 100:  # Likely time-indexed
-                        warnings.warn(
-                            f"Data appears to be time-indexed (avg {avg_unique_phases:.1f} unique phase values per subject-task). "
-                            f"LocomotionData works best with phase-indexed data (150 points per cycle). "
-                            f"Consider converting to phase-indexed format."
-                        )
-        
-        # Check for reasonable data dimensions
-        n_subjects = self.df[self.subject_col].nunique()
-        n_tasks = self.df[self.task_col].nunique()
+                self._check_phase_values_fast()
+        
+        # Check for reasonable data dimensions (from the row index, no extra pass)
+        n_subjects = len(self.get_subjects())
+        n_tasks = len(self.get_tasks())
         
         if n_subjects == 0:
             raise ValueError("No subjects found in dataset")
@@ -317,26 +612,111 @@ class LocomotionData:
             raise ValueError("No tasks found in dataset")
         
         print(f"Data validation passed: {n_subjects} subjects, {n_tasks} tasks")
+    
+    def _warn_time_indexed(self, avg_unique_phases: float) -> None:
+        """Warn when phase values look like they come from time-indexed data."""
+        if avg_unique_phases < 100:  # Likely time-indexed
+            warnings.warn(
+                f"Data appears to be time-indexed (avg {avg_unique_phases:.1f} unique phase values per subject-task). "
+                f"LocomotionData works best with phase-indexed data (150 points per cycle). "
+                f"Consider converting to phase-indexed format."
+            )
+    
+    def _check_phase_values_fast(self):
+        """Phase checks using vectorized reductions only."""
+        phase = self.df[self.phase_col]
+        try:
+            min_phase, max_phase = phase.min(), phase.max()
+        except (TypeError, ValueError):
+            # Skip range check if there are issues
+            min_phase, max_phase = 0.0, 100.0
         
-    def _identify_features(self):
-        """Identify available biomechanical features in the dataset."""
-        exclude_cols = {self.subject_col, self.task_col, self.phase_col, 
+        if pd.isna(min_phase):
+            warnings.warn("Phase column contains only NaN values")
+            return
+        
+        if min_phase < 0 or max_phase > 100:
+            warnings.warn(f"Phase values outside expected range [0-100]: [{min_phase:.1f}, {max_phase:.1f}]")
+        
+        # Check for time-indexed vs phase-indexed data over every subject-task group
+        available_columns = self._available_columns()
+        if 'time' in available_columns or 'time_s' in available_columns:
+            unique_phases = self.df.groupby([self.subject_col, self.task_col], observed=True)[self.phase_col].nunique()
+            if len(unique_phases):
+                self._warn_time_indexed(unique_phases.mean())
+    
+    def _check_phase_values_full(self):
+        """Phase checks over every value and every subject-task group."""
+        phase_values = self.df[self.phase_col].dropna()
+        
+        if len(phase_values) == 0:
+            warnings.warn("Phase column contains only NaN values")
+        else:
+            # Check phase range - avoid numpy compatibility issues
+            try:
+                # Convert to list first to avoid numpy issues
+                phase_list = phase_values.tolist()
+                min_phase, max_phase = min(phase_list), max(phase_list)
+            except (TypeError, ValueError, AttributeError):
+                # Skip range check if there are issues
+                min_phase, max_phase = 0.0, 100.0
+            
+            if min_phase < 0 or max_phase > 100:
+                warnings.warn(f"Phase values outside expected range [0-100]: [{min_phase:.1f}, {max_phase:.1f}]")
+            
+            # Check for time-indexed vs phase-indexed data
+            available_columns = self._available_columns()
+            if 'time' in available_columns or 'time_s' in available_columns:
+                # Detect if this is time-indexed data
+                phase_unique_per_subject_task = []
+                for (subject, task), group in self.df.groupby([self.subject_col, self.task_col], observed=True):
+                    phase_unique_per_subject_task.append(group[self.phase_col].nunique())
+                
+                avg_unique_phases = np.mean(phase_unique_per_subject_task)
+                self._warn_time_indexed(avg_unique_phases)
+        
+    @staticmethod
+    def feature_columns(columns: List[str], subject_col: str = 'subject',
+                        task_col: str = 'task', phase_col: str = 'phase_ipsi') -> List[str]:
+        """
+        Select the biomechanical feature columns from a list of column names.
+        
+        Used for loaded datasets and for tools that only read a file's schema.
+        
+        Parameters
+        ----------
+        columns : list of str
+            Column names in file order
+        subject_col, task_col, phase_col : str
+            Metadata column names to exclude
+        
+        Returns
+        -------
+        list of str
+            Feature columns, in the order given
+        """
+        exclude_cols = {subject_col, task_col, phase_col, 
                        'time', 'time_s', 'step_number', 'is_reconstructed_r', 
                        'is_reconstructed_l', 'task_info', 'task_id', 'activity_number', 
                        'cycle', 'step', 'leading_leg_step'}
         
         # Identify biomechanical features - only standard naming accepted
         # Include CoP columns as biomechanical features
-        self.features = [col for col in self.df.columns 
-                        if col not in exclude_cols and 
-                        any(x in col for x in ['angle', 'velocity', 'moment', 'power', 'grf', 'cop'])]
+        return [col for col in columns
+                if col not in exclude_cols and 
+                any(x in col for x in ['angle', 'velocity', 'moment', 'power', 'grf', 'cop'])]
+    
+    def _identify_features(self):
+        """Identify available biomechanical features in the dataset."""
+        self.features = self.feature_columns(self._available_columns(), self.subject_col,
+                                             self.task_col, self.phase_col)
         
         # Create identity mapping for standard features
         self.feature_mappings = {feature: feature for feature in self.features}
         
         # Store unique subjects and tasks for external access
-        self.subjects = sorted(self.df[self.subject_col].unique())
-        self.tasks = sorted(self.df[self.task_col].unique())
+        self.subjects = self.get_subjects()
+        self.tasks = self.get_tasks()
         
         print(f"Loaded data with {len(self.df)} rows, {len(self.subjects)} subjects, "
               f"{len(self.tasks)} tasks, {len(self.features)} features")
@@ -470,16 +850,22 @@ class LocomotionData:
     
     def get_subjects(self) -> List[str]:
         """Get list of unique subjects."""
-        return sorted(self.df[self.subject_col].unique())
+        return sorted({subject for subject, _ in self.row_index})
     
     def get_tasks(self) -> List[str]:
         """Get list of unique tasks."""
-        return sorted(self.df[self.task_col].unique())
+        return sorted(self._task_rows)
     
-    def filter(self, subject=None, task=None, subjects=None, tasks=None, **kwargs):
+    def filter(self, subject=None, task=None, subjects=None, tasks=None,
+               share_cache: bool = True, **kwargs):
         """
         General purpose filter returning new LocomotionData instance.
         
+        The new instance holds only a row selection over this instance's data,
+        so filtering (and chained filtering) costs O(selected rows). Its ``df``
+        is materialised on first access; get_cycles reads the selected rows
+        directly without building it.
+        
         Parameters
         ----------
         subject : str or list, optional
@@ -490,6 +876,11 @@ class LocomotionData:
             Alternative to subject for multiple subjects
         tasks : list, optional
             Alternative to task for multiple tasks
+        share_cache : bool
+            If True (default), the new instance reuses this instance's cycle
+            cache, so cycles already extracted for a subject-task pair are not
+            extracted again. If False, it starts with an empty cache of the
+            same limits.
         **kwargs : dict
             Additional filters (not implemented yet)
         
@@ -503,37 +894,71 @@ class LocomotionData:
         >>> filtered = data.filter(subject='SUB01', task='level_walking')
         >>> filtered = data.filter(subjects=['SUB01', 'SUB02'], task='level_walking')
         """
-        filtered_df = self.df.copy()
-        
-        # Handle subject filtering
         subject_filter = subjects if subjects is not None else subject
-        if subject_filter is not None:
-            if isinstance(subject_filter, str):
-                filtered_df = filtered_df[filtered_df[self.subject_col] == subject_filter]
-            else:  # list
-                filtered_df = filtered_df[filtered_df[self.subject_col].isin(subject_filter)]
-        
-        # Handle task filtering
         task_filter = tasks if tasks is not None else task
-        if task_filter is not None:
-            if isinstance(task_filter, str):
-                filtered_df = filtered_df[filtered_df[self.task_col] == task_filter]
-            else:  # list
-                filtered_df = filtered_df[filtered_df[self.task_col].isin(task_filter)]
+        if isinstance(subject_filter, str):
+            subject_filter = [subject_filter]
+        if isinstance(task_filter, str):
+            task_filter = [task_filter]
+        subject_set = set(subject_filter) if subject_filter is not None else None
+        task_set = set(task_filter) if task_filter is not None else None
+        
+        # Select (subject, task) groups from the index; no rows are copied here
+        row_index = {
+            (subj, tsk): rows for (subj, tsk), rows in self.row_index.items()
+            if (subject_set is None or subj in subject_set)
+            and (task_set is None or tsk in task_set)
+        }
+        if subject_set is None and task_set is None:
+            base_rows = self._base_rows if self._base_rows is not None else slice(0, len(self._frame))
+        else:
+            base_rows = _merge_rows(list(row_index.values()))
         
-        # Create new instance with filtered data
+        task_groups = {}
+        for (subj, tsk), rows in row_index.items():
+            task_groups.setdefault(tsk, []).append(rows)
+        
+        # Create new instance holding a row selection over the same data
         new_instance = LocomotionData.__new__(LocomotionData)
-        new_instance.df = filtered_df
+        new_instance._source = self._source
+        new_instance._base_rows = base_rows
+        new_instance._df_version = 0
+        new_instance._source_version = self._source_version
+        new_instance._df = None
+        new_instance.row_index = row_index
+        new_instance._task_rows = {tsk: _merge_rows(groups) for tsk, groups in task_groups.items()}
         new_instance.subject_col = self.subject_col
         new_instance.task_col = self.task_col
         new_instance.phase_col = self.phase_col
         new_instance.features = self.features
         new_instance.feature_mappings = self.feature_mappings if hasattr(self, 'feature_mappings') else {}
-        new_instance.subjects = sorted(filtered_df[self.subject_col].unique())
-        new_instance.tasks = sorted(filtered_df[self.task_col].unique())
+        new_instance.subjects = new_instance.get_subjects()
+        new_instance.tasks = new_instance.get_tasks()
         new_instance.validation_report = None  # Reset validation
-        new_instance._cache = {}  # Initialize cache for new instance
+        if share_cache:
+            new_instance._cache = self._cache
+        else:
+            new_instance._cache = CycleCache(
+                max_entries=getattr(self._cache, 'max_entries', None),
+                max_bytes=getattr(self._cache, 'max_bytes', None),
+            )
+        new_instance._cache_token = self._cache_token
+        if subject_set is not None:
+            new_instance._cache_scope = frozenset(new_instance.subjects)
+        else:
+            new_instance._cache_scope = self._cache_scope
         new_instance.data_path = self.data_path if hasattr(self, 'data_path') else None
+        new_instance.lazy = self.lazy
+        new_instance.validate_mode = self.validate_mode
+        new_instance.categorical = self.categorical
+        new_instance._arrow_cache_path = self._arrow_cache_path
+        new_instance.cycle_store = self.cycle_store
+        new_instance.cycle_dtype = self.cycle_dtype
+        new_instance._task_stores = {}
+        new_instance._cycle_table = None
+        new_instance._parsed_task_info = self._parsed_task_info
+        new_instance._schema_columns = self._schema_columns
+        new_instance._column_sources = self._column_sources
         
         return new_instance
     
@@ -601,10 +1026,29 @@ class LocomotionData:
         """
         return self.filter(subjects=subjects)
     
+    def cache_info(self) -> CacheInfo:
+        """
+        Get cycle cache statistics.
+        
+        Returns
+        -------
+        CacheInfo
+            Named tuple with hits, misses, evictions, entries, nbytes,
+            max_entries and max_bytes
+        """
+        return self._cache.info()
+    
+    def clear_cache(self):
+        """Drop cached cycle arrays (shared with filtered instances) and cycle stores."""
+        self._cache.clear()
+        self._task_stores = {}
+    
     @property
     def shape(self):
         """Return shape of underlying dataframe."""
-        return self.df.shape
+        if self._df is None:
+            return (_count_rows(self._base_rows), len(self._frame.columns))
+        return self._df.shape
     
     def memory_usage(self):
         """Return memory usage of underlying dataframe in bytes."""
@@ -630,7 +1074,7 @@ class LocomotionData:
     
     def __len__(self):
         """Return number of rows in dataset."""
-        return len(self.df)
+        return self.shape[0]
     
     def parse_task_info(self, task_info_str: str) -> Dict[str, Union[str, float, bool, int]]:
         """
@@ -684,6 +1128,158 @@ class LocomotionData:
         
         return result
     
+    def _parse_task_info_cached(self, task_info_str: str) -> Dict[str, Union[str, float, bool, int]]:
+        """parse_task_info memoised per distinct string (shared with filtered instances)."""
+        if pd.isna(task_info_str):
+            return {}
+        if task_info_str not in self._parsed_task_info:
+            self._parsed_task_info[task_info_str] = self.parse_task_info(task_info_str)
+        return self._parsed_task_info[task_info_str]
+    
+    def get_cycle_table(self) -> pd.DataFrame:
+        """
+        Get per-cycle metadata with task_info parsed into typed columns.
+        
+        Each distinct task_info string is parsed once; the table is built on
+        first use and cached.
+        
+        Returns
+        -------
+        pd.DataFrame
+            One row per cycle, ordered like ``get_cycles_batch()`` (subject, then
+            task, cycles in file order): subject, task, cycle (index within its
+            subject-task group), step and task_id when present, then one column
+            per task_info key (e.g. incline_deg, speed_m_s, treadmill). Keys
+            missing from a cycle's task_info are NaN.
+        
+        Examples
+        --------
+        >>> table = loco.get_cycle_table()
+        >>> table.groupby('task')['speed_m_s'].describe()
+        """
+        if self._cycle_table is None:
+            self._cycle_table = self._build_cycle_table()
+        return self._cycle_table[0]
+    
+    def _build_cycle_table(self) -> Tuple[pd.DataFrame, np.ndarray, List]:
+        """Build (table, group id per cycle, row selection per group)."""
+        groups = [(subject, task, rows) for (subject, task), rows in self.row_index.items()
+                  if _count_rows(rows) % self.POINTS_PER_CYCLE == 0]
+        n_cycles = [_count_rows(rows) // self.POINTS_PER_CYCLE for _, _, rows in groups]
+        group_ids = np.repeat(np.arange(len(groups)), n_cycles)
+        group_rows = [rows for _, _, rows in groups]
+        
+        table = pd.DataFrame({
+            self.subject_col: np.repeat([subject for subject, _, _ in groups], n_cycles).astype(object),
+            self.task_col: np.repeat([task for _, task, _ in groups], n_cycles).astype(object),
+            'cycle': np.concatenate([np.arange(count) for count in n_cycles]) if groups else np.empty(0, dtype=int),
+        })
+        
+        info_columns = [col for col in ('step', 'task_id', 'task_info') if col in self._available_columns()]
+        self.load_columns(info_columns)
+        frame = self._frame
+        first_rows = (np.concatenate([_expand_rows(rows)[::self.POINTS_PER_CYCLE] for rows in group_rows])
+                      if groups else np.empty(0, dtype=np.intp))
+        for col in info_columns:
+            if col != 'task_info':
+                table[col] = frame[col].to_numpy()[first_rows]
+        
+        if 'task_info' in info_columns:
+            # Parse the distinct strings only, then broadcast by code
+            codes, uniques = pd.factorize(frame['task_info'].iloc[first_rows])
+            parsed = pd.DataFrame([self._parse_task_info_cached(value) for value in uniques])
+            parsed = parsed.drop(columns=[col for col in parsed.columns if col in table.columns])
+            if len(parsed.columns):
+                parsed = parsed.reindex(codes).reset_index(drop=True).infer_objects()
+                table = pd.concat([table, parsed], axis=1)
+        
+        return table, group_ids, group_rows
+    
+    def select_cycles(self, task: Optional[str] = None, where: Optional[str] = None,
+                      subjects: Optional[List[str]] = None,
+                      features: Optional[List[str]] = None
+                      ) -> Tuple[Optional[np.ndarray], List[str], pd.DataFrame]:
+        """
+        Get cycles whose parsed task_info metadata matches a query.
+        
+        Parameters
+        ----------
+        task : str, optional
+            Task name. If None, all tasks are searched.
+        where : str, optional
+            ``DataFrame.query`` expression over the ``get_cycle_table()``
+            columns, e.g. ``'incline_deg >= 5 and speed_m_s < 1.3'``.
+        subjects : list of str, optional
+            Subjects to include. If None, uses all subjects.
+        features : list of str, optional
+            Features to extract. If None, uses all available features.
+        
+        Returns
+        -------
+        data_3d : ndarray or None
+            Array of shape (n_cycles, 150, n_features), ordered like the
+            matching rows of ``get_cycle_table()``
+        feature_names : list
+            Names of features in same order as last dimension
+        cycle_info : DataFrame
+            Matching rows of ``get_cycle_table()``, aligned with data_3d
+        
+        Raises
+        ------
+        ValueError
+            If ``where`` is not a valid expression over the table columns
+        
+        Examples
+        --------
+        >>> data_3d, features, info = loco.select_cycles(
+        ...     task='incline_walking', where='incline_deg >= 5 and speed_m_s < 1.3')
+        """
+        table = self.get_cycle_table()
+        _, group_ids, group_rows = self._cycle_table
+        
+        mask = np.ones(len(table), dtype=bool)
+        if task is not None:
+            mask &= (table[self.task_col] == task).to_numpy()
+        if subjects is not None:
+            if isinstance(subjects, str):
+                subjects = [subjects]
+            mask &= table[self.subject_col].isin(subjects).to_numpy()
+        selected = table[mask]
+        
+        if where:
+            try:
+                selected = selected.query(where)
+            except Exception as e:
+                raise ValueError(f"Invalid where expression '{where}': {str(e)}")
+        
+        if selected.empty:
+            warnings.warn(f"No cycles found for task {task}, subjects {subjects}, where {where!r}")
+            return None, [], pd.DataFrame()
+        
+        if features is None:
+            features = self.features
+        self.load_columns([self.feature_mappings[f] for f in features if f in self.feature_mappings])
+        frame = self._frame
+        valid_features = [f for f in features
+                          if f in self.feature_mappings and self.feature_mappings[f] in frame.columns]
+        if not valid_features:
+            warnings.warn(f"No valid features found among {features}")
+            return None, [], pd.DataFrame()
+        
+        # Table rows are grouped by group id, so per-group gathers keep its order
+        table_rows = selected.index.to_numpy()
+        selected_groups = group_ids[table_rows]
+        cycles = table['cycle'].to_numpy()[table_rows]
+        positions = np.concatenate([
+            _expand_rows(group_rows[group]).reshape(-1, self.POINTS_PER_CYCLE)[cycles[selected_groups == group]].ravel()
+            for group in np.unique(selected_groups)
+        ])
+        
+        feature_data = self._take_rows(positions, [self.feature_mappings[f] for f in valid_features])
+        data_3d = feature_data.reshape(len(table_rows), self.POINTS_PER_CYCLE, len(valid_features))
+        
+        return data_3d, valid_features, selected.reset_index(drop=True)
+    
     def filter_by_task_id(self, task_id: str) -> pd.DataFrame:
         """
         Filter dataset by task_id.
@@ -726,18 +1322,18 @@ class LocomotionData:
         >>> data.get_task_metadata("SUB01", "incline_walking", "incline_deg")
         10
         """
-        if 'task_info' not in self.df.columns:
+        if 'task_info' not in self._available_columns():
             return None
         
-        subset = self.df[(self.df[self.subject_col] == subject) & 
-                        (self.df[self.task_col] == task)]
-        
-        if subset.empty:
+        rows = self.get_row_selection(subject, task)
+        if rows is None:
             return None
         
         # Get first task_info value (should be consistent within subject-task)
-        task_info_str = subset['task_info'].iloc[0]
-        metadata = self.parse_task_info(task_info_str)
+        self.load_columns(['task_info'])
+        first_row = _expand_rows(rows)[0] if not isinstance(rows, slice) else rows.start
+        task_info_str = self._frame['task_info'].iloc[first_row]
+        metadata = self._parse_task_info_cached(task_info_str)
         
         return metadata.get(metadata_key)
     
@@ -762,21 +1358,22 @@ class LocomotionData:
         feature_names : list
             Names of features in same order as last dimension
         """
-        # Check cache
-        cache_key = (subject, task, tuple(features) if features else None)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        self._check_source()
+        if self.cycle_store:
+            return self._get_cycles_from_store(subject, task, features)
         
-        # Filter data
+        # Check cache (all-subject results depend on which subjects this instance holds)
+        cache_key = (self._cache_token, subject, task, tuple(features) if features else None)
         if subject is None:
-            # Get all subjects for this task
-            mask = self.df[self.task_col] == task
-        else:
-            # Get specific subject for this task
-            mask = (self.df[self.subject_col] == subject) & (self.df[self.task_col] == task)
-        subset = self.df[mask]
+            cache_key += (self._cache_scope,)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Look up rows in the (subject, task) index
+        rows = self.get_row_selection(subject, task)
         
-        if len(subset) == 0:
+        if rows is None:
             if subject is None:
                 warnings.warn(f"No data found for task '{task}'")
             else:
@@ -784,7 +1381,7 @@ class LocomotionData:
             return None, []
         
         # Check data length
-        n_points = len(subset)
+        n_points = _count_rows(rows)
         if n_points % self.POINTS_PER_CYCLE != 0:
             warnings.warn(f"Data length {n_points} not divisible by {self.POINTS_PER_CYCLE}")
             return None, []
@@ -795,6 +1392,9 @@ class LocomotionData:
         if features is None:
             features = self.features
         
+        # Read any requested feature columns that are not resident yet (lazy mode)
+        self.load_columns([self.feature_mappings[f] for f in features if f in self.feature_mappings])
+        
         # Map requested features to actual column names
         valid_features = []
         actual_columns = []
@@ -802,7 +1402,7 @@ class LocomotionData:
         for feature in features:
             if feature in self.feature_mappings:
                 actual_col = self.feature_mappings[feature]
-                if actual_col in subset.columns:
+                if actual_col in self._frame.columns:
                     valid_features.append(feature)
                     actual_columns.append(actual_col)
         
@@ -811,14 +1411,238 @@ class LocomotionData:
             return None, []
         
         # Extract and reshape to 3D using actual column names
-        feature_data = subset[actual_columns].values
+        feature_data = self._take_rows(rows, actual_columns)
         data_3d = feature_data.reshape(n_cycles, self.POINTS_PER_CYCLE, len(valid_features))
         
         # Cache result
-        self._cache[cache_key] = (data_3d, valid_features)
+        self._cache.put(cache_key, (data_3d, valid_features))
         
         return data_3d, valid_features
     
+    def get_cycles_batch(self, subjects: Optional[List[str]] = None,
+                         tasks: Optional[List[str]] = None,
+                         features: Optional[List[str]] = None
+                         ) -> Tuple[Optional[np.ndarray], List[str], pd.DataFrame]:
+        """
+        Get cycles of many subject-task combinations as one stacked 3D array.
+        
+        Rows of all selected (subject, task) groups are gathered from the
+        load-time row index in a single pass, instead of one get_cycles call
+        per subject followed by a vstack.
+        
+        Parameters
+        ----------
+        subjects : list of str, optional
+            Subjects to include. If None, uses all subjects.
+        tasks : list of str, optional
+            Tasks to include. If None, uses all tasks.
+        features : list of str, optional
+            Features to extract. If None, uses all available features.
+        
+        Returns
+        -------
+        data_3d : ndarray or None
+            Array of shape (n_cycles, 150, n_features), grouped by subject then
+            task (both sorted), cycles in file order within each group
+        feature_names : list
+            Names of features in same order as last dimension
+        cycle_info : DataFrame
+            One row per cycle aligned with data_3d: subject, task, cycle (index
+            within its subject-task group), plus step and task_id when present
+        
+        Examples
+        --------
+        >>> data_3d, features, info = loco.get_cycles_batch(tasks=['level_walking'])
+        >>> subject_means = {s: data_3d[info['subject'] == s].mean(axis=0)
+        ...                  for s in info['subject'].unique()}
+        """
+        if isinstance(subjects, str):
+            subjects = [subjects]
+        if isinstance(tasks, str):
+            tasks = [tasks]
+        subject_set = set(subjects) if subjects is not None else None
+        task_set = set(tasks) if tasks is not None else None
+        
+        groups = []
+        for (subject, task), rows in self.row_index.items():
+            if subject_set is not None and subject not in subject_set:
+                continue
+            if task_set is not None and task not in task_set:
+                continue
+            n_points = _count_rows(rows)
+            if n_points % self.POINTS_PER_CYCLE != 0:
+                warnings.warn(f"Skipping subject '{subject}', task '{task}': "
+                              f"data length {n_points} not divisible by {self.POINTS_PER_CYCLE}")
+                continue
+            groups.append((subject, task, rows, n_points // self.POINTS_PER_CYCLE))
+        
+        if not groups:
+            warnings.warn(f"No data found for subjects {subjects}, tasks {tasks}")
+            return None, [], pd.DataFrame()
+        
+        if features is None:
+            features = self.features
+        info_columns = [col for col in ('step', 'task_id') if col in self._available_columns()]
+        self.load_columns([self.feature_mappings[f] for f in features if f in self.feature_mappings]
+                          + info_columns)
+        
+        frame = self._frame
+        valid_features = [f for f in features
+                          if f in self.feature_mappings and self.feature_mappings[f] in frame.columns]
+        if not valid_features:
+            warnings.warn(f"No valid features found among {features}")
+            return None, [], pd.DataFrame()
+        
+        positions = np.concatenate([_expand_rows(rows) for _, _, rows, _ in groups])
+        n_cycles = [count for _, _, _, count in groups]
+        
+        feature_data = self._take_rows(positions, [self.feature_mappings[f] for f in valid_features])
+        data_3d = feature_data.reshape(sum(n_cycles), self.POINTS_PER_CYCLE, len(valid_features))
+        
+        cycle_info = pd.DataFrame({
+            self.subject_col: np.repeat([subject for subject, _, _, _ in groups], n_cycles),
+            self.task_col: np.repeat([task for _, task, _, _ in groups], n_cycles),
+            'cycle': np.concatenate([np.arange(count) for count in n_cycles]),
+        })
+        first_rows = positions[::self.POINTS_PER_CYCLE]
+        for col in info_columns:
+            cycle_info[col] = frame[col].to_numpy()[first_rows]
+        
+        return data_3d, valid_features, cycle_info
+    
+    def _get_task_store(self, task: str) -> Optional[Tuple[np.ndarray, Dict]]:
+        """
+        Build (once) the contiguous cycle array for a task.
+        
+        Returns
+        -------
+        tuple or None
+            (cycles, subject_cycles) where cycles has shape
+            (n_cycles, 150, n_features) in ``self.features`` order and
+            subject_cycles maps each subject to its cycle selection (slice when
+            contiguous). None if the task is absent or malformed.
+        """
+        if task in self._task_stores:
+            return self._task_stores[task]
+        
+        task_rows = self._task_rows.get(task)
+        if task_rows is None:
+            return None
+        
+        n_points = _count_rows(task_rows)
+        if n_points % self.POINTS_PER_CYCLE != 0:
+            warnings.warn(f"Data length {n_points} not divisible by {self.POINTS_PER_CYCLE}")
+            return None
+        n_cycles = n_points // self.POINTS_PER_CYCLE
+        
+        columns = [self.feature_mappings[feature] for feature in self.features]
+        self.load_columns(columns)
+        
+        # Fill one feature at a time so peak memory stays at one column copy
+        cycles = np.empty((n_cycles, self.POINTS_PER_CYCLE, len(columns)), dtype=self.cycle_dtype)
+        for idx, column in enumerate(columns):
+            values = self._frame[column].to_numpy()[task_rows]
+            cycles[:, :, idx] = values.reshape(n_cycles, self.POINTS_PER_CYCLE)
+        cycles.flags.writeable = False
+        
+        # Cycle offsets of each subject within the task array
+        task_positions = _expand_rows(task_rows)
+        subject_cycles = {}
+        for (subject, subject_task), rows in self.row_index.items():
+            if subject_task != task:
+                continue
+            if _count_rows(rows) % self.POINTS_PER_CYCLE != 0:
+                continue
+            cycle_starts = _expand_rows(rows)[::self.POINTS_PER_CYCLE]
+            cycle_ids = np.searchsorted(task_positions, cycle_starts) // self.POINTS_PER_CYCLE
+            subject_cycles[subject] = _compact_rows(cycle_ids)
+        
+        self._task_stores[task] = (cycles, subject_cycles)
+        return self._task_stores[task]
+    
+    def _get_cycles_from_store(self, subject: Optional[str], task: str,
+                               features: Optional[List[str]] = None) -> Tuple[np.ndarray, List[str]]:
+        """get_cycles backed by the per-task cycle store (views where possible)."""
+        store = self._get_task_store(task)
+        if store is None:
+            if task not in self._task_rows:
+                warnings.warn(f"No data found for task '{task}'")
+            return None, []
+        cycles, subject_cycles = store
+        
+        if subject is not None:
+            if subject not in subject_cycles:
+                if (subject, task) in self.row_index:
+                    n_points = _count_rows(self.row_index[(subject, task)])
+                    warnings.warn(f"Data length {n_points} not divisible by {self.POINTS_PER_CYCLE}")
+                else:
+                    warnings.warn(f"No data found for subject '{subject}', task '{task}'")
+                return None, []
+            cycles = cycles[subject_cycles[subject]]
+        
+        if features is None:
+            return cycles, list(self.features)
+        
+        feature_positions = {feature: idx for idx, feature in enumerate(self.features)}
+        valid_features = [feature for feature in features if feature in feature_positions]
+        if not valid_features:
+            warnings.warn(f"No valid features found among {features}")
+            return None, []
+        
+        # Contiguous or evenly spaced feature picks stay views; others are gathered
+        indices = np.array([feature_positions[feature] for feature in valid_features])
+        steps = np.diff(indices)
+        if len(indices) == 1 or (steps[0] > 0 and np.all(steps == steps[0])):
+            step = int(steps[0]) if len(indices) > 1 else 1
+            return cycles[:, :, indices[0]:indices[-1] + 1:step], valid_features
+        return np.take(cycles, indices, axis=2), valid_features
+    
+    def get_cycle_stats(self, subject: Optional[str], task: str,
+                        features: Optional[List[str]] = None,
+                        quantiles: Tuple[float, ...] = DEFAULT_QUANTILES) -> Optional[CycleStats]:
+        """
+        Get cached statistics of a subject-task cycle array.
+        
+        The statistics behind ``get_mean_patterns``, ``get_std_patterns``,
+        ``calculate_rom``, ``find_outlier_cycles`` and
+        ``get_summary_statistics`` share one cached object.  Mean/std patterns
+        are computed on first use; per-cycle extremes, outlier RMSE and
+        quantiles only when a method reads them.
+        
+        Parameters
+        ----------
+        subject : str or None
+            Subject ID. If None, uses all subjects.
+        task : str
+            Task name
+        features : list of str, optional
+            Features to include. If None, uses all available features.
+        quantiles : tuple of float
+            Quantile levels in [0, 1]; the quartiles and median are always
+            computed
+        
+        Returns
+        -------
+        CycleStats or None
+            None if no cycles are available
+        """
+        levels = tuple(sorted({float(q) for q in quantiles} | set(DEFAULT_QUANTILES)))
+        cache_key = ('cycle_stats', self._cache_token, subject, task,
+                     tuple(features) if features else None, levels)
+        if subject is None:
+            cache_key += (self._cache_scope,)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        data_3d, feature_names = self.get_cycles(subject, task, features)
+        if data_3d is None:
+            return None
+        
+        stats = CycleStats.from_cycles(data_3d, feature_names, levels)
+        self._cache.put(cache_key, stats)
+        return stats
+    
     def get_mean_patterns(self, subject: str, task: str,
                          features: Optional[List[str]] = None) -> Dict[str, Dict[str, pd.Series]]:
         """
@@ -829,14 +1653,14 @@ class LocomotionData:
         dict
             Dictionary mapping feature names to dict with 'mean' and 'std' Series (150 points)
         """
-        data_3d, feature_names = self.get_cycles(subject, task, features)
+        stats = self.get_cycle_stats(subject, task, features)
         
-        if data_3d is None:
+        if stats is None:
             return {}
         
-        # Calculate means and stds
-        mean_patterns = np.mean(data_3d, axis=0)  # (150, n_features)
-        std_patterns = np.std(data_3d, axis=0)    # (150, n_features)
+        feature_names = stats.feature_names
+        mean_patterns = stats.mean  # (150, n_features)
+        std_patterns = stats.std    # (150, n_features)
         
         # Create phase index
         phase_index = np.linspace(0, 100, 150, endpoint=False)
@@ -861,88 +1685,168 @@ class LocomotionData:
         dict
             Dictionary mapping feature names to std patterns (150 points)
         """
-        data_3d, feature_names = self.get_cycles(subject, task, features)
+        stats = self.get_cycle_stats(subject, task, features)
         
-        if data_3d is None:
+        if stats is None:
             return {}
         
-        # Calculate stds
-        std_patterns = np.std(data_3d, axis=0)  # (150, n_features)
-        
-        # Return as dictionary
-        return {feat: std_patterns[:, i] for i, feat in enumerate(feature_names)}
+        return {feat: stats.std[:, i] for i, feat in enumerate(stats.feature_names)}
     
     def validate_cycles(self, subject: str, task: str,
-                       features: Optional[List[str]] = None) -> np.ndarray:
+                       features: Optional[List[str]] = None,
+                       limits: Optional[Dict[str, Tuple[Optional[float], Optional[float], Optional[float]]]] = None,
+                       return_reasons: bool = False) -> Union[np.ndarray, CycleValidation]:
         """
         Validate cycles based on biomechanical constraints.
         
+        Each feature is checked against the physiological limits of its
+        column group in ``feature_constants.PHYSIOLOGICAL_LIMITS`` (value
+        range and, for angles, the largest change between consecutive phase
+        points), plus a finite-value check.  The limits are compiled once per
+        feature list and all features are checked in one broadcast.
+        
+        Parameters
+        ----------
+        subject : str
+            Subject ID
+        task : str
+            Task name
+        features : list of str, optional
+            Features to check. If None, uses all available features.
+        limits : dict, optional
+            Feature -> (min, max, max jump) overriding the default limits;
+            None entries disable a check
+        return_reasons : bool
+            If True, return a ``CycleValidation`` with the per-cycle x
+            per-feature failure reasons
+        
         Returns
         -------
-        valid_mask : ndarray
+        valid_mask : ndarray or CycleValidation
             Boolean array of shape (n_cycles,) indicating valid cycles
         """
         data_3d, feature_names = self.get_cycles(subject, task, features)
         
         if data_3d is None:
+            if return_reasons:
+                return CycleValidation(np.array([], dtype=bool), np.empty((0, 0), dtype=np.uint8), [])
             return np.array([])
         
-        n_cycles = data_3d.shape[0]
-        valid_mask = np.ones(n_cycles, dtype=bool)
-        
-        # Check each feature
-        for i, feature in enumerate(feature_names):
-            feat_data = data_3d[:, :, i]
-            
-            # Range checks
-            if 'angle' in feature:
-                # Angles are now in radians
-                out_of_range = np.any((feat_data < -np.pi) | (feat_data > np.pi), axis=1)
-                valid_mask &= ~out_of_range
-                
-                # Check for large discontinuities
-                diffs = np.abs(np.diff(feat_data, axis=1))
-                large_jumps = np.any(diffs > 0.5236, axis=1)  # 30 degrees = 0.5236 radians
-                valid_mask &= ~large_jumps
-                
-            elif 'velocity' in feature:
-                # Velocities in rad/s
-                out_of_range = np.any(np.abs(feat_data) > 17.45, axis=1)  # 1000 deg/s = 17.45 rad/s
-                valid_mask &= ~out_of_range
-                
-            elif 'moment' in feature:
-                out_of_range = np.any(np.abs(feat_data) > 300, axis=1)
-                valid_mask &= ~out_of_range
-            
-            # Check for NaN or inf
-            has_invalid = np.any(~np.isfinite(feat_data), axis=1)
-            valid_mask &= ~has_invalid
+        table = LimitsTable.from_features(feature_names, limits)
+        reasons = table.check(data_3d)
+        valid_mask = ~reasons.any(axis=1)
         
+        if return_reasons:
+            return CycleValidation(valid_mask, reasons, list(feature_names))
         return valid_mask
     
     def get_phase_correlations(self, subject: str, task: str,
-                              features: Optional[List[str]] = None) -> np.ndarray:
+                              features: Optional[List[str]] = None,
+                              ignore_nan: bool = False,
+                              dtype: Union[str, np.dtype] = np.float64,
+                              pairs: Optional[List[Tuple[str, str]]] = None) -> Optional[np.ndarray]:
         """
         Calculate correlation between features at each phase point.
         
+        All phases are computed at once: the cycles are centered and scaled
+        once, and the 150 correlation matrices come out of one batched matrix
+        product.  Results match ``np.corrcoef`` applied to each
+        ``(n_cycles, n_features)`` phase slice.
+        
+        Parameters
+        ----------
+        subject : str
+            Subject ID
+        task : str
+            Task name
+        features : list of str, optional
+            Features to correlate (default: all features)
+        ignore_nan : bool
+            If True, each pair uses the cycles where both features are finite
+            (pairwise-complete); otherwise any NaN makes the entry NaN
+        dtype : dtype
+            Computation and output dtype, e.g. ``np.float32`` to halve memory
+        pairs : list of (str, str), optional
+            Only compute these feature pairs instead of the full matrix
+        
         Returns
         -------
-        correlations : ndarray
-            Array of shape (150, n_features, n_features) with correlation matrices
+        correlations : ndarray or None
+            Array of shape (150, n_features, n_features) with correlation
+            matrices, or (150, n_pairs) if ``pairs`` is given.  None if the
+            task has fewer than two cycles.
         """
+        if pairs is not None and features is None:
+            features = list(dict.fromkeys(name for pair in pairs for name in pair))
         data_3d, feature_names = self.get_cycles(subject, task, features)
         
         if data_3d is None or data_3d.shape[0] < 2:
             return None
         
-        n_phases = self.POINTS_PER_CYCLE
-        n_features = len(feature_names)
-        correlations = np.zeros((n_phases, n_features, n_features))
-        
-        for phase in range(n_phases):
-            phase_data = data_3d[:, phase, :]  # (n_cycles, n_features)
-            correlations[phase] = np.corrcoef(phase_data.T)
+        # (n_phases, n_cycles, n_features) so phases are the batch axis
+        values = np.ascontiguousarray(np.swapaxes(data_3d, 0, 1), dtype=dtype)
+        
+        if pairs is not None:
+            feature_index = {name: idx for idx, name in enumerate(feature_names)}
+            missing = sorted({name for pair in pairs for name in pair} - set(feature_index))
+            if missing:
+                raise ValueError(f"Features not available for correlation: {missing}")
+            left = np.array([feature_index[a] for a, _ in pairs], dtype=np.intp)
+            right = np.array([feature_index[b] for _, b in pairs], dtype=np.intp)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if ignore_nan:
+                correlations = self._pairwise_complete_correlations(
+                    values, (left, right) if pairs is not None else None)
+            else:
+                centered = values - values.mean(axis=1, keepdims=True)
+                scaled = centered / np.sqrt(np.einsum('pcf,pcf->pf', centered, centered))[:, np.newaxis, :]
+                if pairs is None:
+                    correlations = np.matmul(np.swapaxes(scaled, 1, 2), scaled)
+                else:
+                    correlations = np.einsum('pck,pck->pk', scaled[:, :, left], scaled[:, :, right])
+        
+        # Same clipping of rounding error as np.corrcoef
+        return np.clip(correlations, -1, 1, out=correlations)
+    
+    @staticmethod
+    def _pairwise_complete_correlations(values: np.ndarray,
+                                        pair_index: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> np.ndarray:
+        """
+        NaN-aware Pearson correlations of (n_phases, n_cycles, n_features) data.
         
+        Each pair uses the cycles where both features are finite; pairs with
+        fewer than two such cycles are NaN.
+        """
+        finite = np.isfinite(values)
+        mask = finite.astype(values.dtype)
+        # Centering by the per-feature mean keeps the sums well conditioned
+        counts = mask.sum(axis=1, keepdims=True)
+        means = np.where(finite, values, 0).sum(axis=1, keepdims=True) / counts
+        x = np.where(finite, values - means, 0)
+        
+        if pair_index is not None:
+            left, right = pair_index
+            xa, xb = x[:, :, left], x[:, :, right]
+            ma, mb = mask[:, :, left], mask[:, :, right]
+            n = np.einsum('pck,pck->pk', ma, mb)
+            sum_ab = np.einsum('pck,pck->pk', xa, xb)
+            sum_a, sum_b = np.einsum('pck,pck->pk', xa, mb), np.einsum('pck,pck->pk', ma, xb)
+            sq_a, sq_b = np.einsum('pck,pck->pk', xa * xa, mb), np.einsum('pck,pck->pk', ma, xb * xb)
+        else:
+            xt, mt = np.swapaxes(x, 1, 2), np.swapaxes(mask, 1, 2)
+            n = np.matmul(mt, mask)
+            sum_ab = np.matmul(xt, x)
+            sum_a = np.matmul(xt, mask)
+            sum_b = np.swapaxes(sum_a, 1, 2)
+            sq_a = np.matmul(np.swapaxes(x * x, 1, 2), mask)
+            sq_b = np.swapaxes(sq_a, 1, 2)
+        
+        cov = n * sum_ab - sum_a * sum_b
+        var_a = n * sq_a - sum_a * sum_a
+        var_b = n * sq_b - sum_b * sum_b
+        correlations = cov / np.sqrt(var_a * var_b)
+        correlations[n < 2] = np.nan
         return correlations
     
     def find_outlier_cycles(self, subject: str, task: str,
@@ -961,17 +1865,13 @@ class LocomotionData:
         outlier_indices : ndarray
             Indices of outlier cycles
         """
-        data_3d, feature_names = self.get_cycles(subject, task, features)
+        stats = self.get_cycle_stats(subject, task, features)
         
-        if data_3d is None:
+        if stats is None:
             return np.array([])
         
-        # Calculate mean pattern
-        mean_patterns = np.mean(data_3d, axis=0)  # (150, n_features)
-        
-        # Calculate deviation for each cycle
-        deviations = data_3d - mean_patterns[np.newaxis, :, :]
-        rmse_per_cycle = np.sqrt(np.mean(deviations**2, axis=(1, 2)))
+        # RMS deviation of each cycle from the mean pattern
+        rmse_per_cycle = stats.rmse_per_cycle
         
         # Find outliers
         outlier_threshold = np.mean(rmse_per_cycle) + threshold * np.std(rmse_per_cycle)
@@ -979,6 +1879,90 @@ class LocomotionData:
         
         return outlier_indices
     
+    def find_outliers_all(self, method: str = 'rmse',
+                          group_by: Optional[List[str]] = None,
+                          features: Optional[List[str]] = None,
+                          threshold: float = 2.0,
+                          subjects: Optional[List[str]] = None,
+                          tasks: Optional[List[str]] = None,
+                          workers: int = 1,
+                          return_all: bool = False) -> pd.DataFrame:
+        """
+        Find outlier cycles of every group in one pass.
+        
+        All selected cycles are stacked once (``get_cycles_batch``), sorted by
+        group, and each group's mean pattern comes from a segmented reduction
+        over the stack, so there is no per-(subject, task) loop.  With
+        ``method='rmse'`` and the default grouping, the flagged cycles of each
+        group are the ones ``find_outlier_cycles`` returns for it.
+        
+        Parameters
+        ----------
+        method : str
+            ``'rmse'`` (RMS deviation from the group mean pattern),
+            ``'mahalanobis'`` (deviation standardized per phase and feature,
+            so features in different units weigh equally) or
+            ``'functional_depth'`` (modified band depth; low depth is
+            outlying)
+        group_by : list of str, optional
+            ``get_cycles_batch`` cycle_info columns defining the groups.
+            Default: subject and task columns; ``['task']`` pools subjects.
+        features : list of str, optional
+            Features to score on. If None, uses all available features.
+        threshold : float
+            Number of standard deviations of the group's scores at which a
+            cycle is flagged
+        subjects, tasks : list of str, optional
+            Restrict the cycles scored. If None, uses all.
+        workers : int
+            Number of worker processes the groups are split between
+        return_all : bool
+            If True, return every cycle with its score and an ``outlier``
+            column instead of the flagged cycles only
+        
+        Returns
+        -------
+        outliers : DataFrame
+            cycle_info columns (subject, task, cycle, ...) of the flagged
+            cycles plus ``score`` and the group's ``cutoff``, in
+            ``get_cycles_batch`` order
+        
+        Examples
+        --------
+        >>> flagged = loco.find_outliers_all(method='mahalanobis', group_by=['task'])
+        >>> flagged.groupby('task').size()
+        """
+        if group_by is None:
+            group_by = [self.subject_col, self.task_col]
+        elif isinstance(group_by, str):
+            group_by = [group_by]
+        
+        data_3d, _, cycle_info = self.get_cycles_batch(subjects, tasks, features)
+        if data_3d is None:
+            return pd.DataFrame()
+        
+        missing = [col for col in group_by if col not in cycle_info.columns]
+        if missing:
+            raise ValueError(f"Cannot group by {missing}; available columns: {list(cycle_info.columns)}")
+        
+        codes = cycle_info.groupby(list(group_by), sort=True, dropna=False).ngroup().to_numpy()
+        order = np.argsort(codes, kind='stable')
+        if np.all(order[1:] > order[:-1]):
+            order = None  # already grouped, e.g. the default subject-task grouping
+        sorted_data = data_3d if order is None else data_3d[order]
+        sorted_codes = codes if order is None else codes[order]
+        
+        scores, cutoffs, flagged = score_groups_parallel(sorted_data, sorted_codes, method, threshold, workers)
+        if order is not None:
+            inverse = np.empty_like(order)
+            inverse[order] = np.arange(len(order))
+            scores, cutoffs, flagged = scores[inverse], cutoffs[inverse], flagged[inverse]
+        
+        result = cycle_info.assign(score=scores, cutoff=cutoffs)
+        if return_all:
+            return result.assign(outlier=flagged)
+        return result[flagged].reset_index(drop=True)
+    
     def get_summary_statistics(self, subject: str, task: str,
                               features: Optional[List[str]] = None) -> pd.DataFrame:
         """
@@ -989,27 +1973,24 @@ class LocomotionData:
         summary : DataFrame
             Summary statistics including mean, std, min, max, etc.
         """
-        data_3d, feature_names = self.get_cycles(subject, task, features)
+        cycle_stats = self.get_cycle_stats(subject, task, features)
         
-        if data_3d is None:
+        if cycle_stats is None:
             return pd.DataFrame()
         
-        # Reshape to (n_cycles * 150, n_features) for easier statistics
-        data_2d = data_3d.reshape(-1, len(feature_names))
-        
-        # Calculate statistics
+        # Statistics over all points of all cycles
         stats = {
-            'mean': np.mean(data_2d, axis=0),
-            'std': np.std(data_2d, axis=0),
-            'min': np.min(data_2d, axis=0),
-            'max': np.max(data_2d, axis=0),
-            'median': np.median(data_2d, axis=0),
-            'q25': np.percentile(data_2d, 25, axis=0),
-            'q75': np.percentile(data_2d, 75, axis=0),
+            'mean': cycle_stats.overall_mean,
+            'std': cycle_stats.overall_std,
+            'min': cycle_stats.overall_min,
+            'max': cycle_stats.overall_max,
+            'median': cycle_stats.quantile(0.5),
+            'q25': cycle_stats.quantile(0.25),
+            'q75': cycle_stats.quantile(0.75),
         }
         
         # Create DataFrame
-        summary = pd.DataFrame(stats, index=feature_names)
+        summary = pd.DataFrame(stats, index=cycle_stats.feature_names)
         summary.index.name = 'feature'
         
         return summary
@@ -1071,24 +2052,19 @@ class LocomotionData:
         rom_data : dict
             ROM values for each feature
         """
-        data_3d, feature_names = self.get_cycles(subject, task, features)
+        stats = self.get_cycle_stats(subject, task, features)
         
-        if data_3d is None:
+        if stats is None:
             return {}
         
-        rom_data = {}
-        
-        for i, feature in enumerate(feature_names):
-            feat_data = data_3d[:, :, i]  # (n_cycles, 150)
-            
-            if by_cycle:
-                # ROM per cycle
-                rom_data[feature] = np.max(feat_data, axis=1) - np.min(feat_data, axis=1)
-            else:
-                # Overall ROM
-                rom_data[feature] = np.max(feat_data) - np.min(feat_data)
+        if by_cycle:
+            # ROM per cycle
+            rom = stats.rom
+            return {feature: rom[:, i] for i, feature in enumerate(stats.feature_names)}
         
-        return rom_data
+        # Overall ROM
+        overall_rom = stats.overall_max - stats.overall_min
+        return {feature: overall_rom[i] for i, feature in enumerate(stats.feature_names)}
     
     def plot_time_series(self, subject: str, task: str, features: List[str],
                         time_col: str = 'time_s', save_path: Optional[str] = None):
@@ -1111,12 +2087,13 @@ class LocomotionData:
         if not MATPLOTLIB_AVAILABLE:
             raise ImportError("matplotlib is required for plotting. Install with: pip install matplotlib")
         # Filter data
-        mask = (self.df[self.subject_col] == subject) & (self.df[self.task_col] == task)
-        subset = self.df[mask]
+        rows = self.get_row_selection(subject, task)
         
-        if len(subset) == 0:
+        if rows is None:
             print(f"No data found for {subject} - {task}")
             return
+        self.load_columns(list(features) + [time_col])
+        subset = self._frame.iloc[rows]
         
         # Create subplots
         n_features = len(features)
@@ -1306,9 +2283,41 @@ class LocomotionData:
             plt.show()
 
 
+def _compact_rows(positions: np.ndarray) -> Union[slice, np.ndarray]:
+    """Represent sorted row positions as a slice when they are contiguous."""
+    if len(positions) > 0 and positions[-1] - positions[0] + 1 == len(positions):
+        return slice(int(positions[0]), int(positions[-1]) + 1)
+    return positions
+
+
+def _expand_rows(rows: Union[slice, np.ndarray]) -> np.ndarray:
+    """Return a row selection as an array of positions."""
+    if isinstance(rows, slice):
+        return np.arange(rows.start, rows.stop)
+    return rows
+
+
+def _merge_rows(selections: List[Union[slice, np.ndarray]]) -> Union[slice, np.ndarray]:
+    """Combine row selections into one sorted selection."""
+    if not selections:
+        return np.array([], dtype=np.int64)
+    if len(selections) == 1:
+        return selections[0]
+    return _compact_rows(np.sort(np.concatenate([_expand_rows(rows) for rows in selections])))
+
+
+def _count_rows(rows: Union[slice, np.ndarray]) -> int:
+    """Number of rows in a row selection."""
+    if isinstance(rows, slice):
+        return rows.stop - rows.start
+    return len(rows)
+
+
 def efficient_reshape_3d(df: pd.DataFrame, subject: str, task: str, features: List[str],
                         subject_col: str = 'subject', task_col: str = 'task',
-                        points_per_cycle: int = 150) -> Tuple[np.ndarray, List[str]]:
+                        points_per_cycle: int = 150,
+                        row_index: Optional[Dict[Tuple[str, str], Union[slice, np.ndarray]]] = None
+                        ) -> Tuple[np.ndarray, List[str]]:
     """
     Standalone function for efficient 3D reshaping.
     
@@ -1330,6 +2339,10 @@ def efficient_reshape_3d(df: pd.DataFrame, subject: str, task: str, features: Li
         Column name for tasks
     points_per_cycle : int
         Number of points per gait cycle (default: 150)
+    row_index : dict, optional
+        Precomputed (subject, task) -> row selection index for ``df``, such as
+        ``LocomotionData.row_index`` of the instance that loaded ``df``. When
+        given, rows are sliced directly instead of masking the whole DataFrame.
         
     Returns
     -------
@@ -1339,8 +2352,14 @@ def efficient_reshape_3d(df: pd.DataFrame, subject: str, task: str, features: Li
         List of successfully extracted features
     """
     # Filter data
-    mask = (df[subject_col] == subject) & (df[task_col] == task)
-    subset = df[mask]
+    if row_index is not None:
+        rows = row_index.get((subject, task))
+        if rows is None:
+            return None, []
+        subset = df.iloc[rows]
+    else:
+        mask = (df[subject_col] == subject) & (df[task_col] == task)
+        subset = df[mask]
     
     if len(subset) == 0:
         return None, []
@@ -0,0 +1,169 @@
+"""Segmented outlier scores of many cycle groups at once.
+
+``LocomotionData.find_outlier_cycles`` scores the cycles of one
+(subject, task).  The kernels here take a stacked (n_cycles, 150, n_features)
+array whose cycles are sorted by an integer group code and score every group
+together: group mean patterns come from one ``np.add.reduceat`` over the group
+segments and are broadcast back to the cycles, so no Python loop runs over
+groups.  Groups are independent, so a worker pool can split them between
+processes; scores agree with a single-process run up to rounding.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
+
+import numpy as np
+
+
+OUTLIER_METHODS = ('rmse', 'mahalanobis', 'functional_depth')
+
+
+def _segment_sums(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Sums over axis 0 of each contiguous segment beginning at ``starts``."""
+    return np.add.reduceat(values, starts, axis=0)
+
+
+def _group_moments(scores: np.ndarray, codes: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-group mean and population std of per-cycle scores."""
+    means = np.bincount(codes, weights=scores, minlength=len(counts)) / counts
+    deviations = scores - means[codes]
+    stds = np.sqrt(np.bincount(codes, weights=deviations * deviations, minlength=len(counts)) / counts)
+    return means, stds
+
+
+def _modified_band_depth(data_3d: np.ndarray, codes: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Modified band depth (bands of two curves) of each cycle within its group.
+
+    At each phase, a value with ``b`` values of its group strictly below and
+    ``a`` strictly above lies in the band of all pairs except those entirely
+    below or entirely above it: ``C(n, 2) - C(b, 2) - C(a, 2)``.  ``b`` and
+    ``a`` come from one column-wise sort of all groups at once (group code,
+    then value), with runs of equal values sharing their counts.  Features are
+    averaged.
+    """
+    n_total, n_points, n_features = data_3d.shape
+    n = counts[codes].astype(float)[:, np.newaxis]
+    pairs = n * (n - 1) / 2
+    positions = np.broadcast_to(np.arange(n_total)[:, np.newaxis], (n_total, n_points))
+    group_start = np.concatenate([[0], np.cumsum(counts)])
+    sorted_codes = codes[:, np.newaxis]  # codes are non-decreasing, so already sorted
+
+    depth = np.zeros(n_total)
+    for feature in range(n_features):
+        values = data_3d[:, :, feature]
+        order = np.lexsort((values, np.broadcast_to(sorted_codes, values.shape)), axis=0)
+        sorted_values = np.take_along_axis(values, order, axis=0)
+        # Positions where a new run of equal values (within a group) begins / ends
+        new_run = np.ones((n_total, n_points), dtype=bool)
+        new_run[1:] = (sorted_values[1:] != sorted_values[:-1]) | (sorted_codes[1:] != sorted_codes[:-1])
+        run_first = np.maximum.accumulate(np.where(new_run, positions, 0), axis=0)
+        run_end = np.empty_like(new_run)
+        run_end[:-1], run_end[-1] = new_run[1:], True
+        run_last = np.minimum.accumulate(np.where(run_end, positions, n_total)[::-1], axis=0)[::-1]
+
+        below = np.empty((n_total, n_points))
+        above = np.empty((n_total, n_points))
+        np.put_along_axis(below, order, run_first - group_start[codes][:, np.newaxis], axis=0)
+        np.put_along_axis(above, order, group_start[codes + 1][:, np.newaxis] - 1 - run_last, axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            inside = 1 - (below * (below - 1) + above * (above - 1)) / 2 / pairs
+        depth += inside.mean(axis=1)
+    return depth / n_features
+
+
+def score_sorted_groups(data_3d: np.ndarray, codes: np.ndarray, method: str = 'rmse',
+                        threshold: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Score the cycles of every group and flag outliers.
+
+    Parameters
+    ----------
+    data_3d : ndarray
+        Cycles of shape (n_cycles, 150, n_features), sorted by ``codes``
+    codes : ndarray
+        Group code of each cycle, non-decreasing and covering
+        ``0 .. n_groups - 1``
+    method : str
+        ``'rmse'``: RMS deviation from the group mean pattern (the score of
+        ``find_outlier_cycles``).
+        ``'mahalanobis'``: RMS of the deviation standardized by the group's
+        per-phase, per-feature std, i.e. a Mahalanobis distance with diagonal
+        covariance; the full (150 * n_features)-dimensional covariance is
+        singular for realistic cycle counts.  Unlike ``'rmse'`` it does not
+        depend on feature units.
+        ``'functional_depth'``: modified band depth; low depth is outlying.
+    threshold : float
+        Number of standard deviations of the group's scores beyond their mean
+        (above for distances, below for depth) at which a cycle is flagged.
+        As in ``find_outlier_cycles``, groups containing non-finite values get
+        NaN moments and flag nothing.
+
+    Returns
+    -------
+    scores : ndarray
+        Score of each cycle
+    cutoffs : ndarray
+        Flagging cutoff of each cycle's group
+    flagged : ndarray
+        Boolean outlier flag of each cycle
+    """
+    if method not in OUTLIER_METHODS:
+        raise ValueError(f"Unknown outlier method '{method}'; expected one of {OUTLIER_METHODS}")
+    codes = np.asarray(codes, dtype=np.intp)
+    counts = np.bincount(codes)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    if method == 'functional_depth':
+        scores = _modified_band_depth(data_3d, codes, counts)
+        # Ranks place non-finite values arbitrarily; such cycles get no depth
+        scores[~np.isfinite(data_3d).all(axis=(1, 2))] = np.nan
+    else:
+        means = _segment_sums(data_3d, starts) / counts[:, np.newaxis, np.newaxis]
+        deviations = data_3d - means[codes]
+        squared = np.multiply(deviations, deviations, out=deviations)
+        if method == 'mahalanobis':
+            variance = _segment_sums(squared, starts) / counts[:, np.newaxis, np.newaxis]
+            # Phases where every cycle of a group agrees carry no information
+            with np.errstate(invalid='ignore', divide='ignore'):
+                inverse = np.where(variance > 0, 1.0 / variance, 0.0)
+            squared *= inverse[codes]
+        scores = np.sqrt(np.mean(squared, axis=(1, 2)))
+
+    score_mean, score_std = _group_moments(scores, codes, counts)
+    if method == 'functional_depth':
+        cutoffs = (score_mean - threshold * score_std)[codes]
+        flagged = scores < cutoffs
+    else:
+        cutoffs = (score_mean + threshold * score_std)[codes]
+        flagged = scores > cutoffs
+    return scores, cutoffs, flagged
+
+
+def score_groups_parallel(data_3d: np.ndarray, codes: np.ndarray, method: str = 'rmse',
+                          threshold: float = 2.0, workers: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    ``score_sorted_groups`` with the groups split between worker processes.
+
+    Each worker receives a contiguous run of whole groups of roughly equal
+    cycle count; results are concatenated in group order.
+    """
+    codes = np.asarray(codes, dtype=np.intp)
+    n_groups = int(codes[-1]) + 1 if len(codes) else 0
+    if workers <= 1 or n_groups <= 1:
+        return score_sorted_groups(data_3d, codes, method, threshold)
+
+    # Cut at group boundaries closest to equal shares of cycles
+    boundaries = np.flatnonzero(np.diff(codes)) + 1
+    targets = np.linspace(0, len(codes), min(workers, n_groups) + 1)[1:-1]
+    cuts = np.unique(boundaries[np.abs(boundaries[:, np.newaxis] - targets).argmin(axis=0)])
+    edges = np.concatenate([[0], cuts, [len(codes)]])
+    chunks = [(data_3d[lo:hi], codes[lo:hi] - codes[lo]) for lo, hi in zip(edges[:-1], edges[1:])]
+
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        results = list(executor.map(score_sorted_groups, [chunk for chunk, _ in chunks],
+                                    [chunk_codes for _, chunk_codes in chunks],
+                                    [method] * len(chunks), [threshold] * len(chunks)))
+    return tuple(np.concatenate(parts) for parts in zip(*results))
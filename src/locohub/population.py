@@ -0,0 +1,518 @@
+"""Streaming population mean/std patterns over many strides and datasets.
+
+Population reference curves pool millions of strides from several converted
+parquet files, more than ``get_cycles(subject=None, ...)`` can hold at once.
+``PopulationAggregator`` consumes strides in batches and keeps, for every
+(task, feature) pair and phase point, the count, mean and sum of squared
+deviations (Welford's update, merged across batches with Chan's formula).
+Memory is independent of the number of strides.
+
+Aggregates are plain arrays: they merge across processes (``merge``), pickle,
+and save to / load from ``.npz`` files.  The moments equal the in-memory
+``np.nanmean``/``np.nanstd`` over the same strides up to rounding, whatever
+the batch sizes or merge order.  Optional per-phase t-digests give approximate
+quantiles (e.g. percentile bands) with the same merge and save support.
+"""
+
+from __future__ import annotations
+
+import json
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .locomotion_data import LocomotionData
+
+
+POINTS_PER_CYCLE = 150
+
+# Rows per parquet record batch (500 strides)
+DEFAULT_BATCH_ROWS = POINTS_PER_CYCLE * 500
+
+_FORMAT_VERSION = 1
+
+
+class TDigest:
+    """
+    Merging t-digest for approximate quantiles of a value stream.
+
+    Parameters
+    ----------
+    compression : float
+        Size parameter; about ``compression`` centroids are kept and the
+        quantile error is smallest near the tails
+
+    Notes
+    -----
+    Incoming values are buffered and compressed together once about
+    ``5 * compression`` have arrived; every recompression loses some
+    resolution, so small batches are not compressed one by one.
+    """
+
+    def __init__(self, compression: float = 100.0):
+        self.compression = float(compression)
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+        self._buffer: List[np.ndarray] = []
+        self._buffered = 0
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum()) + self._buffered
+
+    def flush(self) -> None:
+        """Compress buffered values into the centroids."""
+        if self._buffer:
+            values = np.concatenate(self._buffer)
+            self._buffer, self._buffered = [], 0
+            self._absorb(values, np.ones(values.size))
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a batch of values (non-finite values are ignored)."""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._buffer.append(values)
+        self._buffered += values.size
+        if self._buffered >= 5 * self.compression:
+            self.flush()
+
+    def merge(self, other: 'TDigest') -> None:
+        """Add the centroids of another digest."""
+        other.flush()
+        if other.weights.size == 0:
+            return
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._absorb(other.means, other.weights)
+
+    def quantile(self, q: Union[float, Sequence[float]]) -> np.ndarray:
+        """Approximate quantile(s) for levels in [0, 1]; NaN if empty."""
+        q = np.asarray(q, dtype=float)
+        self.flush()
+        if self.weights.size == 0:
+            return np.full(q.shape, np.nan)
+        # Centroid means sit at the middle of their cumulative weight
+        cumulative = np.cumsum(self.weights)
+        positions = np.concatenate([[0.0], cumulative - self.weights / 2, [cumulative[-1]]])
+        anchors = np.concatenate([[self.min], self.means, [self.max]])
+        return np.interp(q * cumulative[-1], positions, anchors)
+
+    def _absorb(self, means: np.ndarray, weights: np.ndarray) -> None:
+        means = np.concatenate([self.means, means])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+
+        # Centroids whose left cumulative edge falls in the same unit of the
+        # scale function k(q) = compression / pi * asin(2q - 1) merge
+        total = weights.sum()
+        left = (np.cumsum(weights) - weights) / total
+        scale = self.compression / np.pi * np.arcsin(np.clip(2 * left - 1, -1, 1))
+        groups = np.floor(scale - scale[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+
+        merged_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged_weights
+        self.weights = merged_weights
+
+
+class _PhaseAccumulator:
+    """Per-phase moments (and optional digests) of one (task, feature) pair."""
+
+    def __init__(self, digest_compression: Optional[float] = None):
+        self.count = np.zeros(POINTS_PER_CYCLE, dtype=np.int64)
+        self.mean = np.zeros(POINTS_PER_CYCLE)
+        self.m2 = np.zeros(POINTS_PER_CYCLE)
+        self.digests = None
+        if digest_compression is not None:
+            self.digests = [TDigest(digest_compression) for _ in range(POINTS_PER_CYCLE)]
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a (n_cycles, 150) batch; NaN points are skipped per phase."""
+        finite = np.isfinite(values)
+        count = finite.sum(axis=0)
+        if not count.any():
+            return
+        filled = np.where(finite, values, 0.0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = filled.sum(axis=0) / count
+        deviations = np.where(finite, values - mean, 0.0)
+        m2 = np.einsum('cp,cp->p', deviations, deviations)
+        self._combine(count, np.where(count > 0, mean, 0.0), m2)
+
+        if self.digests is not None:
+            for phase, digest in enumerate(self.digests):
+                digest.update(values[:, phase])
+
+    def merge(self, other: '_PhaseAccumulator') -> None:
+        self._combine(other.count, other.mean, other.m2)
+        # Digests that miss part of the pooled data would misstate quantiles
+        if self.digests is not None and other.digests is not None:
+            for digest, other_digest in zip(self.digests, other.digests):
+                digest.merge(other_digest)
+        else:
+            self.digests = None
+
+    def _combine(self, count: np.ndarray, mean: np.ndarray, m2: np.ndarray) -> None:
+        # Chan et al. pairwise update of (count, mean, M2)
+        total = self.count + count
+        safe_total = np.maximum(total, 1)
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (count / safe_total)
+        self.m2 = self.m2 + m2 + delta * delta * (self.count * count / safe_total)
+        self.count = total
+
+
+class PopulationAggregator:
+    """
+    Mergeable per-phase mean/std (and optional quantile) aggregates.
+
+    Parameters
+    ----------
+    features : list of str, optional
+        Features to aggregate. If None, every feature of the first batch of
+        each source is used.
+    quantile_compression : float, optional
+        If given, keep a t-digest of this compression per phase so that
+        ``quantiles`` can be queried. Off by default (150 digests per
+        (task, feature) pair cost memory and time).
+
+    Examples
+    --------
+    >>> aggregator = PopulationAggregator()
+    >>> for path in paths:
+    ...     aggregator.add_parquet(path)
+    >>> patterns = aggregator.mean_patterns('level_walking')
+    """
+
+    def __init__(self, features: Optional[List[str]] = None,
+                 quantile_compression: Optional[float] = None):
+        self.features = list(features) if features is not None else None
+        self.quantile_compression = quantile_compression
+        self._accumulators: Dict[Tuple[str, str], _PhaseAccumulator] = {}
+
+    # ------------------------------------------------------------------
+    # Input
+    # ------------------------------------------------------------------
+
+    def add_cycles(self, task: str, data_3d: np.ndarray, feature_names: Sequence[str]) -> None:
+        """
+        Add a batch of strides.
+
+        Parameters
+        ----------
+        task : str
+            Task the strides belong to
+        data_3d : ndarray
+            Array of shape (n_cycles, 150, n_features)
+        feature_names : sequence of str
+            Names of the last axis
+        """
+        if data_3d is None or data_3d.shape[0] == 0:
+            return
+        if data_3d.ndim != 3 or data_3d.shape[1] != POINTS_PER_CYCLE:
+            raise ValueError(f"Expected (n_cycles, {POINTS_PER_CYCLE}, n_features) data, got {data_3d.shape}")
+        wanted = set(self.features) if self.features is not None else None
+        for idx, feature in enumerate(feature_names):
+            if wanted is not None and feature not in wanted:
+                continue
+            accumulator = self._accumulators.get((task, feature))
+            if accumulator is None:
+                accumulator = _PhaseAccumulator(self.quantile_compression)
+                self._accumulators[(task, feature)] = accumulator
+            accumulator.update(np.asarray(data_3d[:, :, idx], dtype=float))
+
+    def add_locomotion_data(self, locomotion_data: LocomotionData,
+                            tasks: Optional[List[str]] = None) -> None:
+        """
+        Add every stride of a loaded dataset, one (subject, task) at a time.
+
+        Parameters
+        ----------
+        locomotion_data : LocomotionData
+            Dataset to read
+        tasks : list of str, optional
+            Tasks to include (default: all)
+        """
+        features = self.features
+        if features is not None:
+            features = [feature for feature in features if feature in locomotion_data.features]
+            if not features:
+                return
+        for task in tasks or locomotion_data.get_tasks():
+            for subject in locomotion_data.get_subjects():
+                if (subject, task) not in locomotion_data.row_index:
+                    continue
+                data_3d, feature_names = locomotion_data.get_cycles(subject, task, features)
+                if data_3d is not None:
+                    self.add_cycles(task, data_3d, feature_names)
+
+    def add_parquet(self, path: Union[str, Path], batch_rows: int = DEFAULT_BATCH_ROWS,
+                    task_col: str = 'task', tasks: Optional[List[str]] = None,
+                    subject_col: str = 'subject') -> None:
+        """
+        Stream a phase-indexed parquet file in record batches.
+
+        Each task's rows are cut into 150-point strides in file order (as
+        ``get_cycles`` does); a partial stride at the end of a batch is carried
+        into the next one. A task whose rows do not divide into whole strides
+        keeps its complete strides and drops the remainder with a warning.
+
+        Parameters
+        ----------
+        path : str or Path
+            Phase-indexed parquet file
+        batch_rows : int
+            Maximum rows read per record batch
+        task_col : str
+            Name of the task column
+        tasks : list of str, optional
+            Tasks to include (default: all)
+        subject_col : str
+            Name of the subject column (excluded from the features)
+        """
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        available = LocomotionData.feature_columns(parquet_file.schema_arrow.names, subject_col=subject_col,
+                                                   task_col=task_col)
+        features = available if self.features is None else [f for f in self.features if f in available]
+        if not features:
+            return
+        wanted_tasks = set(tasks) if tasks is not None else None
+        carry: Dict[str, np.ndarray] = {}
+
+        for batch in parquet_file.iter_batches(batch_size=batch_rows, columns=[task_col] + features):
+            task_codes, task_names = pd.factorize(batch.column(0).to_pandas())
+            values = np.column_stack([
+                batch.column(1 + idx).to_numpy(zero_copy_only=False).astype(float, copy=False)
+                for idx in range(len(features))
+            ])
+            order = np.argsort(task_codes, kind='stable')
+            bounds = np.searchsorted(task_codes[order], np.arange(len(task_names) + 1))
+
+            for code, task in enumerate(task_names):
+                if wanted_tasks is not None and task not in wanted_tasks:
+                    continue
+                rows = values[order[bounds[code]:bounds[code + 1]]]
+                if task in carry:
+                    rows = np.concatenate([carry.pop(task), rows])
+                n_cycles = len(rows) // POINTS_PER_CYCLE
+                split = n_cycles * POINTS_PER_CYCLE
+                if split < len(rows):
+                    carry[task] = rows[split:]
+                if n_cycles:
+                    self.add_cycles(task, rows[:split].reshape(n_cycles, POINTS_PER_CYCLE, len(features)),
+                                    features)
+
+        for task, rows in carry.items():
+            warnings.warn(f"{Path(path).name}: task '{task}' ends with {len(rows)} rows "
+                          f"that do not form a {POINTS_PER_CYCLE}-point stride; skipped")
+
+    # ------------------------------------------------------------------
+    # Combination and persistence
+    # ------------------------------------------------------------------
+
+    def merge(self, other: 'PopulationAggregator') -> 'PopulationAggregator':
+        """Fold another aggregate (e.g. from a worker process) into this one."""
+        if (self.quantile_compression is None) != (other.quantile_compression is None):
+            raise ValueError(
+                "Cannot merge aggregates with and without quantile digests "
+                f"(quantile_compression {self.quantile_compression} vs {other.quantile_compression})"
+            )
+        for key, other_accumulator in other._accumulators.items():
+            accumulator = self._accumulators.get(key)
+            if accumulator is None:
+                accumulator = _PhaseAccumulator(self.quantile_compression)
+                self._accumulators[key] = accumulator
+            accumulator.merge(other_accumulator)
+        return self
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """
+        Write the aggregate to an ``.npz`` file.
+
+        Returns
+        -------
+        Path
+            The written file
+        """
+        path = Path(path)
+        keys = sorted(self._accumulators)
+        arrays = {}
+        for idx, key in enumerate(keys):
+            accumulator = self._accumulators[key]
+            arrays[f'count_{idx}'] = accumulator.count
+            arrays[f'mean_{idx}'] = accumulator.mean
+            arrays[f'm2_{idx}'] = accumulator.m2
+            if accumulator.digests is not None:
+                digests = accumulator.digests
+                for digest in digests:
+                    digest.flush()
+                arrays[f'digest_sizes_{idx}'] = np.array([d.means.size for d in digests], dtype=np.int64)
+                arrays[f'digest_means_{idx}'] = np.concatenate([d.means for d in digests])
+                arrays[f'digest_weights_{idx}'] = np.concatenate([d.weights for d in digests])
+                arrays[f'digest_range_{idx}'] = np.array([[d.min, d.max] for d in digests])
+        header = {
+            'version': _FORMAT_VERSION,
+            'features': self.features,
+            'quantile_compression': self.quantile_compression,
+            'keys': [list(key) for key in keys],
+        }
+        with open(path, 'wb') as handle:
+            np.savez_compressed(handle, header=np.array(json.dumps(header)), **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'PopulationAggregator':
+        """Read an aggregate written by ``save``."""
+        with np.load(path, allow_pickle=False) as archive:
+            header = json.loads(str(archive['header']))
+            if header.get('version') != _FORMAT_VERSION:
+                raise ValueError(f"Unsupported population aggregate version: {header.get('version')}")
+            aggregator = cls(header['features'], header['quantile_compression'])
+            for idx, (task, feature) in enumerate(header['keys']):
+                accumulator = _PhaseAccumulator()
+                accumulator.count = archive[f'count_{idx}']
+                accumulator.mean = archive[f'mean_{idx}']
+                accumulator.m2 = archive[f'm2_{idx}']
+                if f'digest_sizes_{idx}' in archive:
+                    offsets = np.concatenate([[0], np.cumsum(archive[f'digest_sizes_{idx}'])])
+                    means, weights = archive[f'digest_means_{idx}'], archive[f'digest_weights_{idx}']
+                    accumulator.digests = []
+                    for phase, (low, high) in enumerate(archive[f'digest_range_{idx}']):
+                        digest = TDigest(header['quantile_compression'])
+                        digest.means = means[offsets[phase]:offsets[phase + 1]]
+                        digest.weights = weights[offsets[phase]:offsets[phase + 1]]
+                        digest.min, digest.max = float(low), float(high)
+                        accumulator.digests.append(digest)
+                aggregator._accumulators[(task, feature)] = accumulator
+        return aggregator
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def get_tasks(self) -> List[str]:
+        """Tasks with aggregated strides."""
+        return sorted({task for task, _ in self._accumulators})
+
+    def get_features(self, task: str) -> List[str]:
+        """Features aggregated for a task."""
+        return sorted(feature for key_task, feature in self._accumulators if key_task == task)
+
+    def count(self, task: str, feature: str) -> np.ndarray:
+        """Number of finite values per phase, shape (150,)."""
+        return self._accumulator(task, feature).count.copy()
+
+    def mean(self, task: str, feature: str) -> np.ndarray:
+        """Mean pattern, shape (150,); NaN where no values were seen."""
+        accumulator = self._accumulator(task, feature)
+        return np.where(accumulator.count > 0, accumulator.mean, np.nan)
+
+    def std(self, task: str, feature: str, ddof: int = 0) -> np.ndarray:
+        """Standard deviation pattern, shape (150,); ``ddof=0`` as ``get_std_patterns``."""
+        accumulator = self._accumulator(task, feature)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            variance = accumulator.m2 / (accumulator.count - ddof)
+        return np.where(accumulator.count > ddof, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+
+    def quantiles(self, task: str, feature: str, q: Union[float, Sequence[float]]) -> np.ndarray:
+        """
+        Approximate per-phase quantiles from the t-digests.
+
+        Returns
+        -------
+        ndarray
+            Shape (150,) for a scalar ``q``, else (len(q), 150)
+        """
+        accumulator = self._accumulator(task, feature)
+        if accumulator.digests is None:
+            raise ValueError("Quantiles need PopulationAggregator(quantile_compression=...)")
+        return np.stack([digest.quantile(q) for digest in accumulator.digests], axis=-1)
+
+    def mean_patterns(self, task: str) -> Dict[str, Dict[str, pd.Series]]:
+        """
+        Mean and std patterns of every feature, in the layout of ``get_mean_patterns``.
+
+        Returns
+        -------
+        dict
+            Feature name -> {'mean': Series, 'std': Series} over 150 phase points
+        """
+        phase_index = np.linspace(0, 100, POINTS_PER_CYCLE, endpoint=False)
+        return {
+            feature: {
+                'mean': pd.Series(self.mean(task, feature), index=phase_index),
+                'std': pd.Series(self.std(task, feature), index=phase_index),
+            }
+            for feature in self.get_features(task)
+        }
+
+    def _accumulator(self, task: str, feature: str) -> _PhaseAccumulator:
+        try:
+            return self._accumulators[(task, feature)]
+        except KeyError:
+            raise KeyError(f"No aggregate for task '{task}', feature '{feature}'") from None
+
+
+def _aggregate_file(path: str, features: Optional[List[str]], quantile_compression: Optional[float],
+                    batch_rows: int, task_col: str, tasks: Optional[List[str]],
+                    subject_col: str) -> PopulationAggregator:
+    """Worker: aggregate one parquet file."""
+    aggregator = PopulationAggregator(features, quantile_compression)
+    aggregator.add_parquet(path, batch_rows=batch_rows, task_col=task_col, tasks=tasks, subject_col=subject_col)
+    return aggregator
+
+
+def aggregate_parquet_files(paths: Iterable[Union[str, Path]],
+                            features: Optional[List[str]] = None,
+                            quantile_compression: Optional[float] = None,
+                            workers: int = 1,
+                            batch_rows: int = DEFAULT_BATCH_ROWS,
+                            task_col: str = 'task',
+                            tasks: Optional[List[str]] = None,
+                            subject_col: str = 'subject') -> PopulationAggregator:
+    """
+    Aggregate several parquet files, optionally one worker process per file.
+
+    Parameters
+    ----------
+    paths : iterable of str or Path
+        Phase-indexed parquet files
+    features, quantile_compression
+        See ``PopulationAggregator``
+    workers : int
+        Number of worker processes; 1 streams the files in this process
+    batch_rows, task_col, tasks, subject_col
+        See ``PopulationAggregator.add_parquet``
+
+    Returns
+    -------
+    PopulationAggregator
+        Merged aggregate of all files
+    """
+    paths = [str(path) for path in paths]
+    result = PopulationAggregator(features, quantile_compression)
+    args = (features, quantile_compression, batch_rows, task_col, tasks, subject_col)
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            result.add_parquet(path, batch_rows=batch_rows, task_col=task_col, tasks=tasks,
+                               subject_col=subject_col)
+        return result
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        # Merge in file order so results do not depend on completion order
+        for partial in executor.map(_aggregate_file, paths, *[[arg] * len(paths) for arg in args]):
+            result.merge(partial)
+    return result
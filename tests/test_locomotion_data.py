@@ -0,0 +1,672 @@
+#!/usr/bin/env python3
+"""
+Test LocomotionData loading and extraction internals
+
+Purpose: Cover library behaviour that the tutorial tests do not exercise
+(lazy loading, indexing, caching and the statistics helpers).
+"""
+
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+
+# Add parent directory for imports
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from locohub import CycleCache, LocomotionData
+
+POINTS = 150
+FEATURES = [
+    'hip_flexion_angle_ipsi_rad',
+    'knee_flexion_angle_ipsi_rad',
+    'ankle_dorsiflexion_angle_ipsi_rad',
+    'knee_flexion_moment_ipsi_Nm_kg',
+]
+
+
+def make_dataset(n_cycles=3, subjects=('SUB01', 'SUB02'),
+                 tasks=('level_walking', 'incline_walking'), seed=0):
+    """Build a small phase-indexed dataset with one row block per stride."""
+    rng = np.random.default_rng(seed)
+    phase = np.linspace(0, 100, POINTS, endpoint=False)
+    blocks = []
+    for subject in subjects:
+        for task in tasks:
+            incline = 5 if task == 'incline_walking' else 0
+            for step in range(n_cycles):
+                block = {
+                    'subject': subject,
+                    'task': task,
+                    'task_id': f'{task}_{incline}deg',
+                    'task_info': f'incline_deg:{incline},speed_m_s:1.{step},treadmill:true',
+                    'step': step,
+                    'phase_ipsi': phase,
+                }
+                for i, feature in enumerate(FEATURES):
+                    amplitude = 0.3 + 0.1 * i + rng.normal(scale=0.02)
+                    block[feature] = amplitude * np.sin(2 * np.pi * phase / 100 + i)
+                blocks.append(pd.DataFrame(block))
+    return pd.concat(blocks, ignore_index=True)
+
+
+@pytest.fixture
+def dataset_path(tmp_path):
+    path = tmp_path / 'synthetic_phase.parquet'
+    make_dataset().to_parquet(path, index=False)
+    return path
+
+
+def test_lazy_loads_only_index_columns(dataset_path):
+    data = LocomotionData(dataset_path, lazy=True)
+
+    assert set(data.df.columns) == {'subject', 'task', 'phase_ipsi'}
+    assert data.features == FEATURES
+    assert data.get_subjects() == ['SUB01', 'SUB02']
+
+
+def test_lazy_get_cycles_matches_eager(dataset_path):
+    eager = LocomotionData(dataset_path)
+    lazy = LocomotionData(dataset_path, lazy=True)
+
+    expected, expected_features = eager.get_cycles('SUB02', 'incline_walking',
+                                                   ['knee_flexion_angle_ipsi_rad'])
+    actual, actual_features = lazy.get_cycles('SUB02', 'incline_walking',
+                                              ['knee_flexion_angle_ipsi_rad'])
+
+    assert actual_features == expected_features
+    np.testing.assert_array_equal(actual, expected)
+    # Only the requested feature became resident
+    assert 'knee_flexion_angle_ipsi_rad' in lazy.df.columns
+    assert 'hip_flexion_angle_ipsi_rad' not in lazy.df.columns
+
+
+def test_lazy_filtered_instance_loads_aligned_columns(dataset_path):
+    eager = LocomotionData(dataset_path)
+    lazy = LocomotionData(dataset_path, lazy=True).filter(subject='SUB02')
+
+    expected, _ = eager.get_cycles('SUB02', 'level_walking')
+    actual, _ = lazy.get_cycles('SUB02', 'level_walking')
+
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_load_columns_ignores_unknown_and_resident(dataset_path):
+    data = LocomotionData(dataset_path, lazy=True)
+
+    assert data.load_columns(['step', 'not_a_column', 'subject']) == ['step']
+    assert data.load_columns(['step']) == []
+
+
+def test_lazy_requires_parquet(tmp_path):
+    path = tmp_path / 'synthetic_phase.csv'
+    make_dataset().to_csv(path, index=False)
+
+    with pytest.raises(ValueError):
+        LocomotionData(path, lazy=True)
+
+
+def test_row_index_uses_slices_for_contiguous_groups(dataset_path):
+    data = LocomotionData(dataset_path)
+
+    rows = data.get_row_selection('SUB01', 'incline_walking')
+    assert isinstance(rows, slice)
+    assert rows.stop - rows.start == 3 * POINTS
+    assert data.get_row_selection('SUB09', 'incline_walking') is None
+
+
+def test_row_index_handles_interleaved_rows(tmp_path):
+    df = make_dataset()
+    # Interleave strides of different subjects so groups are not contiguous
+    strides = [df.iloc[i:i + POINTS] for i in range(0, len(df), POINTS)]
+    order = np.random.default_rng(1).permutation(len(strides))
+    shuffled = pd.concat([strides[i] for i in order], ignore_index=True)
+    path = tmp_path / 'shuffled_phase.parquet'
+    shuffled.to_parquet(path, index=False)
+
+    data = LocomotionData(path)
+    actual, features = data.get_cycles('SUB02', 'level_walking')
+
+    mask = (shuffled['subject'] == 'SUB02') & (shuffled['task'] == 'level_walking')
+    expected = shuffled.loc[mask, features].to_numpy().reshape(-1, POINTS, len(features))
+    np.testing.assert_array_equal(actual, expected)
+
+    filtered = data.filter(subjects=['SUB02'], task='level_walking')
+    assert len(filtered) == mask.sum()
+    assert filtered.df.index.is_monotonic_increasing
+
+
+def test_efficient_reshape_3d_accepts_row_index(dataset_path):
+    from locohub import efficient_reshape_3d
+
+    data = LocomotionData(dataset_path)
+    expected, _ = efficient_reshape_3d(data.df, 'SUB02', 'level_walking', FEATURES)
+    actual, _ = efficient_reshape_3d(data.df, 'SUB02', 'level_walking', FEATURES,
+                                     row_index=data.row_index)
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_get_task_metadata_uses_index(dataset_path):
+    data = LocomotionData(dataset_path, lazy=True)
+
+    assert data.get_task_metadata('SUB01', 'incline_walking', 'incline_deg') == 5
+    assert data.get_task_metadata('SUB09', 'incline_walking', 'incline_deg') is None
+
+
+def test_cycle_store_matches_get_cycles(dataset_path):
+    eager = LocomotionData(dataset_path)
+    stored = LocomotionData(dataset_path, cycle_store=True)
+
+    for subject in (None, 'SUB01', 'SUB02'):
+        for features in (None, FEATURES[1:3], [FEATURES[3], FEATURES[0]]):
+            expected, expected_features = eager.get_cycles(subject, 'level_walking', features)
+            actual, actual_features = stored.get_cycles(subject, 'level_walking', features)
+            assert actual_features == expected_features
+            np.testing.assert_array_equal(actual, expected)
+
+
+def test_cycle_store_returns_views(dataset_path):
+    data = LocomotionData(dataset_path, cycle_store=True, cycle_dtype='float32')
+
+    full, _ = data.get_cycles(None, 'incline_walking')
+    subject_view, _ = data.get_cycles('SUB02', 'incline_walking', FEATURES[1:3])
+
+    assert full.dtype == np.float32
+    assert full.flags['C_CONTIGUOUS']
+    assert np.shares_memory(full, subject_view)
+    assert not subject_view.flags.writeable
+
+
+def test_cache_evicts_least_recently_used(dataset_path):
+    data = LocomotionData(dataset_path, cache_max_entries=2)
+
+    data.get_cycles('SUB01', 'level_walking')
+    data.get_cycles('SUB02', 'level_walking')
+    data.get_cycles('SUB01', 'level_walking')  # hit, SUB01 becomes most recent
+    data.get_cycles('SUB01', 'incline_walking')  # evicts SUB02
+
+    info = data.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.entries) == (1, 3, 1, 2)
+
+    data.clear_cache()
+    assert data.cache_info().entries == 0
+
+
+def test_cache_respects_byte_budget(dataset_path):
+    one_entry = 3 * POINTS * len(FEATURES) * 8
+    data = LocomotionData(dataset_path, cache_max_bytes=one_entry)
+
+    data.get_cycles('SUB01', 'level_walking')
+    data.get_cycles('SUB02', 'level_walking')
+
+    info = data.cache_info()
+    assert info.entries == 1
+    assert info.nbytes <= one_entry
+
+
+def test_filter_shares_cache_with_scoped_task_results(dataset_path):
+    data = LocomotionData(dataset_path)
+    full, _ = data.get_cycles(None, 'level_walking')
+
+    child = data.filter(subject='SUB01')
+    subject_cycles, _ = child.get_cycles('SUB01', 'level_walking')
+    task_cycles, _ = child.get_cycles(None, 'level_walking')
+
+    assert child._cache is data._cache
+    assert task_cycles.shape[0] == 3
+    assert full.shape[0] == 6
+    np.testing.assert_array_equal(subject_cycles, task_cycles)
+
+
+def test_shared_cache_keeps_datasets_apart(dataset_path, tmp_path):
+    other_path = tmp_path / 'shifted_phase.parquet'
+    shifted = make_dataset()
+    shifted[FEATURES] += 10
+    shifted.to_parquet(other_path, index=False)
+
+    cache = CycleCache()
+    first = LocomotionData(dataset_path, cache=cache)
+    second = LocomotionData(other_path, cache=cache)
+    cycles, _ = first.get_cycles('SUB01', 'level_walking', FEATURES[:1])
+    other, _ = second.get_cycles('SUB01', 'level_walking', FEATURES[:1])
+
+    np.testing.assert_allclose(other, cycles + 10)
+    assert cache.info().entries == 2
+
+
+def test_filter_defers_dataframe_until_accessed(dataset_path):
+    data = LocomotionData(dataset_path)
+
+    child = data.filter(task='incline_walking').filter(subject='SUB02')
+
+    assert child._df is None
+    assert len(child) == 3 * POINTS
+    assert child.get_subjects() == ['SUB02']
+    assert child.get_tasks() == ['incline_walking']
+
+    cycles, _ = child.get_cycles('SUB02', 'incline_walking')
+    assert child._df is None
+    expected, _ = data.get_cycles('SUB02', 'incline_walking')
+    np.testing.assert_array_equal(cycles, expected)
+
+    frame = child.df
+    assert set(frame['subject']) == {'SUB02'}
+    assert set(frame['task']) == {'incline_walking'}
+    assert len(frame) == 3 * POINTS
+
+
+def test_filtered_view_raises_after_source_df_is_replaced(dataset_path):
+    data = LocomotionData(dataset_path)
+    child = data.filter(subjects=['SUB02'])
+    grandchild = child.filter(task='level_walking')
+    child.get_cycles('SUB02', 'level_walking')
+
+    data.df = data.df.iloc[::-1].reset_index(drop=True)
+
+    for view in (child, grandchild):
+        with pytest.raises(RuntimeError, match='filter the updated data again'):
+            view.get_cycles('SUB02', 'level_walking')
+    fresh = data.filter(subjects=['SUB02'])
+    assert fresh.get_cycles('SUB02', 'level_walking')[0].shape[0] == 3
+
+
+def test_lazy_filter_shares_loaded_columns(dataset_path):
+    data = LocomotionData(dataset_path, lazy=True)
+    child = data.filter(subject='SUB01')
+    _ = child.df
+
+    child.get_cycles('SUB01', 'level_walking', ['knee_flexion_angle_ipsi_rad'])
+
+    assert 'knee_flexion_angle_ipsi_rad' in data.df.columns
+    assert 'knee_flexion_angle_ipsi_rad' in child.df.columns
+    assert child.df.index.equals(data.df.index[data.df['subject'] == 'SUB01'])
+
+
+def test_get_cycles_batch_matches_per_subject_loop(dataset_path):
+    data = LocomotionData(dataset_path)
+
+    data_3d, features, info = data.get_cycles_batch(tasks=['level_walking'],
+                                                    features=FEATURES[:2])
+
+    expected = np.vstack([data.get_cycles(subject, 'level_walking', FEATURES[:2])[0]
+                          for subject in data.get_subjects()])
+    np.testing.assert_array_equal(data_3d, expected)
+    assert features == FEATURES[:2]
+    assert list(info.columns) == ['subject', 'task', 'cycle', 'step', 'task_id']
+    assert info['subject'].tolist() == ['SUB01'] * 3 + ['SUB02'] * 3
+    assert info['cycle'].tolist() == [0, 1, 2] * 2
+    assert info['step'].tolist() == [0, 1, 2] * 2
+
+
+def test_get_cycles_batch_without_matches(dataset_path):
+    data = LocomotionData(dataset_path)
+
+    with pytest.warns(UserWarning):
+        data_3d, features, info = data.get_cycles_batch(subjects=['SUB09'])
+    assert data_3d is None and features == [] and info.empty
+
+
+@pytest.mark.parametrize('mode', ['fast', 'full', 'off'])
+def test_validate_modes_load_same_data(dataset_path, mode):
+    data = LocomotionData(dataset_path, validate=mode)
+
+    assert data.validate_mode == mode
+    assert data.subjects == ['SUB01', 'SUB02']
+    assert data.tasks == ['incline_walking', 'level_walking']
+    assert data.filter(subject='SUB01').validate_mode == mode
+
+
+def test_validate_fast_flags_out_of_range_phase(tmp_path):
+    df = make_dataset()
+    df.loc[0, 'phase_ipsi'] = 120.0
+    path = tmp_path / 'bad_phase.parquet'
+    df.to_parquet(path, index=False)
+
+    with pytest.warns(UserWarning, match='outside expected range'):
+        LocomotionData(path, validate='fast')
+
+
+@pytest.mark.parametrize('mode', ['fast', 'full'])
+def test_validate_detects_time_indexed_beyond_first_group(tmp_path, mode):
+    df = make_dataset()
+    df['time_s'] = np.arange(len(df)) / 100
+    # Only the first subject-task group keeps 150 distinct phase values
+    coarse = (df['subject'] != 'SUB01') | (df['task'] != 'incline_walking')
+    df.loc[coarse, 'phase_ipsi'] = (df.loc[coarse, 'phase_ipsi'] // 10) * 10
+    path = tmp_path / 'time_indexed.parquet'
+    df.to_parquet(path, index=False)
+
+    with pytest.warns(UserWarning, match='time-indexed'):
+        LocomotionData(path, validate=mode)
+
+
+def test_validate_rejects_unknown_mode(dataset_path):
+    with pytest.raises(ValueError):
+        LocomotionData(dataset_path, validate='strict')
+
+
+def test_label_columns_load_as_categoricals(dataset_path):
+    data = LocomotionData(dataset_path)
+
+    for col in ('subject', 'task', 'task_id', 'task_info'):
+        assert isinstance(data.df[col].dtype, pd.CategoricalDtype)
+    assert data.get_subjects() == ['SUB01', 'SUB02']
+    assert data.get_task_metadata('SUB01', 'incline_walking', 'incline_deg') == 5
+
+    plain = LocomotionData(dataset_path, categorical=False)
+    assert not isinstance(plain.df['subject'].dtype, pd.CategoricalDtype)
+    np.testing.assert_array_equal(plain.get_cycles('SUB02', 'level_walking')[0],
+                                  data.get_cycles('SUB02', 'level_walking')[0])
+
+
+def test_unsorted_dictionary_categories_keep_string_order(tmp_path):
+    df = make_dataset()
+    df['subject'] = pd.Categorical(df['subject'], categories=['SUB02', 'SUB01'])
+    path = tmp_path / 'unsorted_categories.parquet'
+    df.to_parquet(path, index=False)
+
+    data = LocomotionData(path, lazy=True)
+    data.load_columns(['task_info'])
+
+    assert list(data.df['subject'].cat.categories) == ['SUB01', 'SUB02']
+    assert isinstance(data.df['task_info'].dtype, pd.CategoricalDtype)
+    _, _, info = data.get_cycles_batch(tasks=['level_walking'])
+    assert info['subject'].tolist() == ['SUB01'] * 3 + ['SUB02'] * 3
+
+
+def test_cycle_table_parses_task_info_per_cycle(dataset_path):
+    data = LocomotionData(dataset_path, lazy=True)
+
+    table = data.get_cycle_table()
+
+    assert len(table) == 12
+    assert table['incline_deg'].tolist() == [5] * 3 + [0] * 3 + [5] * 3 + [0] * 3
+    assert table['speed_m_s'].tolist() == [1.0, 1.1, 1.2] * 4
+    assert table['treadmill'].all()
+    assert len(data._parsed_task_info) == 6
+
+
+def test_select_cycles_matches_where_expression(dataset_path):
+    data = LocomotionData(dataset_path)
+
+    data_3d, features, info = data.select_cycles(
+        task='incline_walking', where='incline_deg >= 5 and speed_m_s < 1.2',
+        features=FEATURES[:2])
+
+    assert data_3d.shape == (4, POINTS, 2)
+    assert info['subject'].tolist() == ['SUB01', 'SUB01', 'SUB02', 'SUB02']
+    assert info['cycle'].tolist() == [0, 1, 0, 1]
+    expected, _ = data.get_cycles('SUB02', 'incline_walking', FEATURES[:2])
+    np.testing.assert_array_equal(data_3d[2:], expected[:2])
+
+    with pytest.raises(ValueError):
+        data.select_cycles(task='incline_walking', where='exo_state == "on"')
+
+
+def test_arrow_cache_is_built_reused_and_invalidated(dataset_path):
+    cache_path = dataset_path.with_name(dataset_path.name + '.arrow')
+
+    first = LocomotionData(dataset_path, arrow_cache=True)
+    assert cache_path.exists()
+    built = cache_path.stat().st_mtime_ns
+
+    cached = LocomotionData(dataset_path, arrow_cache=True)
+    assert cache_path.stat().st_mtime_ns == built
+    np.testing.assert_array_equal(cached.get_cycles('SUB02', 'level_walking')[0],
+                                  first.get_cycles('SUB02', 'level_walking')[0])
+    assert isinstance(cached.df['subject'].dtype, pd.CategoricalDtype)
+
+    # Rewriting the parquet file makes the sidecar stale
+    make_dataset(subjects=('SUB03',)).to_parquet(dataset_path, index=False)
+    rebuilt = LocomotionData(dataset_path, arrow_cache=True, lazy=True)
+    assert rebuilt.get_subjects() == ['SUB03']
+    assert rebuilt.get_cycles('SUB03', 'level_walking')[0].shape == (3, POINTS, len(FEATURES))
+
+
+def test_arrow_cache_enabled_from_environment(dataset_path, tmp_path, monkeypatch):
+    monkeypatch.setenv('LOCOHUB_ARROW_CACHE', '1')
+    LocomotionData(dataset_path)
+    assert dataset_path.with_name(dataset_path.name + '.arrow').exists()
+
+    custom = tmp_path / 'custom_cache.arrow'
+    LocomotionData(dataset_path, arrow_cache=custom)
+    assert custom.exists()
+
+
+def test_phase_correlations_match_per_phase_corrcoef(tmp_path):
+    df = make_dataset(n_cycles=12)
+    rng = np.random.default_rng(1)
+    for feature in FEATURES:
+        df[feature] += rng.normal(scale=0.1, size=len(df))
+    path = tmp_path / 'noisy_phase.parquet'
+    df.to_parquet(path, index=False)
+    data = LocomotionData(path)
+    data_3d, _ = data.get_cycles('SUB01', 'level_walking')
+    expected = np.stack([np.corrcoef(data_3d[:, phase, :].T) for phase in range(POINTS)])
+
+    correlations = data.get_phase_correlations('SUB01', 'level_walking')
+    np.testing.assert_allclose(correlations, expected, atol=1e-12)
+    single = data.get_phase_correlations('SUB01', 'level_walking', dtype=np.float32)
+    assert single.dtype == np.float32
+    np.testing.assert_allclose(single, expected, atol=1e-5)
+
+    pairs = [(FEATURES[0], FEATURES[2]), (FEATURES[3], FEATURES[1])]
+    selected = data.get_phase_correlations('SUB01', 'level_walking', pairs=pairs)
+    assert selected.shape == (POINTS, 2)
+    np.testing.assert_allclose(selected[:, 1], expected[:, 3, 1], atol=1e-12)
+    with pytest.raises(ValueError):
+        data.get_phase_correlations('SUB01', 'level_walking', features=FEATURES[:2], pairs=pairs)
+
+
+def test_phase_correlations_ignore_nan_uses_complete_pairs(tmp_path):
+    df = make_dataset(n_cycles=12)
+    rng = np.random.default_rng(2)
+    for feature in FEATURES:
+        df[feature] += rng.normal(scale=0.1, size=len(df))
+    cycle_rows = (df['subject'] == 'SUB01') & (df['task'] == 'level_walking')
+    rows = df.index[cycle_rows]
+    df.loc[rows[3 * POINTS + 10], FEATURES[1]] = np.nan
+    df.loc[rows[5 * POINTS:6 * POINTS], FEATURES[2]] = np.nan
+    path = tmp_path / 'nan_phase.parquet'
+    df.to_parquet(path, index=False)
+    data = LocomotionData(path)
+    data_3d, _ = data.get_cycles('SUB01', 'level_walking')
+
+    correlations = data.get_phase_correlations('SUB01', 'level_walking', ignore_nan=True)
+    for phase in (0, 10, 75):
+        values = data_3d[:, phase, :]
+        for i in range(len(FEATURES)):
+            for j in range(len(FEATURES)):
+                ok = np.isfinite(values[:, i]) & np.isfinite(values[:, j])
+                expected = np.corrcoef(values[ok, i], values[ok, j])[0, 1]
+                assert correlations[phase, i, j] == pytest.approx(expected, abs=1e-12)
+    assert np.isnan(data.get_phase_correlations('SUB01', 'level_walking')[10, 1, 0])
+
+
+def test_cycle_stats_match_direct_reductions_and_are_cached(dataset_path):
+    data = LocomotionData(dataset_path)
+    data_3d, _ = data.get_cycles(None, 'level_walking')
+    data_2d = data_3d.reshape(-1, len(FEATURES))
+
+    stats = data.get_cycle_stats(None, 'level_walking', quantiles=(0.1,))
+    # Extremes, RMSE and quantiles are only computed when read
+    assert not {'quantiles', 'cycle_min', 'rmse_per_cycle'} & set(vars(stats))
+    np.testing.assert_array_equal(stats.mean, np.mean(data_3d, axis=0))
+    np.testing.assert_array_equal(stats.std, np.std(data_3d, axis=0))
+    np.testing.assert_array_equal(stats.rom, data_3d.max(axis=1) - data_3d.min(axis=1))
+    np.testing.assert_allclose(stats.overall_std, np.std(data_2d, axis=0), rtol=1e-12)
+    np.testing.assert_allclose(stats.quantile(0.1), np.percentile(data_2d, 10, axis=0))
+    assert data.get_cycle_stats(None, 'level_walking', quantiles=(0.1,)) is stats
+
+    summary = data.get_summary_statistics(None, 'level_walking')
+    np.testing.assert_allclose(summary['mean'], np.mean(data_2d, axis=0), rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(summary['median'], np.median(data_2d, axis=0), atol=1e-15)
+    np.testing.assert_allclose(summary['q75'], np.percentile(data_2d, 75, axis=0))
+    np.testing.assert_array_equal(summary['min'], data_2d.min(axis=0))
+
+    rom = data.calculate_rom(None, 'level_walking', by_cycle=False)
+    assert rom[FEATURES[0]] == data_3d[:, :, 0].max() - data_3d[:, :, 0].min()
+    rmse = np.sqrt(np.mean((data_3d - data_3d.mean(axis=0)) ** 2, axis=(1, 2)))
+    expected_outliers = np.where(rmse > rmse.mean() + 1.0 * rmse.std())[0]
+    np.testing.assert_array_equal(data.find_outlier_cycles(None, 'level_walking', threshold=1.0),
+                                  expected_outliers)
+
+    data.clear_cache()
+    assert data.get_cycle_stats(None, 'level_walking', quantiles=(0.1,)) is not stats
+
+
+
+def test_find_outliers_all_matches_per_group_detection(tmp_path):
+    path = tmp_path / 'outliers_phase.parquet'
+    make_dataset(n_cycles=12, subjects=('SUB01', 'SUB02', 'SUB03')).to_parquet(path, index=False)
+    data = LocomotionData(path)
+
+    flagged = data.find_outliers_all(threshold=1.0)
+    assert list(flagged.columns[-2:]) == ['score', 'cutoff'] and len(flagged)
+    for (subject, task), group in flagged.groupby(['subject', 'task']):
+        np.testing.assert_array_equal(group['cycle'], data.find_outlier_cycles(subject, task, threshold=1.0))
+
+    # Pooled subjects score against the task mean pattern
+    pooled = data.find_outliers_all(group_by=['task'], threshold=1.0, return_all=True)
+    task_rows = (pooled['task'] == 'level_walking').to_numpy()
+    data_3d, _ = data.get_cycles(None, 'level_walking')
+    rmse = np.sqrt(np.mean((data_3d - data_3d.mean(axis=0)) ** 2, axis=(1, 2)))
+    np.testing.assert_allclose(pooled['score'][task_rows], rmse, rtol=1e-12)
+    np.testing.assert_array_equal(np.flatnonzero(pooled['outlier'][task_rows]),
+                                  data.find_outlier_cycles(None, 'level_walking', threshold=1.0))
+
+    # Modified band depth against the pairwise band definition (ties included)
+    depth = data.find_outliers_all(method='functional_depth', return_all=True,
+                                   subjects=['SUB01'], tasks=['level_walking'])
+    cycles, _ = data.get_cycles('SUB01', 'level_walking')
+    expected = np.zeros(len(cycles))
+    for i in range(len(cycles)):
+        for j in range(i + 1, len(cycles)):
+            lo, hi = np.minimum(cycles[i], cycles[j]), np.maximum(cycles[i], cycles[j])
+            expected += ((cycles >= lo) & (cycles <= hi)).mean(axis=(1, 2))
+    expected /= len(cycles) * (len(cycles) - 1) / 2
+    np.testing.assert_allclose(depth['score'], expected, rtol=1e-12)
+    assert (depth['outlier'] == (depth['score'] < depth['cutoff'])).all()
+
+    serial = data.find_outliers_all(method='mahalanobis', return_all=True)
+    parallel = data.find_outliers_all(method='mahalanobis', return_all=True, workers=2)
+    np.testing.assert_allclose(parallel['score'], serial['score'], rtol=1e-12)
+    assert (parallel['outlier'] == serial['outlier']).all()
+    with pytest.raises(ValueError, match='Unknown outlier method'):
+        data.find_outliers_all(method='zscore')
+
+
+def test_validate_cycles_reports_reasons_per_feature(tmp_path):
+    from locohub.cycle_limits import ABOVE_MAX, BELOW_MIN, JUMP, NONFINITE
+
+    df = make_dataset(n_cycles=6, subjects=('SUB01',), tasks=('level_walking',))
+    df['hip_flexion_moment_ipsi_Nm'] = 50.0
+    rows = np.arange(len(df))
+    df.loc[rows == 1 * POINTS + 40, FEATURES[0]] = 4.0           # above pi, plus two jumps
+    df.loc[rows == 2 * POINTS + 10, FEATURES[3]] = -7.0          # below -5 Nm/kg
+    df.loc[rows == 3 * POINTS + 90, 'hip_flexion_moment_ipsi_Nm'] = 450.0
+    df.loc[rows == 4 * POINTS + 5, FEATURES[1]] = np.nan
+    path = tmp_path / 'limits_phase.parquet'
+    df.to_parquet(path, index=False)
+    data = LocomotionData(path)
+
+    result = data.validate_cycles('SUB01', 'level_walking', return_reasons=True)
+    features = result.feature_names
+    assert result.reasons.shape == (6, 5)
+    expected = np.zeros((6, 5), dtype=np.uint8)
+    expected[1, features.index(FEATURES[0])] = ABOVE_MAX | JUMP
+    expected[2, features.index(FEATURES[3])] = BELOW_MIN
+    expected[3, features.index('hip_flexion_moment_ipsi_Nm')] = ABOVE_MAX
+    expected[4, features.index(FEATURES[1])] = NONFINITE
+    np.testing.assert_array_equal(result.reasons, expected)
+    np.testing.assert_array_equal(result.valid, [True, False, False, False, False, True])
+    np.testing.assert_array_equal(data.validate_cycles('SUB01', 'level_walking'), result.valid)
+    assert result.summary().loc[FEATURES[0], 'jump'] == 1
+
+    # Overrides replace the default limits of a feature
+    relaxed = data.validate_cycles('SUB01', 'level_walking', limits={FEATURES[3]: (-10.0, 10.0, None)})
+    np.testing.assert_array_equal(relaxed, [True, False, True, False, False, True])
+
+def _pooled_reference(paths, task):
+    cycles = []
+    for path in paths:
+        data = LocomotionData(path)
+        data_3d, features = data.get_cycles(None, task, FEATURES)
+        cycles.append(data_3d)
+    return np.concatenate(cycles), features
+
+
+def test_population_aggregator_matches_in_memory_moments(tmp_path):
+    from locohub import PopulationAggregator, aggregate_parquet_files
+
+    paths = []
+    for seed in range(2):
+        df = make_dataset(n_cycles=5, seed=seed)
+        df.loc[7, FEATURES[0]] = np.nan
+        # Interleave tasks so strides span record batches
+        df = df.iloc[np.argsort(np.repeat(np.arange(len(df) // POINTS) % 3, POINTS), kind='stable')]
+        path = tmp_path / f'population_{seed}_phase.parquet'
+        df.to_parquet(path, index=False)
+        paths.append(path)
+    data_3d, _ = _pooled_reference(paths, 'level_walking')
+
+    streamed = PopulationAggregator(features=FEATURES)
+    for path in paths:
+        streamed.add_parquet(path, batch_rows=333)
+    loaded = PopulationAggregator(features=FEATURES)
+    for path in paths:
+        loaded.add_locomotion_data(LocomotionData(path))
+
+    for aggregate in (streamed, loaded):
+        for idx, feature in enumerate(FEATURES):
+            np.testing.assert_allclose(aggregate.mean('level_walking', feature),
+                                       np.nanmean(data_3d[:, :, idx], axis=0), rtol=1e-12, atol=1e-15)
+            np.testing.assert_allclose(aggregate.std('level_walking', feature),
+                                       np.nanstd(data_3d[:, :, idx], axis=0), rtol=1e-10, atol=1e-15)
+    assert streamed.count("level_walking", FEATURES[0])[7] == len(data_3d) - 2
+
+    parallel = aggregate_parquet_files(paths, features=FEATURES, workers=2)
+    restored = PopulationAggregator.load(parallel.save(tmp_path / 'population.npz'))
+    assert restored.get_tasks() == ['incline_walking', 'level_walking']
+    np.testing.assert_allclose(restored.std('incline_walking', FEATURES[2]),
+                               streamed.std('incline_walking', FEATURES[2]), rtol=1e-12, atol=1e-15)
+
+
+def test_population_excludes_custom_subject_column(tmp_path):
+    from locohub import aggregate_parquet_files
+
+    path = tmp_path / 'cohort_phase.parquet'
+    make_dataset().rename(columns={'subject': 'velocity_cohort'}).to_parquet(path, index=False)
+
+    aggregate = aggregate_parquet_files([path], subject_col='velocity_cohort')
+    assert {feature for _, feature in aggregate._accumulators} == set(FEATURES)
+
+
+def test_population_quantiles_merge_and_round_trip(tmp_path):
+    from locohub import PopulationAggregator
+
+    rng = np.random.default_rng(3)
+    cycles = rng.normal(size=(4000, POINTS, 1))
+    halves = [PopulationAggregator(quantile_compression=100) for _ in range(2)]
+    for half, chunk in zip(halves, np.array_split(cycles, 2)):
+        for batch in np.array_split(chunk, 7):
+            half.add_cycles('level_walking', batch, ['knee_flexion_angle_ipsi_rad'])
+    merged = halves[0].merge(halves[1])
+
+    expected = np.percentile(cycles[:, :, 0], [5, 50, 95], axis=0)
+    bands = merged.quantiles('level_walking', 'knee_flexion_angle_ipsi_rad', [0.05, 0.5, 0.95])
+    assert bands.shape == (3, POINTS)
+    assert np.abs(bands - expected).max() < 0.03
+
+    restored = PopulationAggregator.load(merged.save(tmp_path / 'digests.npz'))
+    np.testing.assert_array_equal(
+        restored.quantiles('level_walking', 'knee_flexion_angle_ipsi_rad', 0.5), bands[1])
+
+    plain = PopulationAggregator()
+    plain.add_cycles('level_walking', cycles[:10], ['knee_flexion_angle_ipsi_rad'])
+    with pytest.raises(ValueError, match='quantile digests'):
+        merged.merge(plain)
+    with pytest.raises(ValueError, match='quantile digests'):
+        plain.merge(merged)